@@ -0,0 +1,11 @@
+"""Benchmarks of the vendored :mod:`phrydy.mediafile` module.
+
+Run the standalone suite and write the results as JSON::
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json
+
+Or run the same operations with ``pytest-benchmark``::
+
+    pytest benchmarks/bench_mediafile.py
+"""
@@ -0,0 +1,22 @@
+"""The operations of :mod:`benchmarks.suite` as ``pytest-benchmark``
+tests. Save and compare runs with ``--benchmark-autosave`` and
+``--benchmark-compare``."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from benchmarks.suite import FIXTURES, OPERATIONS, VARIANTS, prepare
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("operation", list(OPERATIONS))
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("name", FIXTURES)
+def test_operation(
+    benchmark: Any, tmp_path: Path, name: str, variant: str, operation: str
+) -> None:
+    path = prepare(name, variant, str(tmp_path))
+    benchmark(OPERATIONS[operation](path))
@@ -0,0 +1,97 @@
+"""Measure the import time of phrydy modules in fresh interpreters and
+check it against a budget.
+
+The time is the cumulative time ``python -X importtime`` reports for the
+module, so the start of the interpreter itself is not included. The
+median of several runs is compared with the budget; the exit status is
+``1`` if a module is over budget.
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime --budget 10 phrydy phrydy.scanner
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+from benchmarks.suite import environment
+
+MODULES = ("phrydy",)
+
+BUDGET = 10.0
+"""The default budget in milliseconds."""
+
+
+def import_time(module: str) -> float:
+    """Import a module in a new interpreter and return the cumulative
+    import time in milliseconds."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(process.stderr.splitlines()):
+        # import time: self [us] | cumulative | imported package
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise ValueError("No import time reported for {!r}.".format(module))
+
+
+def run(modules: List[str], repeat: int = 7) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, float]] = {}
+    for module in modules:
+        times = [import_time(module) for _ in range(repeat)]
+        results[module] = {
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+        }
+    return {"environment": environment(), "repeat": repeat, "results": results}
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.importtime",
+        description="Measure the import time of modules against a budget.",
+    )
+    parser.add_argument("modules", nargs="*", default=list(MODULES))
+    parser.add_argument(
+        "-b",
+        "--budget",
+        type=float,
+        default=BUDGET,
+        help="The maximum median import time in milliseconds.",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=7)
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write the results as JSON into this file.",
+    )
+    parsed = parser.parse_args(args)
+    results = run(parsed.modules, parsed.repeat)
+    if parsed.output:
+        with open(parsed.output, "w") as output:
+            json.dump(results, output, indent=2)
+    over_budget = False
+    for module, times in results["results"].items():
+        status = "ok"
+        if times["median"] > parsed.budget:
+            status = "OVER BUDGET"
+            over_budget = True
+        print(
+            "{:<30} {:>8.2f} ms (budget {:.2f} ms) {}".format(
+                module, times["median"], parsed.budget, status
+            )
+        )
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
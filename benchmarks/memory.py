@@ -0,0 +1,105 @@
+"""Measure the memory used per instance of the classes a batch job keeps
+many of.
+
+``shallow`` is the size of the instance and its ``__dict__`` (if it has
+one), ``traced`` the memory allocated per instance when creating many
+of them, measured with :mod:`tracemalloc`.
+
+    python -m benchmarks.memory --output memory.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.suite import FIXTURES_PATH, environment
+from phrydy.mediafile import (
+    Image,
+    ImageType,
+    MediaField,
+    MP3DescStorageStyle,
+    StorageStyle,
+)
+from phrydy.mediafile_extended import MediaFileExtended, read_record
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+def shallow_size(instance: Any) -> int:
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def traced_size(factory: Callable[[], Any], number: int) -> float:
+    """The average number of bytes allocated per instance."""
+    factory()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instances = [factory() for _ in range(number)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # The list itself is not part of the instances.
+    return (after - before - sys.getsizeof(instances)) / number
+
+
+def open_media_file() -> MediaFileExtended:
+    media_file = MediaFileExtended(os.path.join(FIXTURES_PATH, "mb.mp3"))
+    # Populate the per-file caches as a read would.
+    media_file.year
+    return media_file
+
+
+FACTORIES: Dict[str, Callable[[], Any]] = {
+    "Image": lambda: Image(PNG, desc="front", type=ImageType.front),
+    "StorageStyle": lambda: StorageStyle("TITLE"),
+    "MP3DescStorageStyle": lambda: MP3DescStorageStyle("MusicBrainz Album Id"),
+    "MediaField": lambda: MediaField(StorageStyle("TITLE")),
+    "MediaFileExtended": open_media_file,
+    "Snapshot": lambda: read_record(os.path.join(FIXTURES_PATH, "mb.mp3")),
+}
+
+
+def run(number: int = 1000) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, factory in FACTORIES.items():
+        results[name] = {
+            "shallow": shallow_size(factory()),
+            # Opening files is slow, a tenth is enough for a stable value.
+            "traced": traced_size(
+                factory,
+                number // 10 if name in ("MediaFileExtended", "Snapshot") else number,
+            ),
+        }
+    return {"environment": environment(), "number": number, "results": results}
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Measure the memory per instance.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write the results as JSON into this file instead of stdout.",
+    )
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    parsed = parser.parse_args(args)
+    results = run(parsed.number)
+    if parsed.output:
+        with open(parsed.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Measure the basic operations on every fixture in ``tests/files``.
+
+Every fixture is measured as it is (``small``) and as a synthetic
+variant with a large tag (``large``): long lyrics and comments and a
+front cover of one MiB.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from importlib import metadata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from phrydy.mediafile import Image, ImageType, MediaFile
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+
+FIXTURES = (
+    "mb.mp3",
+    "mb.flac",
+    "mb.m4a",
+    "mb.ogg",
+    "mb.opus",
+    "mb.wma",
+    "mb.ape",
+    "mb.wv",
+    "mb.mpc",
+    "mb.aiff",
+    "mb.alac.m4a",
+)
+
+VARIANTS = ("small", "large")
+
+LARGE_IMAGE = b"\x89PNG\r\n\x1a\n" + b"\x00" * (1024 * 1024)
+
+LARGE_TEXT = "Lorem ipsum dolor sit amet. " * 2500
+
+
+def prepare(name: str, variant: str, directory: str) -> str:
+    """Copy a fixture into ``directory``. The ``large`` variant gets
+    additional tags of about 1.1 MiB."""
+    path = os.path.join(directory, variant + "-" + name)
+    shutil.copyfile(os.path.join(FIXTURES_PATH, name), path)
+    if variant == "large":
+        media_file = MediaFile(path)
+        media_file.lyrics = LARGE_TEXT
+        media_file.comments = LARGE_TEXT
+        media_file.images = [Image(LARGE_IMAGE, desc="front", type=ImageType.front)]
+        media_file.save()
+    return path
+
+
+def open_file(path: str) -> Callable[[], Any]:
+    return lambda: MediaFile(path)
+
+
+def open_mmap(path: str) -> Callable[[], Any]:
+    return lambda: MediaFile(path, use_mmap=True)
+
+
+def as_dict(path: str) -> Callable[[], Any]:
+    media_file = MediaFile(path)
+    return media_file.as_dict
+
+
+def get_field(path: str) -> Callable[[], Any]:
+    media_file = MediaFile(path)
+    return lambda: media_file.title
+
+
+def update_save(path: str) -> Callable[[], Any]:
+    media_file = MediaFile(path)
+    tracks = itertools.cycle(range(1, 100))
+
+    def run() -> None:
+        # A new value on every call, unchanged files are not written.
+        media_file.update({"title": "benchmark", "track": next(tracks)})
+        media_file.save()
+
+    return run
+
+
+def extract_images(path: str) -> Callable[[], Any]:
+    return lambda: MediaFile(path).images
+
+
+OPERATIONS: Dict[str, Callable[[str], Callable[[], Any]]] = {
+    "open": open_file,
+    "open_mmap": open_mmap,
+    "as_dict": as_dict,
+    "get_field": get_field,
+    "update_save": update_save,
+    "extract_images": extract_images,
+}
+"""Every operation gets the path of a prepared file and returns the
+function to measure."""
+
+
+def measure(function: Callable[[], Any], number: int, repeat: int) -> Dict[str, float]:
+    """Call ``function`` ``number`` times per round and return the
+    statistics of the seconds per call over ``repeat`` rounds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "phrydy": metadata.version("phrydy"),
+        "mutagen": metadata.version("mutagen"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def run(
+    number: int = 10,
+    repeat: int = 5,
+    fixtures: Tuple[str, ...] = FIXTURES,
+    operations: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Run the suite and return the results as a JSON serializable
+    dictionary. The keys of ``results`` are
+    ``<fixture>:<variant>:<operation>``."""
+    if operations is None:
+        operations = list(OPERATIONS)
+    results: Dict[str, Dict[str, float]] = {}
+    directory = tempfile.mkdtemp()
+    try:
+        for name in fixtures:
+            for variant in VARIANTS:
+                path = prepare(name, variant, directory)
+                for operation in operations:
+                    function = OPERATIONS[operation](path)
+                    key = "{}:{}:{}".format(name, variant, operation)
+                    results[key] = measure(function, number, repeat)
+    finally:
+        shutil.rmtree(directory)
+    return {
+        "environment": environment(),
+        "number": number,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Format one line per result with the ratio of the current to the
+    baseline median. A ratio above 1 means slower."""
+    lines: List[str] = []
+    for key, stats in sorted(current["results"].items()):
+        if key in baseline["results"]:
+            ratio = stats["median"] / baseline["results"][key]["median"]
+            lines.append("{:<40} {:>6.2f}x".format(key, ratio))
+    return lines
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the mediafile operations on the test fixtures.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Write the results as JSON into this file instead of stdout.",
+    )
+    parser.add_argument(
+        "-c",
+        "--compare",
+        metavar="BASELINE",
+        help="Compare the results to a JSON file of a previous run.",
+    )
+    parser.add_argument("-n", "--number", type=int, default=10)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--operation",
+        action="append",
+        choices=list(OPERATIONS),
+        help="Only run this operation. Can be given several times.",
+    )
+    parsed = parser.parse_args(args)
+
+    results = run(parsed.number, parsed.repeat, operations=parsed.operation)
+
+    if parsed.output:
+        with open(parsed.output, "w") as output:
+            json.dump(results, output, indent=2)
+    elif not parsed.compare:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if parsed.compare:
+        with open(parsed.compare) as baseline:
+            print("\n".join(compare(json.load(baseline), results)))
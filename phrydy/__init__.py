@@ -1,39 +1,112 @@
-from importlib import metadata
-
-from phrydy import doc_generator, field_docs, mediafile_extended
-from phrydy.doc_generator import (
-    format_fields_as_txt,
-    get_max_field_length,
-    merge_fields,
-    print_debug,
-)
-from phrydy.field_docs import FieldDocCollection, fields
-from phrydy.mediafile_extended import (
-    MediaFile,
-    MediaFileExtended,
-)
+"""The public names are imported on first access, so ``import phrydy``
+doesn’t load Mutagen, the field documentation or the package metadata
+until they are needed."""
 
-__version__: str = metadata.version("phrydy")
+import importlib
 
+# Importing typing would take longer than the rest of this module.
+TYPE_CHECKING = False
 
-field_docs  # type: ignore
+if TYPE_CHECKING:
+    from typing import Any
 
-doc_generator  # type: ignore
+    from phrydy import doc_generator, field_docs, mediafile_extended
+    from phrydy.cache import CachedReader
+    from phrydy.doc_generator import (
+        format_fields_as_txt,
+        get_max_field_length,
+        merge_fields,
+        print_debug,
+    )
+    from phrydy.field_docs import FieldDocCollection, fields
+    from phrydy.mediafile_extended import (
+        MediaFile,
+        MediaFileExtended,
+        Snapshot,
+        read_record,
+    )
+    from phrydy.profiling import profile
+    from phrydy.scanner import ScanResult, scan
+    from phrydy.writer import WriteResult, write_many
 
-mediafile_extended  # type: ignore
+    __version__: str
 
-fields  # type: ignore
+_ATTRIBUTES: "dict[str, str]" = {
+    "CachedReader": "phrydy.cache",
+    "format_fields_as_txt": "phrydy.doc_generator",
+    "get_max_field_length": "phrydy.doc_generator",
+    "merge_fields": "phrydy.doc_generator",
+    "print_debug": "phrydy.doc_generator",
+    "FieldDocCollection": "phrydy.field_docs",
+    "fields": "phrydy.field_docs",
+    "MediaFile": "phrydy.mediafile_extended",
+    "MediaFileExtended": "phrydy.mediafile_extended",
+    "Snapshot": "phrydy.mediafile_extended",
+    "read_record": "phrydy.mediafile_extended",
+    "profile": "phrydy.profiling",
+    "ScanResult": "phrydy.scanner",
+    "scan": "phrydy.scanner",
+    "WriteResult": "phrydy.writer",
+    "write_many": "phrydy.writer",
+}
+"""The public names and the modules they are imported from."""
 
-FieldDocCollection  # type: ignore
+_SUBMODULES = (
+    "aio",
+    "artwork",
+    "cache",
+    "debug",
+    "doc_generator",
+    "export",
+    "field_docs",
+    "index",
+    "mediafile",
+    "mediafile_extended",
+    "profiling",
+    "query",
+    "scanner",
+    "writer",
+)
 
-get_max_field_length  # type: ignore
+__all__ = [
+    "__version__",
+    "doc_generator",
+    "field_docs",
+    "mediafile_extended",
+    "CachedReader",
+    "format_fields_as_txt",
+    "get_max_field_length",
+    "merge_fields",
+    "print_debug",
+    "FieldDocCollection",
+    "fields",
+    "MediaFile",
+    "MediaFileExtended",
+    "Snapshot",
+    "read_record",
+    "profile",
+    "ScanResult",
+    "scan",
+    "WriteResult",
+    "write_many",
+]
 
-format_fields_as_txt  # type: ignore
 
-merge_fields  # type: ignore
+def __getattr__(name: str) -> "Any":
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module("phrydy." + name)
+    elif name == "__version__":
+        from importlib import metadata
 
-print_debug  # type: ignore
+        value = metadata.version("phrydy")
+    else:
+        raise AttributeError("module 'phrydy' has no attribute {!r}".format(name))
+    # Later accesses don’t go through this function anymore.
+    globals()[name] = value
+    return value
 
-MediaFile  # type: ignore
 
-MediaFileExtended  # type: ignore
+def __dir__() -> "list[str]":
+    return sorted({*globals(), *__all__, *_SUBMODULES})
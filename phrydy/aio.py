@@ -0,0 +1,185 @@
+"""Read and write the metadata of audio files without blocking the
+asyncio event loop.
+
+Mutagen does blocking file I/O, so every file is opened in a thread of
+an executor. The coroutines can be cancelled and accept a per-file
+timeout. A file that is already being read or written in a thread can’t
+be interrupted: the thread finishes in the background, only the result
+is dropped.
+
+Usage:
+
+    >>> from phrydy import aio
+    >>> record = await aio.read("Lucy.mp3")
+    >>> async for result in aio.read_many(["/music"], concurrency=16):
+    ...     print(result.path, result.error or result.record["title"])
+    >>> await aio.write("Lucy.mp3", {"artist": "The Beatles"})
+    ['artist']
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from phrydy.mediafile import UnreadableFileError
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import IMAGE_FIELDS, ScanResult, StrPath, default_fields, walk
+
+T = TypeVar("T")
+
+
+def _read(path: StrPath, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    # Don’t decode artwork that isn’t requested.
+    load_images = any(field in IMAGE_FIELDS for field in fields)
+    media_file = MediaFileExtended(os.fspath(path), load_images=load_images)
+    return {field: getattr(media_file, field) for field in fields}
+
+
+def _write(path: StrPath, updates: Dict[str, Any]) -> List[str]:
+    media_file = MediaFileExtended(os.fspath(path))
+    media_file.update(updates)
+    changed = media_file.changed_fields()
+    media_file.save()
+    return changed
+
+
+async def _run(
+    executor: Optional[Executor],
+    timeout: Optional[float],
+    function: Callable[..., T],
+    *args: Any,
+) -> T:
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, functools.partial(function, *args))
+    return await asyncio.wait_for(future, timeout)
+
+
+async def read(
+    path: StrPath,
+    fields: Optional[Iterable[str]] = None,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """Read the field values of an audio file.
+
+    May throw :class:`phrydy.mediafile.UnreadableFileError` or
+    :class:`asyncio.TimeoutError`.
+
+    :param fields: The fields to read. Defaults to all
+      :meth:`MediaFileExtended.readable_fields` except ``art`` and
+      ``images``.
+    :param timeout: The maximum number of seconds to wait for the file.
+    :param executor: Defaults to the default executor of the event loop.
+    """
+    field_names = default_fields() if fields is None else tuple(fields)
+    return await _run(executor, timeout, _read, path, field_names)
+
+
+async def write(
+    path: StrPath,
+    updates: Dict[str, Any],
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """Update the fields of an audio file (see
+    :meth:`phrydy.mediafile.MediaFile.update`) and save it.
+
+    Files whose values are already equal to ``updates`` are not written.
+    If the timeout expires while the file is being written, the write is
+    still completed in the background.
+
+    May throw :class:`phrydy.mediafile.UnreadableFileError` or
+    :class:`asyncio.TimeoutError`.
+
+    :return: The names of the changed fields.
+    """
+    return await _run(executor, timeout, _write, path, updates)
+
+
+async def _read_result(
+    path: str,
+    fields: Tuple[str, ...],
+    timeout: Optional[float],
+    executor: Executor,
+) -> ScanResult:
+    try:
+        record = await _run(executor, timeout, _read, path, fields)
+    except asyncio.TimeoutError:
+        message = "{!r}: timed out after {} seconds".format(path, timeout)
+        return ScanResult(path, None, UnreadableFileError(path, message))
+    except Exception as error:
+        # One broken file doesn’t stop the others.
+        return ScanResult(path, None, error)
+    return ScanResult(path, record, None)
+
+
+async def read_many(
+    paths: Union[StrPath, Iterable[StrPath]],
+    concurrency: int = 8,
+    fields: Optional[Iterable[str]] = None,
+    timeout: Optional[float] = None,
+    extensions: Optional[Iterable[str]] = None,
+) -> AsyncGenerator[ScanResult, None]:
+    """Read the metadata of all audio files below ``paths``.
+
+    The results are yielded in the order in which the files have been
+    read. At most ``concurrency`` files are read at the same time, and
+    the next files are only opened when the consumer asks for more
+    results. Closing or cancelling the generator cancels the files that
+    haven’t been started yet.
+
+    :param paths: A single path or an iterable of paths to files or
+      directories. Directories are walked recursively.
+    :param concurrency: The number of threads reading files.
+    :param fields: See :func:`read`.
+    :param timeout: The maximum number of seconds per file. A file that
+      times out is yielded with an
+      :class:`phrydy.mediafile.UnreadableFileError`.
+    :param extensions: Only read files with these extensions (for example
+      ``[".mp3", ".flac"]``).
+    """
+    field_names = default_fields() if fields is None else tuple(fields)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    # The directories are walked in the default executor, because
+    # listing a directory can block as well.
+    files = walk(paths, extensions)
+    exhausted = False
+    pending: Set["asyncio.Future[ScanResult]"] = set()
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                path = await loop.run_in_executor(None, next, files, None)
+                if path is None:
+                    exhausted = True
+                else:
+                    pending.add(
+                        asyncio.ensure_future(
+                            _read_result(path, field_names, timeout, executor)
+                        )
+                    )
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        executor.shutdown(wait=False)
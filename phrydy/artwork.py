@@ -0,0 +1,179 @@
+"""Extract the embedded artwork of a library and store every distinct
+image only once.
+
+The images are addressed by the SHA-256 digest of their data. All tracks
+of an album usually embed the same cover, so the cover is written once
+and every track refers to it by its digest.
+
+Usage:
+
+    >>> from phrydy.artwork import ArtworkStore, extract_artwork
+    >>> store = ArtworkStore("/var/cache/covers")
+    >>> for ref in extract_artwork("/music", store=store):
+    ...     print(ref.path, ref.type, store.path(ref.digest, ref.extension))
+"""
+
+import hashlib
+import os
+import secrets
+from typing import Generator, Iterable, NamedTuple, Optional, Set, Tuple, Union
+
+from phrydy.mediafile import (
+    CoverArtField,
+    Image,
+    ImageType,
+)
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import StrPath, walk
+
+CHUNK_SIZE = 1024 * 1024
+"""The number of bytes hashed at a time."""
+
+
+def image_digest(data: Union[bytes, bytearray, memoryview]) -> str:
+    """Get the hexadecimal SHA-256 digest of image data. The data is
+    hashed in chunks of views, so no copy of the image is made."""
+    view = memoryview(data).cast("B")
+    sha256 = hashlib.sha256()
+    for start in range(0, len(view), CHUNK_SIZE):
+        sha256.update(view[start : start + CHUNK_SIZE])
+    return sha256.hexdigest()
+
+
+def _create_temporary(directory: str) -> Tuple[int, str]:
+    """Create a new temporary file in a directory.
+
+    Unlike :func:`tempfile.mkstemp`, which always uses ``0o600``, the
+    file gets the permissions of the umask, as :func:`open` would create
+    it.
+
+    :return: The open file descriptor and the path of the file.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        path = os.path.join(directory, ".tmp-" + secrets.token_hex(8))
+        try:
+            return os.open(path, flags, 0o666), path
+        except FileExistsError:
+            continue
+
+
+class ArtworkRef(NamedTuple):
+    path: str
+    """The path of the audio file."""
+
+    type: Optional[ImageType]
+    """The type of the image, for example ``ImageType.front``."""
+
+    digest: str
+    """The SHA-256 digest of the image data."""
+
+    mime_type: Optional[str]
+    """The MIME type sniffed from the image data."""
+
+    extension: Optional[str]
+    """The file extension matching the image data, see
+    :attr:`phrydy.mediafile.Image.extension`."""
+
+    cover: bool
+    """Whether this is the image
+    :meth:`phrydy.mediafile.CoverArtField.guess_cover_image` picks as the
+    cover of the file."""
+
+
+class ArtworkStore:
+    """A directory holding one file per distinct image.
+
+    The file of an image is named after its digest and the extension
+    matching its content: ``<directory>/<digest[:2]>/<digest>.<ext>``.
+
+    The image files get the permissions of the umask of the process.
+
+    :param directory: Created if it doesn’t exist.
+    """
+
+    def __init__(self, directory: StrPath) -> None:
+        self.directory = os.fspath(directory)
+        self._known: Set[str] = set()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, digest: str, extension: Optional[str] = None) -> str:
+        """Get the path of the file of an image.
+
+        :param extension: The extension of the image, for example
+          :attr:`phrydy.mediafile.Image.extension`.
+        """
+        name = digest if extension is None else digest + "." + extension
+        return os.path.join(self.directory, digest[:2], name)
+
+    def add(self, image: Image, digest: Optional[str] = None) -> str:
+        """Write an image into the store unless it is already stored.
+
+        :param digest: The result of :func:`image_digest`, if it is
+          already known.
+
+        :return: The digest of the image.
+        """
+        if digest is None:
+            digest = image_digest(image.data)
+        if digest in self._known:
+            return digest
+        path = self.path(digest, image.extension)
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            # Write a temporary file first, so that a concurrent reader
+            # never sees a partial image.
+            fd, temporary = _create_temporary(directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(image.data)
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        self._known.add(digest)
+        return digest
+
+
+def extract_artwork(
+    paths: Union[StrPath, Iterable[StrPath]],
+    store: Optional[ArtworkStore] = None,
+    cover_only: bool = False,
+    extensions: Optional[Iterable[str]] = None,
+) -> Generator[ArtworkRef, None, None]:
+    """Yield a reference to every image embedded in the audio files
+    below ``paths``.
+
+    Only the images of one file are in memory at a time. Files that
+    can’t be read (for any reason) are skipped.
+
+    :param paths: A single path or an iterable of paths to files or
+      directories. Directories are walked recursively.
+    :param store: Write every distinct image into this store.
+    :param cover_only: Only yield the cover image of each file.
+    :param extensions: Only read files with these extensions (for example
+      ``[".mp3", ".flac"]``).
+    """
+    for path in walk(paths, extensions):
+        try:
+            images = MediaFileExtended(path).images
+        except Exception:
+            continue
+        if not images:
+            continue
+        cover = CoverArtField.guess_cover_image(images)
+        for image in images:
+            if cover_only and image is not cover:
+                continue
+            digest = image_digest(image.data)
+            if store is not None:
+                store.add(image, digest)
+            yield ArtworkRef(
+                path,
+                image.type,
+                digest,
+                image.mime_type,
+                image.extension,
+                image is cover,
+            )
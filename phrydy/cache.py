@@ -0,0 +1,235 @@
+"""A persistent SQLite cache for the metadata records of audio files.
+
+A cached record is reused as long as the size, the modification time
+and the inode of the file and the phrydy version and the read fields are
+unchanged, so an unchanged file is never opened again.
+
+Usage:
+
+    >>> from phrydy import CachedReader
+    >>> with CachedReader("metadata.sqlite", max_entries=500000) as reader:
+    ...     record = reader.read("Lucy.mp3")
+    >>> record["title"]
+    'Lucy in the Sky with Diamonds'
+
+Several processes can use the same cache file at the same time. Every
+process has to open its own :class:`CachedReader`.
+
+The records are stored as JSON, dates as ISO 8601 strings, so reading a
+cache file never runs code from it.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from importlib import metadata
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from phrydy.export import to_json_value
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import IMAGE_FIELDS, default_fields
+
+Record = Dict[str, Any]
+
+StatSignature = Tuple[int, int, int]
+"""The size, the modification time in nanoseconds and the inode."""
+
+
+def stat_signature(path: Union[str, "os.PathLike[str]"]) -> StatSignature:
+    """Get the values of :func:`os.stat` that identify an unchanged file."""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def schema_version(fields: Iterable[str]) -> str:
+    """Build a version string of the phrydy version and the field names.
+
+    A cached record is only valid if it was written by the same phrydy
+    version with the same fields.
+    """
+    digest = hashlib.sha1(",".join(fields).encode("utf-8")).hexdigest()
+    return metadata.version("phrydy") + ":" + digest[:12]
+
+
+def _encode(record: Record) -> str:
+    return json.dumps(
+        {field: to_json_value(value) for field, value in record.items()},
+        ensure_ascii=False,
+    )
+
+
+def _decode(data: str) -> Record:
+    record = json.loads(data)
+    kinds = MediaFileExtended.field_kinds()
+    for field, value in record.items():
+        kind = kinds.get(field)
+        if value is not None and kind is not None and kind.out_type is datetime.date:
+            record[field] = datetime.date.fromisoformat(value)
+    return record
+
+
+class CachedReader:
+    """Read the metadata records of audio files through a persistent
+    cache.
+
+    :param database: The path of the SQLite database file.
+    :param max_entries: The maximum number of cached records. The least
+      recently used records are evicted first.
+    :param max_bytes: The maximum size of all cached records in bytes.
+    :param fields: The fields of a record. Defaults to all
+      :meth:`MediaFileExtended.readable_fields` except ``art`` and
+      ``images``, which can’t be cached.
+    :param timeout: How many seconds to wait for a lock held by another
+      process.
+    :param access_resolution: The time of the last access of a record is
+      only written if it is older than this many seconds, so that most
+      cache hits don’t write to the database.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, "os.PathLike[str]"],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
+        timeout: float = 30.0,
+        access_resolution: float = 60.0,
+    ) -> None:
+        self.fields = default_fields() if fields is None else tuple(fields)
+        for field in IMAGE_FIELDS:
+            if field in self.fields:
+                raise ValueError("The field {!r} can’t be cached.".format(field))
+        self.version = schema_version(self.fields)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.access_resolution = access_resolution
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(
+            os.fspath(database), timeout=timeout, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "inode INTEGER NOT NULL, "
+            "version TEXT NOT NULL, "
+            "accessed REAL NOT NULL, "
+            "record TEXT NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS records_accessed ON records (accessed)"
+        )
+
+    def __enter__(self) -> "CachedReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM records").fetchone()[0]
+
+    def get(self, path: Union[str, "os.PathLike[str]"]) -> Optional[Record]:
+        """Get the cached record of a file or ``None`` if the file is not
+        cached or has changed since it was cached."""
+        path = os.path.abspath(path)
+        return self._get(path, stat_signature(path))
+
+    def _get(self, path: str, signature: StatSignature) -> Optional[Record]:
+        row = self.connection.execute(
+            "SELECT record, accessed FROM records WHERE path = ? AND size = ? "
+            "AND mtime_ns = ? AND inode = ? AND version = ?",
+            (path, *signature, self.version),
+        ).fetchone()
+        if row is None:
+            return None
+        data, accessed = row
+        now = time.time()
+        if now - accessed >= self.access_resolution:
+            self.connection.execute(
+                "UPDATE records SET accessed = ? WHERE path = ?", (now, path)
+            )
+        return _decode(data)
+
+    def put(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        record: Record,
+        signature: Optional[StatSignature] = None,
+    ) -> None:
+        """Store the record of a file.
+
+        :param signature: The result of :func:`stat_signature` taken before
+          the file was read. Pass it to avoid caching a record of a file
+          that has been changed while it was read.
+        """
+        path = os.path.abspath(path)
+        if signature is None:
+            signature = stat_signature(path)
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    *signature,
+                    self.version,
+                    time.time(),
+                    _encode(record),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete the least recently used records until the limits are
+        met. Must be called inside a transaction."""
+        if self.max_entries is not None:
+            self.connection.execute(
+                "DELETE FROM records WHERE path IN (SELECT path FROM records "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            self.connection.execute(
+                "DELETE FROM records WHERE path IN (SELECT path FROM ("
+                "SELECT path, sum(length(CAST(record AS BLOB))) "
+                "OVER (ORDER BY accessed DESC, path) AS total FROM records) "
+                "WHERE total > ?)",
+                (self.max_bytes,),
+            )
+
+    def read(self, path: Union[str, "os.PathLike[str]"]) -> Record:
+        """Get the record of a file from the cache or read the file and
+        cache its record.
+
+        May throw :class:`OSError` if the file doesn’t exist or
+        :class:`phrydy.mediafile.UnreadableFileError`.
+        """
+        path = os.path.abspath(path)
+        signature = stat_signature(path)
+        record = self._get(path, signature)
+        if record is not None:
+            self.hits += 1
+            return record
+        self.misses += 1
+        media_file = MediaFileExtended(path, load_images=False)
+        record = {field: getattr(media_file, field) for field in self.fields}
+        self.put(path, record, signature)
+        return record
+
+    def discard(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Remove the record of a file from the cache."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM records WHERE path = ?", (os.path.abspath(path),)
+            )
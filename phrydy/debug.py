@@ -1,8 +1,13 @@
 import argparse
+import os
+import sys
+from typing import Generator, Iterable
 
 from phrydy import __version__
 from phrydy.doc_generator import format_fields_as_txt, print_debug
+from phrydy.export import write_csv, write_json_lines
 from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import default_fields, scan
 
 
 def description() -> str:
@@ -17,14 +22,30 @@ wrapper around the “mutagen” library.
     )
 
 
+def read_paths(audio_files: Iterable[str]) -> Generator[str, None, None]:
+    """Yield the paths, replacing ``-`` by the paths read from the standard
+    input (one path per line)."""
+    for audio_file in audio_files:
+        if audio_file == "-":
+            for line in sys.stdin:
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+        else:
+            yield audio_file
+
+
 def init_cli() -> None:
     parser = argparse.ArgumentParser(
         formatter_class=argparse.RawDescriptionHelpFormatter, description=description()
     )
 
     parser.add_argument(
-        "audio_file",
-        help="A audio file",
+        "audio_files",
+        metavar="audio_file",
+        nargs="+",
+        help="A audio file. With --format also directories. Use “-” to read "
+        "the paths from the standard input, one path per line.",
     )
 
     parser.add_argument(
@@ -34,6 +55,21 @@ def init_cli() -> None:
         action="store_true",
     )
 
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("json", "csv"),
+        help="Print one JSON Lines or CSV record per file instead of the debug output",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="The number of worker processes used with --format (default: "
+        "the number of CPUs)",
+    )
+
     parser.add_argument(
         "-v",
         "--version",
@@ -43,11 +79,23 @@ def init_cli() -> None:
 
     args = parser.parse_args()
 
-    if args.audio_file:
-        print("phrydy version " + __version__)
+    if args.format:
+        results = scan(read_paths(args.audio_files), workers=args.workers)
+        if args.format == "json":
+            write_json_lines(results, sys.stdout)
+        else:
+            write_csv(results, sys.stdout, default_fields())
+        return
+
+    print("phrydy version " + __version__)
 
+    for audio_file in read_paths(args.audio_files):
+        if os.path.isdir(audio_file):
+            parser.error(
+                "{}: is a directory, directories require --format".format(audio_file)
+            )
         print_debug(
-            file_path=args.audio_file,
+            file_path=audio_file,
             MediaClass=MediaFileExtended,
             field_generator=MediaFileExtended.readable_fields,
             color=args.color,
@@ -8,8 +8,6 @@ import termcolor
 from phrydy.field_docs import FieldDoc, FieldDocCollection, fields
 from phrydy.mediafile_extended import MediaFileExtended
 
-termcolor.colored("green", "green")
-
 
 def remove_color(text: str) -> str:
     """https://stackoverflow.com/a/14693789/10193818"""
@@ -73,7 +71,7 @@ def print_section(text: str, color: bool = False) -> None:
 def print_debug(
     file_path: str,
     MediaClass: typing.Callable[[str], MediaFileExtended],
-    field_generator: typing.Callable[[], typing.Generator[str, None, None]],
+    field_generator: typing.Callable[[], typing.Iterable[str]],
     color: bool = False,
 ) -> None:
     fields = MediaClass(file_path)
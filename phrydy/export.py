@@ -0,0 +1,68 @@
+"""Write the records of many audio files as JSON Lines or CSV."""
+
+import csv
+import datetime
+import json
+from typing import Any, Iterable, Sequence, TextIO
+
+from phrydy.mediafile import Image
+from phrydy.scanner import ScanResult
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert a field value into a value that can be encoded as JSON.
+
+    Dates are converted into ISO 8601 strings, bytes (``art``) into their
+    length and :class:`phrydy.mediafile.Image` objects into a dictionary
+    without the image data.
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, Image):
+        return {
+            "mime_type": value.mime_type,
+            "desc": value.desc,
+            "type": value.type.name if value.type is not None else None,
+            "size": len(value.data),
+        }
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(item) for item in value]
+    return value
+
+
+def write_json_lines(results: Iterable[ScanResult], output: TextIO) -> None:
+    """Write one JSON object per file. The object contains the key
+    ``path``, the fields of the record and, if the file couldn’t be read,
+    the key ``error``."""
+    for result in results:
+        line = {"path": result.path}
+        if result.record is not None:
+            for field, value in result.record.items():
+                line[field] = to_json_value(value)
+        if result.error is not None:
+            line["error"] = str(result.error)
+        output.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def write_csv(
+    results: Iterable[ScanResult], output: TextIO, fields: Sequence[str]
+) -> None:
+    """Write a header line and one line per file. The columns are
+    ``path``, the ``fields`` and ``error``. Lists are encoded as JSON
+    arrays, ``None`` as an empty cell."""
+    writer = csv.writer(output)
+    writer.writerow(["path", *fields, "error"])
+    for result in results:
+        row = [result.path]
+        record = result.record or {}
+        for field in fields:
+            value = to_json_value(record.get(field))
+            if value is None:
+                value = ""
+            elif isinstance(value, (list, dict)):
+                value = json.dumps(value, ensure_ascii=False)
+            row.append(value)
+        row.append("" if result.error is None else str(result.error))
+        writer.writerow(row)
@@ -0,0 +1,382 @@
+"""A persistent SQLite index of the metadata of a music library that is
+kept up to date incrementally.
+
+:meth:`LibraryIndex.refresh` walks a directory and compares the
+:func:`os.stat` values of the files with the stored ones. Only new files
+and files whose size or modification time changed are read again.
+Deleted files are removed from the index and renamed or moved files are
+recognized by their inode, both without opening a single file.
+
+Usage:
+
+    >>> from phrydy.index import LibraryIndex
+    >>> with LibraryIndex("library.sqlite") as index:
+    ...     changes = index.refresh("/music", workers=4)
+    ...     print(changes.added, changes.deleted)
+    ...     record = index.get("/music/Lucy.mp3")
+
+The records are stored as JSON, dates as ISO 8601 strings, so they can
+be inspected with the ``sqlite3`` command line tool. They are searched
+with :meth:`LibraryIndex.query` and the conditions of
+:mod:`phrydy.query`.
+"""
+
+import os
+import sqlite3
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from phrydy.cache import Record, _decode, _encode, schema_version
+from phrydy.query import Predicate, field_expression
+from phrydy.scanner import StrPath, default_fields, scan, walk
+
+BATCH_SIZE = 1000
+"""The number of read files written to the database per transaction."""
+
+INDEXED_FIELDS = ("mb_albumid", "albumartist", "mb_workid")
+"""The fields that get a secondary index by default."""
+
+
+class FileSignature(NamedTuple):
+    """The values of :func:`os.stat` that identify a file and tell
+    whether it has changed."""
+
+    device: int
+    inode: int
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: StrPath) -> "FileSignature":
+        stat = os.stat(path)
+        return cls(stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class RefreshResult(NamedTuple):
+    """The changes :meth:`LibraryIndex.refresh` found."""
+
+    added: List[str]
+    """The paths of the files that have been read for the first time."""
+
+    updated: List[str]
+    """The paths of the changed files that have been read again."""
+
+    renamed: List[Tuple[str, str]]
+    """The old and the new paths of the files that have been renamed or
+    moved. A renamed file that has also been changed is listed in
+    :attr:`updated` too."""
+
+    deleted: List[str]
+    """The paths of the files that have been removed from the index."""
+
+    failed: List[str]
+    """The paths of the files that couldn’t be read. They are kept in
+    the index with their error, so they are only tried again when they
+    change."""
+
+    unchanged: int
+    """The number of files that have not been read."""
+
+
+class LibraryIndex:
+    """An index of the metadata records of the audio files below one or
+    more directories.
+
+    Every file is stored in one row with its :class:`FileSignature`, its
+    record and, as separate columns, its ``format``, ``length`` and
+    ``bitrate``.
+
+    :param database: The path of the SQLite database file.
+    :param fields: The fields of a record. Defaults to all
+      :meth:`MediaFileExtended.readable_fields` except ``art`` and
+      ``images``. If the fields or the phrydy version change, all files
+      are read again on the next refresh.
+    :param timeout: How many seconds to wait for a lock held by another
+      process.
+    :param indexed_fields: The fields to create a secondary index on.
+      Indexes are only ever added, never dropped.
+    """
+
+    def __init__(
+        self,
+        database: StrPath,
+        fields: Optional[Iterable[str]] = None,
+        timeout: float = 30.0,
+        indexed_fields: Iterable[str] = INDEXED_FIELDS,
+    ) -> None:
+        self.fields = default_fields() if fields is None else tuple(fields)
+        self.version = schema_version(self.fields)
+        self.connection = sqlite3.connect(
+            os.fspath(database), timeout=timeout, isolation_level=None
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, "
+            "device INTEGER NOT NULL, "
+            "inode INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "version TEXT NOT NULL, "
+            "format TEXT, "
+            "length REAL, "
+            "bitrate INTEGER, "
+            "record TEXT, "
+            "error TEXT)"
+        )
+        for field in indexed_fields:
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS files_{} ON files ({})".format(
+                    field, field_expression(field)
+                )
+            )
+
+    def __enter__(self) -> "LibraryIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM files").fetchone()[0]
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, (str, os.PathLike)):
+            return False
+        row = self.connection.execute(
+            "SELECT 1 FROM files WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return row is not None
+
+    def get(self, path: StrPath) -> Optional[Record]:
+        """Get the stored record of a file or ``None`` if the file is not
+        in the index or couldn’t be read. The file itself is not
+        accessed."""
+        row = self.connection.execute(
+            "SELECT record FROM files WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return _decode(row[0])
+
+    def error(self, path: StrPath) -> Optional[str]:
+        """Get the message of the error raised when the file was read or
+        ``None``."""
+        row = self.connection.execute(
+            "SELECT error FROM files WHERE path = ?", (os.path.abspath(path),)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def items(self) -> Generator[Tuple[str, Record], None, None]:
+        """Yield the paths and records of all readable files, sorted by
+        path."""
+        for path, data in self.connection.execute(
+            "SELECT path, record FROM files WHERE record IS NOT NULL ORDER BY path"
+        ):
+            yield path, _decode(data)
+
+    def query(
+        self,
+        predicate: Optional[Predicate] = None,
+        order_by: Union[str, Iterable[str], None] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Generator[Tuple[str, Record], None, None]:
+        """Yield the paths and records of the readable files matching a
+        condition of :mod:`phrydy.query`.
+
+        :param predicate: Defaults to all files.
+        :param order_by: A field or a list of fields to sort by. A field
+          prefixed with ``-`` is sorted in descending order. Missing
+          values come first in ascending order. Ties are sorted by
+          path, so the pages of a query don’t overlap.
+        :param limit: The maximum number of records.
+        :param offset: The number of matching records to skip.
+        """
+        sql = "SELECT path, record FROM files WHERE record IS NOT NULL"
+        parameters: Tuple[Any, ...] = ()
+        if predicate is not None:
+            sql += " AND ({})".format(predicate.sql)
+            parameters = predicate.parameters
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        terms = []
+        for field in order_by or ():
+            direction = "DESC" if field.startswith("-") else "ASC"
+            terms.append("{} {}".format(field_expression(field.lstrip("-")), direction))
+        terms.append("path")
+        sql += " ORDER BY " + ", ".join(terms)
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            parameters += (-1 if limit is None else limit, offset)
+        for path, data in self.connection.execute(sql, parameters):
+            yield path, _decode(data)
+
+    def count(self, predicate: Optional[Predicate] = None) -> int:
+        """Count the readable files matching a condition of
+        :mod:`phrydy.query`."""
+        sql = "SELECT count(*) FROM files WHERE record IS NOT NULL"
+        parameters: Tuple[Any, ...] = ()
+        if predicate is not None:
+            sql += " AND ({})".format(predicate.sql)
+            parameters = predicate.parameters
+        return self.connection.execute(sql, parameters).fetchone()[0]
+
+    def _stored(self, root: str) -> Dict[str, Tuple[FileSignature, str]]:
+        """The signatures and versions of the stored files below ``root``."""
+        # All paths starting with the root and a separator.
+        prefix = os.path.join(root, "")
+        end = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = self.connection.execute(
+            "SELECT path, device, inode, size, mtime_ns, version FROM files "
+            "WHERE path = ? OR (path >= ? AND path < ?)",
+            (root, prefix, end),
+        )
+        return {
+            path: (FileSignature(device, inode, size, mtime_ns), version)
+            for path, device, inode, size, mtime_ns, version in rows
+        }
+
+    def _store(
+        self,
+        path: str,
+        signature: FileSignature,
+        record: Optional[Record],
+        error: Optional[str],
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                *signature,
+                self.version,
+                None if record is None else record.get("format"),
+                None if record is None else record.get("length"),
+                None if record is None else record.get("bitrate"),
+                None if record is None else _encode(record),
+                error,
+            ),
+        )
+
+    def refresh(
+        self,
+        root: StrPath,
+        workers: Optional[int] = None,
+        extensions: Optional[Iterable[str]] = None,
+    ) -> RefreshResult:
+        """Bring the index up to date with the files below ``root``.
+
+        The directory tree is walked and every file is stat’ed, but only
+        new and changed files are read. Stored files that no longer
+        exist at their path are matched by device and inode with the new
+        paths; a match is a rename and the record is moved without
+        reading the file. The remaining ones are deleted from the index.
+
+        Files outside of ``root`` are left untouched.
+
+        May throw :class:`FileNotFoundError` if ``root`` doesn’t exist.
+
+        :param root: A directory or a single file.
+        :param workers: The number of processes reading the files, see
+          :func:`phrydy.scanner.scan`.
+        :param extensions: Only index files with these extensions (for
+          example ``[".mp3", ".flac"]``).
+        """
+        root = os.path.abspath(root)
+        if not os.path.exists(root):
+            # An unmounted library must not empty the index.
+            raise FileNotFoundError(root)
+        stored = self._stored(root)
+
+        found: Dict[str, FileSignature] = {}
+        for path in walk(root, extensions):
+            try:
+                found[path] = FileSignature.of(path)
+            except OSError:
+                # Deleted while walking or a broken symbolic link.
+                continue
+
+        missing = {
+            (signature.device, signature.inode): path
+            for path, (signature, _) in stored.items()
+            if path not in found
+        }
+
+        renamed: List[Tuple[str, str]] = []
+        unchanged = 0
+        to_read: Dict[str, FileSignature] = {}
+        for path, signature in found.items():
+            if path not in stored:
+                old_path = missing.pop((signature.device, signature.inode), None)
+                if old_path is None:
+                    to_read[path] = signature
+                    continue
+                renamed.append((old_path, path))
+                stored[path] = stored.pop(old_path)
+            old_signature, version = stored[path]
+            if old_signature == signature and version == self.version:
+                unchanged += 1
+            else:
+                to_read[path] = signature
+
+        deleted = sorted(missing.values())
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            for old_path, new_path in renamed:
+                self.connection.execute(
+                    "UPDATE files SET path = ? WHERE path = ?", (new_path, old_path)
+                )
+            self.connection.executemany(
+                "DELETE FROM files WHERE path = ?", [(path,) for path in deleted]
+            )
+
+        added: List[str] = []
+        updated: List[str] = []
+        failed: List[str] = []
+        pending = 0
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            for result in scan(list(to_read), workers=workers, fields=self.fields):
+                if result.path in stored:
+                    updated.append(result.path)
+                else:
+                    added.append(result.path)
+                if result.error is not None:
+                    failed.append(result.path)
+                self._store(
+                    result.path,
+                    to_read[result.path],
+                    result.record,
+                    None if result.error is None else str(result.error),
+                )
+                pending += 1
+                if pending >= BATCH_SIZE:
+                    self.connection.execute("COMMIT")
+                    self.connection.execute("BEGIN IMMEDIATE")
+                    pending = 0
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+
+        return RefreshResult(
+            added=sorted(added),
+            updated=sorted(updated),
+            renamed=renamed,
+            deleted=deleted,
+            failed=sorted(failed),
+            unchanged=unchanged,
+        )
@@ -42,12 +42,15 @@ import codecs
 import datetime
 import enum
 import functools
+import io
 import logging
 import math
+import mmap
 import os
 import re
 import struct
 import traceback
+import weakref
 
 import filetype
 import mutagen
@@ -114,6 +117,12 @@ class MutagenError(UnreadableFileError):
         Exception.__init__(self, msg)
 
 
+class ImageDecodeError(ValueError):
+    """Raised when the binary structure of an embedded image is
+    malformed. The storage styles skip such images.
+    """
+
+
 # Interacting with Mutagen.
 
 
@@ -152,14 +161,19 @@ def loadfile(method=True, writable=False, create=False):
 
     Opens a file and passes a `mutagen._utils.FileThing` to the
     decorated function. Should be used as a decorator for functions
-    using a `filething` parameter.
+    using a `filething` parameter. A `memoryview` passed as `filething`
+    is read through a `_BufferFile`.
     """
 
     def decorator(func):
         f = mutagen._util.loadfile(method, writable, create)(func)
+        index = 1 if method else 0
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            if len(args) > index and isinstance(args[index], memoryview):
+                args = list(args)
+                args[index] = _BufferFile(args[index])
             return mutagen_call("loadfile", "", f, *args, **kwargs)
 
         return wrapper
@@ -170,18 +184,150 @@ def loadfile(method=True, writable=False, create=False):
 # Utility.
 
 
+class _BufferFile(object):
+    """A read-only file-like object over a buffer, for example a
+    `memoryview` of an `mmap`. Reading copies only the requested range
+    instead of going through a buffered file.
+    """
+
+    name = "<memoryview>"
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def read(self, size=-1):
+        start = self._position
+        if size is None or size < 0:
+            end = len(self._view)
+        else:
+            end = min(start + size, len(self._view))
+        if end <= start:
+            return b""
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position {0}".format(offset))
+        self._position = offset
+        return offset
+
+    def tell(self):
+        return self._position
+
+
+def _mmap_filething(filething):
+    """Map the open file of a `filething` read-only into memory.
+
+    Returns a new `mutagen._util.FileThing` reading from the map, or
+    `None` if the file can't be mapped (for example because it is empty
+    or not a regular file).
+    """
+    try:
+        mapped = mmap.mmap(filething.fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+    return mutagen._util.FileThing(mapped, filething.filename, filething.name)
+
+
 def _update_filething(filething):
     """Reopen a `filething` if it's a local file.
 
-    A filething that is *not* an actual file is left unchanged; a
-    filething with a filename is reopened and a new object is returned.
+    A filething that is *not* an actual file (a file-like object, an
+    `mmap` or a `memoryview`) is rewound to its start, because Mutagen
+    doesn't seek before it reads; a filething with a filename is
+    reopened and a new object is returned.
     """
     if filething.filename:
         return mutagen._util.FileThing(None, filething.filename, filething.name)
     else:
+        filething.fileobj.seek(0)
         return filething
 
 
+# Get a number from the front of a string.
+_INT_PATTERN = re.compile(r"\s*([\+-]?[0-9]+)")
+_FLOAT_PATTERN = re.compile(r"\s*([\+-]?([0-9]+\.?[0-9]*|[0-9]*\.[0-9]+))")
+
+
+def _cast_to_int(val):
+    if type(val) is int:
+        return val
+    if isinstance(val, int) or isinstance(val, float):
+        # Just a number.
+        return int(val)
+    # Process any other type as a string.
+    if isinstance(val, bytes):
+        val = val.decode("utf-8", "ignore")
+    elif not isinstance(val, str):
+        val = str(val)
+    match = _INT_PATTERN.match(val)
+    return int(match.group(1)) if match else 0
+
+
+def _cast_to_bool(val):
+    if type(val) is bool:
+        return val
+    try:
+        # Should work for strings, bools, ints:
+        return bool(int(val))
+    except ValueError:
+        return False
+
+
+def _cast_to_str(val):
+    if type(val) is str:
+        return val
+    if isinstance(val, bytes):
+        return val.decode("utf-8", "ignore")
+    elif isinstance(val, str):
+        return val
+    else:
+        return str(val)
+
+
+def _cast_to_float(val):
+    if type(val) is float:
+        return val
+    if isinstance(val, int) or isinstance(val, float):
+        return float(val)
+    if isinstance(val, bytes):
+        val = val.decode("utf-8", "ignore")
+    else:
+        val = str(val)
+    match = _FLOAT_PATTERN.match(val)
+    if match:
+        return float(match.group(1))
+    return 0.0
+
+
+def _pass_through(val):
+    return val
+
+
+_CASTS = {
+    int: _cast_to_int,
+    bool: _cast_to_bool,
+    str: _cast_to_str,
+    float: _cast_to_float,
+}
+
+
+def _caster(out_type):
+    """Get the function that converts a value (never None) to
+    `out_type` like `_safe_cast`.
+    """
+    return _CASTS.get(out_type, _pass_through)
+
+
 def _safe_cast(out_type, val):
     """Try to covert val to out_type but never raise an exception.
 
@@ -192,81 +338,166 @@ def _safe_cast(out_type, val):
     """
     if val is None:
         return None
+    return _caster(out_type)(val)
 
-    if out_type is int:
-        if isinstance(val, int) or isinstance(val, float):
-            # Just a number.
-            return int(val)
-        else:
-            # Process any other type as a string.
-            if isinstance(val, bytes):
-                val = val.decode("utf-8", "ignore")
-            elif not isinstance(val, str):
-                val = str(val)
-            # Get a number from the front of the string.
-            match = re.match(r"[\+-]?[0-9]+", val.strip())
-            return int(match.group(0)) if match else 0
-
-    elif out_type is bool:
+
+# Indexing ID3 frames.
+
+
+class _ID3FrameIndex(object):
+    """Maps the lowercase descriptions (``desc``) and the people
+    involvements (``TIPL``/``TMCL``) of the frames in one ID3 tag to the
+    frames. The frames of a key are indexed on first access. The order
+    of ``tags.getall()`` is preserved for each name.
+    """
+
+    def __init__(self):
+        self.size = None
+        self.descs = {}
+        self.people = {}
+
+    def clear(self, size=None):
+        self.size = size
+        self.descs = {}
+        self.people = {}
+
+    def desc_frames(self, tags, key, desc):
         try:
-            # Should work for strings, bools, ints:
-            return bool(int(val))
-        except ValueError:
-            return False
+            frames = self.descs[key]
+        except KeyError:
+            frames = {}
+            for frame in tags.getall(key):
+                frames.setdefault(frame.desc.lower(), []).append(frame)
+            self.descs[key] = frames
+        return frames.get(desc.lower(), ())
 
-    elif out_type is str:
-        if isinstance(val, bytes):
-            return val.decode("utf-8", "ignore")
-        elif isinstance(val, str):
-            return val
-        else:
-            return str(val)
+    def people_frames(self, tags, key, involvement):
+        try:
+            frames = self.people[key]
+        except KeyError:
+            frames = {}
+            for frame in tags.getall(key):
+                for name in set(pair[0].lower() for pair in frame.people):
+                    frames.setdefault(name, []).append(frame)
+            self.people[key] = frames
+        return frames.get(involvement.lower(), ())
 
-    elif out_type is float:
-        if isinstance(val, int) or isinstance(val, float):
-            return float(val)
-        else:
-            if isinstance(val, bytes):
-                val = val.decode("utf-8", "ignore")
-            else:
-                val = str(val)
-            match = re.match(r"[\+-]?([0-9]+\.?[0-9]*|[0-9]*\.[0-9]+)", val.strip())
-            if match:
-                val = match.group(0)
-                if val:
-                    return float(val)
-            return 0.0
 
-    else:
-        return val
+# The indexes by `id()` of their tag. Mutagen's tags compare and hash
+# by their content, so a (weak) dictionary keyed by the tags themselves
+# would compare all frames on each lookup. An entry is removed when its
+# tag is garbage collected.
+_id3_indexes = {}
+
+
+def _frame_count(tags):
+    """Get the number of frame keys of an ID3 tag.
+
+    Mutagen's ``len()`` builds the list of all keys first; the
+    dictionary behind the tag is used directly where possible.
+    """
+    frames = getattr(tags, "_DictProxy__dict", None)
+    if frames is None:
+        return len(tags)
+    return len(frames)
+
+
+def _id3_index(tags):
+    """Get the `_ID3FrameIndex` of a loaded ID3 tag.
+
+    The storage styles drop the index with `_invalidate_id3_index` when
+    they add or remove frames. As a safety net for changes made directly
+    through Mutagen, the index is also rebuilt when the number of frames
+    differs from the number at build time.
+    """
+    key = id(tags)
+    index = _id3_indexes.get(key)
+    if index is None:
+        index = _id3_indexes[key] = _ID3FrameIndex()
+        weakref.finalize(tags, _id3_indexes.pop, key, None)
+    size = _frame_count(tags)
+    if index.size != size:
+        index.clear(size)
+    return index
+
+
+def _invalidate_id3_index(tags):
+    """Drop the frame index of an ID3 tag after it has been modified."""
+    index = _id3_indexes.get(id(tags))
+    if index is not None:
+        index.clear()
 
 
 # Image coding for ASF/WMA.
 
 
+def _find_utf16_terminator(data, start):
+    """Find the two-byte null terminator of an UTF-16 string starting at
+    `start`. Only terminators at even distances from `start` count; a
+    null byte pair straddling two characters is skipped. Return -1 if
+    there is no terminator.
+    """
+    pos = data.find(b"\x00\x00", start)
+    while pos != -1 and (pos - start) % 2:
+        pos = data.find(b"\x00\x00", pos + 1)
+    return pos
+
+
 def _unpack_asf_image(data):
     """Unpack image data from a WM/Picture tag. Return a tuple
-    containing the MIME type, the raw image data, a type indicator, and
-    the image's description.
+    containing the MIME type, a view of the raw image data, a type
+    indicator, and the image's description.
 
-    This function is treated as "untrusted" and could throw all manner
-    of exceptions (out-of-bounds, etc.). We should clean this up
-    sometime so that the failure modes are well-defined.
+    The structure is a type byte, the size of the image as a 32 bit
+    integer, the null terminated UTF-16 MIME type and description and
+    the image. Raise `ImageDecodeError` if the data doesn't match this
+    structure.
     """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    if len(data) < 5:
+        raise ImageDecodeError("WM/Picture header truncated")
     type, size = struct.unpack_from("<bi", data)
+    if size < 0:
+        raise ImageDecodeError("negative WM/Picture size {0}".format(size))
+
+    strings = []
     pos = 5
-    mime = b""
-    while data[pos : pos + 2] != b"\x00\x00":
-        mime += data[pos : pos + 2]
-        pos += 2
-    pos += 2
-    description = b""
-    while data[pos : pos + 2] != b"\x00\x00":
-        description += data[pos : pos + 2]
-        pos += 2
-    pos += 2
-    image_data = data[pos : pos + size]
-    return (mime.decode("utf-16-le"), image_data, type, description.decode("utf-16-le"))
+    for name in ("MIME type", "description"):
+        end = _find_utf16_terminator(data, pos)
+        if end == -1:
+            raise ImageDecodeError("WM/Picture {0} not terminated".format(name))
+        strings.append(data[pos:end].decode("utf-16-le", "replace"))
+        pos = end + 2
+
+    if pos + size > len(data):
+        raise ImageDecodeError(
+            "WM/Picture data truncated: {0} of {1} bytes".format(
+                len(data) - pos, size
+            )
+        )
+    # A view of the image, not a copy.
+    image_data = memoryview(data)[pos : pos + size]
+    return strings[0], image_data, type, strings[1]
+
+
+def _unpack_flac_picture(data):
+    """Unpack a FLAC picture block as stored base64-encoded in a
+    METADATA_BLOCK_PICTURE Vorbis comment. Return a tuple containing the
+    type, the description and a view of the image data.
+
+    Works like `mutagen.flac.Picture` but without copying the image.
+    """
+    data = memoryview(data)
+    type, length = struct.unpack_from(">2I", data)
+    pos = 8 + length
+    (length,) = struct.unpack_from(">I", data, pos)
+    pos += 4
+    desc = str(data[pos : pos + length], "utf-8", "replace")
+    pos += length + 16
+    (length,) = struct.unpack_from(">I", data, pos)
+    pos += 4
+    return type, desc, data[pos : pos + length]
 
 
 def _pack_asf_image(mime, data, type=3, description=""):
@@ -348,15 +579,36 @@ def _sc_encode(gain, peak):
 # Cover art and other images.
 
 
+# The number of leading bytes `filetype` looks at.
+_IMAGE_SIGNATURE_SIZE = 8192
+
+
+def _image_kind(data):
+    """Guess the `filetype` kind of image data from its magic bytes.
+    Only the prefix of the data is copied and inspected.
+    """
+    if isinstance(data, bytes):
+        prefix = data[:_IMAGE_SIGNATURE_SIZE]
+    else:
+        prefix = bytes(memoryview(data)[:_IMAGE_SIGNATURE_SIZE])
+    return filetype.guess(prefix)
+
+
+def _kind_extension(kind):
+    if kind is None:
+        return None
+    # imghdr returned "tiff", so we should keep returning it with filetype.
+    return kind.extension if kind.extension != "tif" else "tiff"
+
+
 def image_mime_type(data):
     """Return the MIME type of the image data (a bytestring)."""
-    return filetype.guess_mime(data)
+    kind = _image_kind(data)
+    return kind.mime if kind is not None else None
 
 
 def image_extension(data):
-    ext = filetype.guess_extension(data)
-    # imghdr returned "tiff", so we should keep returning it with filetype.
-    return ext if ext != "tif" else "tiff"
+    return _kind_extension(_image_kind(data))
 
 
 class ImageType(enum.Enum):
@@ -390,15 +642,23 @@ class Image(object):
     stored and retrieved from tags.
 
     The structure has four properties.
-    * ``data``  The binary data of the image
+    * ``data``  The binary data of the image. Either `bytes` or a
+                `memoryview` of the tag the image was read from.
     * ``desc``  An optional description of the image
     * ``type``  An instance of `ImageType` indicating the kind of image
     * ``mime_type`` Read-only property that contains the mime type of
                     the binary data
+    * ``extension`` Read-only property that contains the file extension
+                    matching the binary data
+
+    The MIME type and the extension are sniffed once and kept until
+    ``data`` is assigned again.
     """
 
+    __slots__ = ("_data", "desc", "type", "_kind", "_sniffed")
+
     def __init__(self, data, desc=None, type=None):
-        assert isinstance(data, bytes)
+        assert isinstance(data, (bytes, bytearray, memoryview))
         if desc is not None:
             assert isinstance(desc, str)
         self.data = data
@@ -411,10 +671,60 @@ class Image(object):
                 type = ImageType.other
         self.type = type
 
+    def __getstate__(self):
+        # Memory views can't be pickled.
+        return {
+            "_data": bytes(self._data),
+            "desc": self.desc,
+            "type": self.type,
+            "_kind": self._kind,
+            "_sniffed": self._sniffed,
+        }
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        # Images read from a tag are new objects on every access, so
+        # they are compared by value.
+        if not isinstance(other, Image):
+            return NotImplemented
+        return (
+            self.desc == other.desc
+            and self.type == other.type
+            and len(self._data) == len(other._data)
+            and bytes(self._data) == bytes(other._data)
+        )
+
+    # Images are mutable.
+    __hash__ = None
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._kind = None
+        self._sniffed = False
+
+    def _sniff(self):
+        if not self._sniffed:
+            self._kind = _image_kind(self._data) if self._data else None
+            self._sniffed = True
+        return self._kind
+
     @property
     def mime_type(self):
-        if self.data:
-            return image_mime_type(self.data)
+        kind = self._sniff()
+        if kind is not None:
+            return kind.mime
+
+    @property
+    def extension(self):
+        return _kind_extension(self._sniff())
 
     @property
     def type_index(self):
@@ -454,6 +764,8 @@ class StorageStyle(object):
     a given audio file.
     """
 
+    __slots__ = ("key", "as_type", "suffix", "float_places", "read_only")
+
     formats = [
         "FLAC",
         "OggOpus",
@@ -579,6 +891,8 @@ class ListStorageStyle(StorageStyle):
     handles packing and unpacking the values into lists.
     """
 
+    __slots__ = ()
+
     def get(self, mutagen_file):
         """Get the first value in the field's value list."""
         values = self.get_list(mutagen_file)
@@ -635,6 +949,8 @@ class SoundCheckStorageStyleMixin(object):
     represents.
     """
 
+    __slots__ = ()
+
     def get(self, mutagen_file):
         data = self.fetch(mutagen_file)
         if data is not None:
@@ -654,6 +970,8 @@ class SoundCheckStorageStyleMixin(object):
 class ASFStorageStyle(ListStorageStyle):
     """A general storage style for Windows Media/ASF files."""
 
+    __slots__ = ()
+
     formats = ["ASF"]
 
     def deserialize(self, data):
@@ -665,6 +983,8 @@ class ASFStorageStyle(ListStorageStyle):
 class MP4StorageStyle(StorageStyle):
     """A general storage style for MPEG-4 tags."""
 
+    __slots__ = ()
+
     formats = ["MP4"]
 
     def serialize(self, value):
@@ -679,6 +999,8 @@ class MP4TupleStorageStyle(MP4StorageStyle):
     MPEG-4 file.
     """
 
+    __slots__ = ("index",)
+
     def __init__(self, key, index=0, **kwargs):
         super(MP4TupleStorageStyle, self).__init__(key, **kwargs)
         self.index = index
@@ -712,10 +1034,14 @@ class MP4TupleStorageStyle(MP4StorageStyle):
 
 
 class MP4ListStorageStyle(ListStorageStyle, MP4StorageStyle):
+    __slots__ = ()
+
     pass
 
 
 class MP4SoundCheckStorageStyle(SoundCheckStorageStyleMixin, MP4StorageStyle):
+    __slots__ = ("index",)
+
     def __init__(self, key, index=0, **kwargs):
         super(MP4SoundCheckStorageStyle, self).__init__(key, **kwargs)
         self.index = index
@@ -726,6 +1052,8 @@ class MP4BoolStorageStyle(MP4StorageStyle):
     specifically for representing booleans.)
     """
 
+    __slots__ = ()
+
     def get(self, mutagen_file):
         try:
             return mutagen_file[self.key]
@@ -745,6 +1073,8 @@ class MP4BoolStorageStyle(MP4StorageStyle):
 class MP4ImageStorageStyle(MP4ListStorageStyle):
     """Store images as MPEG-4 image atoms. Values are `Image` objects."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super(MP4ImageStorageStyle, self).__init__(key="covr", **kwargs)
 
@@ -764,6 +1094,8 @@ class MP4ImageStorageStyle(MP4ListStorageStyle):
 class MP3StorageStyle(StorageStyle):
     """Store data in ID3 frames."""
 
+    __slots__ = ("id3_lang",)
+
     formats = ["MP3", "AIFF", "DSF", "WAVE"]
 
     def __init__(self, key, id3_lang=None, **kwargs):
@@ -782,17 +1114,26 @@ class MP3StorageStyle(StorageStyle):
     def store(self, mutagen_file, value):
         frame = mutagen.id3.Frames[self.key](encoding=3, text=[value])
         mutagen_file.tags.setall(self.key, [frame])
+        _invalidate_id3_index(mutagen_file.tags)
+
+    def delete(self, mutagen_file):
+        super(MP3StorageStyle, self).delete(mutagen_file)
+        _invalidate_id3_index(mutagen_file.tags)
 
 
 class MP3PeopleStorageStyle(MP3StorageStyle):
     """Store list of people in ID3 frames."""
 
+    __slots__ = ("involvement",)
+
     def __init__(self, key, involvement="", **kwargs):
         self.involvement = involvement
         super(MP3PeopleStorageStyle, self).__init__(key, **kwargs)
 
     def store(self, mutagen_file, value):
-        frames = mutagen_file.tags.getall(self.key)
+        frames = _id3_index(mutagen_file.tags).people_frames(
+            mutagen_file.tags, self.key, self.involvement
+        )
 
         # Try modifying in place.
         found = False
@@ -809,9 +1150,13 @@ class MP3PeopleStorageStyle(MP3StorageStyle):
                 encoding=mutagen.id3.Encoding.UTF8, people=[[self.involvement, value]]
             )
             mutagen_file.tags.add(frame)
+            _invalidate_id3_index(mutagen_file.tags)
 
     def fetch(self, mutagen_file):
-        for frame in mutagen_file.tags.getall(self.key):
+        frames = _id3_index(mutagen_file.tags).people_frames(
+            mutagen_file.tags, self.key, self.involvement
+        )
+        for frame in frames:
             for pair in frame.people:
                 if pair[0].lower() == self.involvement.lower():
                     try:
@@ -823,6 +1168,8 @@ class MP3PeopleStorageStyle(MP3StorageStyle):
 class MP3ListStorageStyle(ListStorageStyle, MP3StorageStyle):
     """Store lists of data in multiple ID3 frames."""
 
+    __slots__ = ()
+
     def fetch(self, mutagen_file):
         try:
             return mutagen_file[self.key].text
@@ -832,11 +1179,14 @@ class MP3ListStorageStyle(ListStorageStyle, MP3StorageStyle):
     def store(self, mutagen_file, values):
         frame = mutagen.id3.Frames[self.key](encoding=3, text=values)
         mutagen_file.tags.setall(self.key, [frame])
+        _invalidate_id3_index(mutagen_file.tags)
 
 
 class MP3UFIDStorageStyle(MP3StorageStyle):
     """Store string data in a UFID ID3 frame with a particular owner."""
 
+    __slots__ = ("owner",)
+
     def __init__(self, owner, **kwargs):
         self.owner = owner
         super(MP3UFIDStorageStyle, self).__init__("UFID:" + owner, **kwargs)
@@ -852,15 +1202,10 @@ class MP3UFIDStorageStyle(MP3StorageStyle):
         assert isinstance(value, str)
         value = value.encode("utf-8")
 
-        frames = mutagen_file.tags.getall(self.key)
-        for frame in frames:
-            # Replace existing frame data.
-            if frame.owner == self.owner:
-                frame.data = value
-        else:
-            # New frame.
-            frame = mutagen.id3.UFID(owner=self.owner, data=value)
-            mutagen_file.tags.setall(self.key, [frame])
+        # UFID frames are hashed by their owner, so the frame can be
+        # replaced directly without scanning the other frames.
+        mutagen_file.tags[self.key] = mutagen.id3.UFID(owner=self.owner, data=value)
+        _invalidate_id3_index(mutagen_file.tags)
 
 
 class MP3DescStorageStyle(MP3StorageStyle):
@@ -872,6 +1217,8 @@ class MP3DescStorageStyle(MP3StorageStyle):
     which means that the data is being packed in the list.
     """
 
+    __slots__ = ("description", "attr", "multispec")
+
     def __init__(self, desc="", key="TXXX", attr="text", multispec=True, **kwargs):
         assert isinstance(desc, str)
         self.description = desc
@@ -879,21 +1226,24 @@ class MP3DescStorageStyle(MP3StorageStyle):
         self.multispec = multispec
         super(MP3DescStorageStyle, self).__init__(key=key, **kwargs)
 
+    def _frames(self, mutagen_file):
+        """Get the frames whose description matches case-insensitively."""
+        return _id3_index(mutagen_file.tags).desc_frames(
+            mutagen_file.tags, self.key, self.description
+        )
+
     def store(self, mutagen_file, value):
-        frames = mutagen_file.tags.getall(self.key)
+        frames = self._frames(mutagen_file)
         if self.multispec:
             value = [value]
 
         # Try modifying in place.
-        found = False
         for frame in frames:
-            if frame.desc.lower() == self.description.lower():
-                setattr(frame, self.attr, value)
-                frame.encoding = mutagen.id3.Encoding.UTF8
-                found = True
+            setattr(frame, self.attr, value)
+            frame.encoding = mutagen.id3.Encoding.UTF8
 
         # Try creating a new frame.
-        if not found:
+        if not frames:
             frame = mutagen.id3.Frames[self.key](
                 desc=self.description,
                 encoding=mutagen.id3.Encoding.UTF8,
@@ -902,39 +1252,37 @@ class MP3DescStorageStyle(MP3StorageStyle):
             if self.id3_lang:
                 frame.lang = self.id3_lang
             mutagen_file.tags.add(frame)
+            _invalidate_id3_index(mutagen_file.tags)
 
     def fetch(self, mutagen_file):
-        for frame in mutagen_file.tags.getall(self.key):
-            if frame.desc.lower() == self.description.lower():
-                if not self.multispec:
-                    return getattr(frame, self.attr)
-                try:
-                    return getattr(frame, self.attr)[0]
-                except IndexError:
-                    return None
+        for frame in self._frames(mutagen_file):
+            if not self.multispec:
+                return getattr(frame, self.attr)
+            try:
+                return getattr(frame, self.attr)[0]
+            except IndexError:
+                return None
 
     def delete(self, mutagen_file):
-        found_frame = None
-        for frame in mutagen_file.tags.getall(self.key):
-            if frame.desc.lower() == self.description.lower():
-                found_frame = frame
-                break
-        if found_frame is not None:
-            del mutagen_file[frame.HashKey]
+        frames = self._frames(mutagen_file)
+        if frames:
+            del mutagen_file[frames[0].HashKey]
+            _invalidate_id3_index(mutagen_file.tags)
 
 
 class MP3ListDescStorageStyle(MP3DescStorageStyle, ListStorageStyle):
+    __slots__ = ("split_v23",)
+
     def __init__(self, desc="", key="TXXX", split_v23=False, **kwargs):
         self.split_v23 = split_v23
         super(MP3ListDescStorageStyle, self).__init__(desc=desc, key=key, **kwargs)
 
     def fetch(self, mutagen_file):
-        for frame in mutagen_file.tags.getall(self.key):
-            if frame.desc.lower() == self.description.lower():
-                if mutagen_file.tags.version == (2, 3, 0) and self.split_v23:
-                    return sum((el.split("/") for el in frame.text), [])
-                else:
-                    return frame.text
+        for frame in self._frames(mutagen_file):
+            if mutagen_file.tags.version == (2, 3, 0) and self.split_v23:
+                return sum((el.split("/") for el in frame.text), [])
+            else:
+                return frame.text
         return []
 
     def store(self, mutagen_file, values):
@@ -947,6 +1295,7 @@ class MP3ListDescStorageStyle(MP3DescStorageStyle, ListStorageStyle):
         if self.id3_lang:
             frame.lang = self.id3_lang
         mutagen_file.tags.add(frame)
+        _invalidate_id3_index(mutagen_file.tags)
 
 
 class MP3SlashPackStorageStyle(MP3StorageStyle):
@@ -954,6 +1303,8 @@ class MP3SlashPackStorageStyle(MP3StorageStyle):
     separated string.
     """
 
+    __slots__ = ("pack_pos",)
+
     def __init__(self, key, pack_pos=0, **kwargs):
         super(MP3SlashPackStorageStyle, self).__init__(key, **kwargs)
         self.pack_pos = pack_pos
@@ -994,6 +1345,8 @@ class MP3ImageStorageStyle(ListStorageStyle, MP3StorageStyle):
     list of ``Image``s as its ``values`` argument.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(MP3ImageStorageStyle, self).__init__(key="APIC")
         self.as_type = bytes
@@ -1007,15 +1360,17 @@ class MP3ImageStorageStyle(ListStorageStyle, MP3StorageStyle):
 
     def store(self, mutagen_file, frames):
         mutagen_file.tags.setall(self.key, frames)
+        _invalidate_id3_index(mutagen_file.tags)
 
     def delete(self, mutagen_file):
         mutagen_file.tags.delall(self.key)
+        _invalidate_id3_index(mutagen_file.tags)
 
     def serialize(self, image):
         """Return an APIC frame populated with data from ``image``."""
         assert isinstance(image, Image)
         frame = mutagen.id3.Frames[self.key]()
-        frame.data = image.data
+        frame.data = bytes(image.data)
         frame.mime = image.mime_type
         frame.desc = image.desc or ""
 
@@ -1033,6 +1388,8 @@ class MP3ImageStorageStyle(ListStorageStyle, MP3StorageStyle):
 
 
 class MP3SoundCheckStorageStyle(SoundCheckStorageStyleMixin, MP3DescStorageStyle):
+    __slots__ = ("index",)
+
     def __init__(self, index=0, **kwargs):
         super(MP3SoundCheckStorageStyle, self).__init__(**kwargs)
         self.index = index
@@ -1043,11 +1400,26 @@ class ASFImageStorageStyle(ListStorageStyle):
     Values are `Image` objects.
     """
 
+    __slots__ = ()
+
     formats = ["ASF"]
 
     def __init__(self):
         super(ASFImageStorageStyle, self).__init__(key="WM/Picture")
 
+    def get_list(self, mutagen_file):
+        """Get the images, skipping the malformed ones."""
+        raw_values = self.fetch(mutagen_file)
+        if raw_values is None:
+            return None
+        images = []
+        for asf_picture in raw_values:
+            try:
+                images.append(self.deserialize(asf_picture))
+            except ImageDecodeError as exc:
+                log.debug("skipping malformed WM/Picture: %s", exc)
+        return images
+
     def deserialize(self, asf_picture):
         mime, data, type, desc = _unpack_asf_image(asf_picture.value)
         return Image(data, desc=desc, type=type)
@@ -1069,6 +1441,8 @@ class VorbisImageStorageStyle(ListStorageStyle):
     base64-encoded. Values are `Image` objects.
     """
 
+    __slots__ = ()
+
     formats = ["OggOpus", "OggTheora", "OggSpeex", "OggVorbis", "OggFlac"]
 
     def __init__(self):
@@ -1085,10 +1459,10 @@ class VorbisImageStorageStyle(ListStorageStyle):
             return images
         for data in mutagen_file["metadata_block_picture"]:
             try:
-                pic = mutagen.flac.Picture(base64.b64decode(data))
-            except (TypeError, AttributeError):
+                type, desc, image_data = _unpack_flac_picture(base64.b64decode(data))
+            except (TypeError, AttributeError, binascii.Error, struct.error):
                 continue
-            images.append(Image(data=pic.data, desc=pic.desc, type=pic.type))
+            images.append(Image(data=image_data, desc=desc, type=type))
         return images
 
     def store(self, mutagen_file, image_data):
@@ -1102,7 +1476,7 @@ class VorbisImageStorageStyle(ListStorageStyle):
     def serialize(self, image):
         """Turn a Image into a base64 encoded FLAC picture block."""
         pic = mutagen.flac.Picture()
-        pic.data = image.data
+        pic.data = bytes(image.data)
         pic.type = image.type_index
         pic.mime = image.mime_type
         pic.desc = image.desc or ""
@@ -1116,6 +1490,8 @@ class VorbisImageStorageStyle(ListStorageStyle):
 class FlacImageStorageStyle(ListStorageStyle):
     """Converts between ``mutagen.flac.Picture`` and ``Image`` instances."""
 
+    __slots__ = ()
+
     formats = ["FLAC"]
 
     def __init__(self):
@@ -1138,7 +1514,7 @@ class FlacImageStorageStyle(ListStorageStyle):
     def serialize(self, image):
         """Turn a Image into a mutagen.flac.Picture."""
         pic = mutagen.flac.Picture()
-        pic.data = image.data
+        pic.data = bytes(image.data)
         pic.type = image.type_index
         pic.mime = image.mime_type
         pic.desc = image.desc or ""
@@ -1152,6 +1528,8 @@ class FlacImageStorageStyle(ListStorageStyle):
 class APEv2ImageStorageStyle(ListStorageStyle):
     """Store images in APEv2 tags. Values are `Image` objects."""
 
+    __slots__ = ()
+
     formats = ["APEv2File", "WavPack", "Musepack", "MonkeysAudio", "OptimFROG"]
 
     TAG_NAMES = {
@@ -1192,7 +1570,8 @@ class APEv2ImageStorageStyle(ListStorageStyle):
                     comment = comment.decode("utf-8", "replace")
                 else:
                     comment = None
-                image_data = frame.value[text_delimiter_index + 1 :]
+                # A view of the image, not a copy.
+                image_data = memoryview(frame.value)[text_delimiter_index + 1 :]
                 images.append(Image(data=image_data, type=cover_type, desc=comment))
             except KeyError:
                 pass
@@ -1228,6 +1607,8 @@ class MediaField(object):
     field.
     """
 
+    __slots__ = ("_out_type", "_cast", "_styles", "_format_styles")
+
     def __init__(self, *styles, **kwargs):
         """Creates a new MediaField.
 
@@ -1242,14 +1623,37 @@ class MediaField(object):
         """
         self.out_type = kwargs.get("out_type", str)
         self._styles = styles
+        self._format_styles = {}
+
+    @property
+    def out_type(self):
+        return self._out_type
+
+    @out_type.setter
+    def out_type(self, out_type):
+        # The conversion function is selected once per field.
+        self._out_type = out_type
+        self._cast = _caster(out_type)
 
     def styles(self, mutagen_file):
-        """Yields the list of storage styles of this field that can
+        """Returns the tuple of storage styles of this field that can
         handle the MediaFile's format.
+
+        The styles are selected once per Mutagen class and then looked
+        up in a cache, so that reading a field only costs the tag
+        lookups.
         """
-        for style in self._styles:
-            if mutagen_file.__class__.__name__ in style.formats:
-                yield style
+        mutagen_class = mutagen_file.__class__
+        try:
+            return self._format_styles[mutagen_class]
+        except KeyError:
+            styles = tuple(
+                style
+                for style in self._styles
+                if mutagen_class.__name__ in style.formats
+            )
+            self._format_styles[mutagen_class] = styles
+            return styles
 
     def __get__(self, mediafile, owner=None):
         out = None
@@ -1257,16 +1661,20 @@ class MediaField(object):
             out = style.get(mediafile.mgfile)
             if out:
                 break
-        return _safe_cast(self.out_type, out)
+        if out is None:
+            return None
+        return self._cast(out)
 
     def __set__(self, mediafile, value):
         if value is None:
             value = self._none_value()
+        mediafile._mark_changed(self)
         for style in self.styles(mediafile.mgfile):
             if not style.read_only:
                 style.set(mediafile.mgfile, value)
 
     def __delete__(self, mediafile):
+        mediafile._mark_changed(self)
         for style in self.styles(mediafile.mgfile):
             style.delete(mediafile.mgfile)
 
@@ -1292,14 +1700,18 @@ class ListMediaField(MediaField):
     strategies to do the actual work.
     """
 
+    __slots__ = ()
+
     def __get__(self, mediafile, _=None):
         for style in self.styles(mediafile.mgfile):
             values = style.get_list(mediafile.mgfile)
             if values:
-                return [_safe_cast(self.out_type, value) for value in values]
+                cast = self._cast
+                return [None if value is None else cast(value) for value in values]
         return None
 
     def __set__(self, mediafile, values):
+        mediafile._mark_changed(self)
         for style in self.styles(mediafile.mgfile):
             if not style.read_only:
                 style.set_list(mediafile.mgfile, values)
@@ -1322,6 +1734,8 @@ class DateField(MediaField):
     methods to create corresponding `DateItemField`s.
     """
 
+    __slots__ = ("_year_field",)
+
     def __init__(self, *date_styles, **kwargs):
         """``date_styles`` is a list of ``StorageStyle``s to store and
         retrieve the whole date from. The ``year`` option is an
@@ -1358,7 +1772,19 @@ class DateField(MediaField):
         """Get a 3-item sequence representing the date consisting of a
         year, month, and day number. Each number is either an integer or
         None.
+
+        The date is parsed once per `MediaFile` and kept until a field
+        of the file is written.
         """
+        try:
+            return list(mediafile._date_tuples[self])
+        except KeyError:
+            pass
+        items = self._parse_date_tuple(mediafile)
+        mediafile._date_tuples[self] = tuple(items)
+        return items
+
+    def _parse_date_tuple(self, mediafile):
         # Get the underlying data and split on hyphens and slashes.
         datestring = super(DateField, self).__get__(mediafile, None)
         if isinstance(datestring, str):
@@ -1393,19 +1819,27 @@ class DateField(MediaField):
         """
         if year is None:
             self.__delete__(mediafile)
+            mediafile._date_tuples[self] = (None, None, None)
             return
 
-        date = ["{0:04d}".format(int(year))]
+        items = [int(year), None, None]
+        date = ["{0:04d}".format(items[0])]
         if month:
-            date.append("{0:02d}".format(int(month)))
+            items[1] = int(month)
+            date.append("{0:02d}".format(items[1]))
         if month and day:
-            date.append("{0:02d}".format(int(day)))
-        date = map(str, date)
+            items[2] = int(day)
+            date.append("{0:02d}".format(items[2]))
         super(DateField, self).__set__(mediafile, "-".join(date))
 
         if hasattr(self, "_year_field"):
             self._year_field.__set__(mediafile, year)
 
+        # The tuple as it would be parsed from the written tags, so that
+        # setting the year, month and day one after the other doesn't
+        # parse the date again.
+        mediafile._date_tuples[self] = tuple(items)
+
     def year_field(self):
         return DateItemField(self, 0)
 
@@ -1421,6 +1855,8 @@ class DateItemField(MediaField):
     the month, day, or year.
     """
 
+    __slots__ = ("date_field", "item_pos")
+
     def __init__(self, date_field, item_pos):
         self.date_field = date_field
         self.item_pos = item_pos
@@ -1430,6 +1866,7 @@ class DateItemField(MediaField):
 
     def __set__(self, mediafile, value):
         items = self.date_field._get_date_tuple(mediafile)
+        mediafile._mark_changed(self)
         items[self.item_pos] = value
         self.date_field._set_date_tuple(mediafile, *items)
 
@@ -1446,13 +1883,15 @@ class CoverArtField(MediaField):
     cover.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
     def __get__(self, mediafile, _):
         candidates = mediafile.images
         if candidates:
-            return self.guess_cover_image(candidates).data
+            return bytes(self.guess_cover_image(candidates).data)
         else:
             return None
 
@@ -1466,12 +1905,14 @@ class CoverArtField(MediaField):
             return candidates[0]
 
     def __set__(self, mediafile, data):
+        mediafile._mark_changed(self)
         if data:
             mediafile.images = [Image(data=data)]
         else:
             mediafile.images = []
 
     def __delete__(self, mediafile):
+        mediafile._mark_changed(self)
         delattr(mediafile, "images")
 
 
@@ -1483,6 +1924,8 @@ class QNumberField(MediaField):
     simple integer.
     """
 
+    __slots__ = ("__fraction_bits",)
+
     def __init__(self, fraction_bits, *args, **kwargs):
         super(QNumberField, self).__init__(out_type=int, *args, **kwargs)
         self.__fraction_bits = fraction_bits
@@ -1507,6 +1950,8 @@ class ImageListField(ListMediaField):
     written to the tags.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         # The storage styles used here must implement the
         # `ListStorageStyle` interface and get and set lists of
@@ -1521,6 +1966,120 @@ class ImageListField(ListMediaField):
             out_type=Image,
         )
 
+    def __get__(self, mediafile, _=None):
+        mediafile._load_images()
+        return super(ImageListField, self).__get__(mediafile, _)
+
+    def __set__(self, mediafile, values):
+        # Not every image style of a format replaces all image tags (a
+        # FLAC file only writes picture blocks, not Vorbis picture
+        # comments), so the images left out by ``load_images=False``
+        # have to be restored first.
+        mediafile._load_images()
+        super(ImageListField, self).__set__(mediafile, values)
+
+    def __delete__(self, mediafile):
+        mediafile._load_images()
+        super(ImageListField, self).__delete__(mediafile)
+
+
+# Keeping images out of memory.
+
+_IMAGE_TAG_KEYS = frozenset(
+    ("covr", "wm/picture", "metadata_block_picture", "coverart", "coverartmime")
+)
+
+
+def _image_tag_keys(tags):
+    """Get the keys of all tag items that contain images (or, in case of
+    ``coverartmime``, belong to them), except ID3 ``APIC`` frames.
+
+    The keys are matched exactly, so that text tags such as
+    ``COVERARTIST`` are kept. Only the APEv2 keys ``Cover Art (<type>)``
+    are matched by their prefix.
+    """
+    keys = []
+    for key in tags.keys():
+        lower = key.lower()
+        if lower in _IMAGE_TAG_KEYS or lower.startswith("cover art ("):
+            keys.append(key)
+    return keys
+
+
+def _replace_images(target, source=None):
+    """Remove all embedded images from the Mutagen file object `target`.
+    If `source`, a Mutagen file object of the same file, is given, its
+    images are copied into `target`.
+
+    This covers ID3 ``APIC`` frames, MPEG-4 ``covr`` atoms, ASF
+    ``WM/Picture`` attributes, Vorbis ``METADATA_BLOCK_PICTURE`` and
+    ``COVERART`` comments, FLAC picture blocks and APEv2 ``Cover Art``
+    items.
+    """
+    if isinstance(target, mutagen.flac.FLAC):
+        target.clear_pictures()
+        if source is not None:
+            for picture in source.pictures:
+                target.add_picture(picture)
+
+    tags = target.tags
+    if tags is None:
+        return
+    if isinstance(tags, mutagen.id3.ID3Tags):
+        tags.delall("APIC")
+        if source is not None:
+            tags.setall("APIC", source.tags.getall("APIC"))
+        _invalidate_id3_index(tags)
+        return
+
+    for key in _image_tag_keys(tags):
+        del tags[key]
+    if source is not None and source.tags is not None:
+        for key in _image_tag_keys(source.tags):
+            tags[key] = source.tags[key]
+
+
+# Padding of the tags.
+
+# The types whose tags (APEv2) are written without a padding function.
+_UNPADDED_TYPES = ("ape", "wv", "mpc")
+
+
+def reserve_padding(size=64 * 1024):
+    """Build a padding function that keeps the existing padding as long
+    as the tags fit into it and reserves `size` bytes of padding when
+    they don't.
+
+    Unlike Mutagen's default, the padding is never shrunk, so a save
+    only rewrites the file if the tags grew beyond their padding.
+    Pass the function as `padding` to `MediaFile` or `MediaFile.save`.
+    """
+
+    def padding(info):
+        if info.padding >= 0:
+            return info.padding
+        return size
+
+    return padding
+
+
+def proportional_padding(fraction=0.001, minimum=4096):
+    """Build a padding function that keeps the existing padding as long
+    as the tags fit into it. When they don't, it reserves `fraction` of
+    the size of the audio data, but at least `minimum` bytes.
+
+    The padding grows with the file: the larger the file (a long
+    audiobook, for example), the more expensive a rewrite and the more
+    padding is reserved to avoid the next one.
+    """
+
+    def padding(info):
+        if info.padding >= 0:
+            return info.padding
+        return max(minimum, int(info.size * fraction))
+
+    return padding
+
 
 # MediaFile is a collection of fields.
 
@@ -1530,21 +2089,74 @@ class MediaFile(object):
     metadata.
     """
 
+    __slots__ = (
+        "filething",
+        "mgfile",
+        "type",
+        "id3v23",
+        "_images_loaded",
+        "_changed",
+        "_date_tuples",
+        "padding",
+        "saved_in_place",
+        "__weakref__",
+    )
+
     @loadfile()
-    def __init__(self, filething, id3v23=False):
+    def __init__(
+        self,
+        filething,
+        id3v23=False,
+        load_images=True,
+        use_mmap=False,
+        padding=None,
+    ):
         """Constructs a new `MediaFile` reflecting the provided file.
 
-        `filething` can be a path to a file (i.e., a string) or a
-        file-like object.
+        `filething` can be a path to a file (i.e., a string), a
+        file-like object (including an `mmap`) or a `memoryview` of the
+        file contents. Files opened from a buffer can't be saved.
 
         May throw `UnreadableFileError`.
 
         By default, MP3 files are saved with ID3v2.4 tags. You can use
         the older ID3v2.3 standard by specifying the `id3v23` option.
+
+        If `load_images` is false, embedded images are dropped right
+        after the file is parsed and only read again from the file when
+        `images` or `art` is accessed or the file is saved.
+
+        If `use_mmap` is true, a file opened by its path is memory mapped
+        while it is parsed, so Mutagen's reads are served from the page
+        cache without buffered `read()` calls.
+
+        `padding` is the padding function used by `save`, for example
+        `reserve_padding()`. It is passed a Mutagen `PaddingInfo` and
+        returns the number of bytes of padding to leave after the tags.
+        By default, Mutagen's padding strategy is used.
         """
         self.filething = filething
-
-        self.mgfile = mutagen_call("open", self.filename, mutagen.File, filething)
+        self.padding = padding
+        # Whether the last save left the audio data where it was. `None`
+        # if the file hasn't been saved or the format can't tell.
+        self.saved_in_place = None
+        self._images_loaded = True
+        # The descriptors of the fields set or deleted since the file
+        # was opened or saved.
+        self._changed = set()
+        # The parsed date tuples of the `DateField`s.
+        self._date_tuples = {}
+
+        mapped = None
+        if use_mmap and filething.filename:
+            mapped = _mmap_filething(filething)
+        try:
+            self.mgfile = mutagen_call(
+                "open", self.filename, mutagen.File, mapped or filething
+            )
+        finally:
+            if mapped is not None:
+                mapped.fileobj.close()
 
         if self.mgfile is None:
             # Mutagen couldn't guess the type
@@ -1587,6 +2199,36 @@ class MediaFile(object):
         # Set the ID3v2.3 flag only for MP3s.
         self.id3v23 = id3v23 and self.type == "mp3"
 
+        if not load_images:
+            _replace_images(self.mgfile)
+            self._images_loaded = False
+
+    def _mark_changed(self, field):
+        """Record that the `MediaField` descriptor `field` has been set
+        or deleted. Every write drops the parsed date tuples, because
+        the tags they were parsed from may have changed.
+        """
+        self._changed.add(field)
+        self._date_tuples.clear()
+
+    def _load_images(self):
+        """Read the images left out by ``load_images=False`` from the
+        file again. May throw `UnreadableFileError`.
+        """
+        if self._images_loaded:
+            return
+        source = mutagen_call(
+            "open", self.filename, mutagen.File, _update_filething(self.filething)
+        )
+        if source is None:
+            # Don't silently drop the images with the empty source.
+            raise UnreadableFileError(
+                self.filename,
+                "{0!r}: images can't be read again".format(self.filename),
+            )
+        _replace_images(self.mgfile, source)
+        self._images_loaded = True
+
     @property
     def filename(self):
         """The name of the file.
@@ -1625,12 +2267,46 @@ class MediaFile(object):
             self.filething.fileobj.seek(tell)
             return filesize
 
-    def save(self, **kwargs):
+    def save(self, force=False, padding=None, **kwargs):
         """Write the object's tags back to the file.
 
+        Nothing is written if no field has been set or deleted since
+        the file was opened or last saved (see `changed_fields`). Pass
+        `force=True` to write the tags anyway, for example after
+        modifying `mgfile` directly or to convert the tags to ID3v2.3.
+
+        `padding` overrides the padding function passed to the
+        constructor for this save. Afterwards, `saved_in_place` tells
+        whether the tags fit into the space they had (`True`) or the
+        rest of the file had to be moved (`False`). APEv2 tags don't
+        support padding; for them it is `None`.
+
         May throw `UnreadableFileError`. Accepts keyword arguments to be
         passed to Mutagen's `save` function.
         """
+        if not force and not self._changed:
+            return
+
+        if padding is None:
+            padding = self.padding
+        in_place = []
+
+        def padding_function(info):
+            if padding is None:
+                new_padding = info.get_default_padding()
+            else:
+                new_padding = padding(info)
+            # The tags keep their size if the padding left after saving
+            # is used as is.
+            in_place.append(new_padding == info.padding)
+            return new_padding
+
+        if self.type not in _UNPADDED_TYPES:
+            kwargs["padding"] = padding_function
+
+        # Never write a file without the images left out on reading.
+        self._load_images()
+
         # Possibly save the tags to ID3v2.3.
         if self.id3v23:
             id3 = self.mgfile
@@ -1638,6 +2314,7 @@ class MediaFile(object):
                 # In case this is an MP3 object, not an ID3 object.
                 id3 = id3.tags
             id3.update_to_v23()
+            _invalidate_id3_index(id3)
             kwargs["v2_version"] = 3
 
         mutagen_call(
@@ -1647,6 +2324,23 @@ class MediaFile(object):
             _update_filething(self.filething),
             **kwargs,
         )
+        self.saved_in_place = all(in_place) if in_place else None
+        self._changed.clear()
+
+    def changed_fields(self):
+        """Get the names of the fields that have been set or deleted
+        since the file was opened or last saved, in the order of
+        `fields`.
+        """
+        cls = type(self)
+        changed = []
+        for field in cls.fields():
+            for klass in cls.__mro__:
+                if field in klass.__dict__:
+                    if klass.__dict__[field] in self._changed:
+                        changed.append(field)
+                    break
+        return changed
 
     def delete(self):
         """Remove the current metadata tag from the file. May
@@ -1746,13 +2440,19 @@ class MediaFile(object):
         method retrieves the corresponding value from `dict` and updates
         the `MediaFile`. If a key has the value `None`, the
         corresponding property is deleted from the `MediaFile`.
+
+        Fields that already have the value are left untouched, so
+        updating a file with its own values doesn't mark it as changed.
         """
         for field in self.sorted_fields():
             if field in dict:
-                if dict[field] is None:
-                    delattr(self, field)
-                else:
-                    setattr(self, field, dict[field])
+                value = dict[field]
+                current = getattr(self, field)
+                if value is None:
+                    if current is not None:
+                        delattr(self, field)
+                elif current is None or current != value:
+                    setattr(self, field, value)
 
     def as_dict(self):
         """Get a dictionary with all writable properties that reflect
@@ -1,12 +1,14 @@
 import datetime
 import enum
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Sequence
 from io import BufferedRandom, BufferedReader
+from mmap import mmap
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from typing import Any, ClassVar, Literal, Optional, Union
 
 from _typeshed import Incomplete
 from mutagen import FileType as MutagenFile
+from mutagen._tags import PaddingInfo
 
 __all__ = ["UnreadableFileError", "FileTypeError", "MediaFile"]
 
@@ -19,6 +21,8 @@ class FileTypeError(UnreadableFileError):
 class MutagenError(UnreadableFileError):
     def __init__(self, filename, mutagen_exc) -> None: ...
 
+class ImageDecodeError(ValueError): ...
+
 class ImageType(enum.Enum):
     other = 0
     icon = 1
@@ -49,8 +53,12 @@ class Image:
     def __init__(
         self, data, desc: Incomplete | None = None, type: Incomplete | None = None
     ) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+    @property
+    def mime_type(self) -> Optional[str]: ...
     @property
-    def mime_type(self): ...
+    def extension(self) -> Optional[str]: ...
     @property
     def type_index(self): ...
 
@@ -135,6 +143,7 @@ class MP3StorageStyle(StorageStyle):
     ) -> None: ...
     def fetch(self, mutagen_file: MutagenFile): ...
     def store(self, mutagen_file: MutagenFile, value: MutagenValue) -> None: ...
+    def delete(self, mutagen_file: MutagenFile) -> None: ...
 
 class MP3PeopleStorageStyle(MP3StorageStyle):
     involvement: Incomplete
@@ -230,7 +239,7 @@ class APEv2ImageStorageStyle(ListStorageStyle):
 class MediaField:
     out_type: Incomplete
     def __init__(self, *styles, **kwargs) -> None: ...
-    def styles(self, mutagen_file: MutagenFile) -> Generator[Incomplete]: ...
+    def styles(self, mutagen_file: MutagenFile) -> tuple[StorageStyle, ...]: ...
     def __get__(self, mediafile: MediaFile, owner: Incomplete | None = None): ...
     def __set__(self, mediafile: MediaFile, value: MutagenValue) -> None: ...
     def __delete__(self, mediafile: MediaFile) -> None: ...
@@ -278,25 +287,80 @@ FileThing = Union[
     Path,
     BufferedReader,  # open(..., 'rb')
     BufferedRandom,  # open(..., 'rb+')
+    mmap,
+    memoryview,
 ]
 
+PaddingFunction = Callable[[PaddingInfo], int]
+
+def reserve_padding(size: int = ...) -> PaddingFunction:
+    """Build a padding function that keeps the existing padding as long
+    as the tags fit into it and reserves `size` bytes of padding when
+    they don't.
+
+    Unlike Mutagen's default, the padding is never shrunk, so a save
+    only rewrites the file if the tags grew beyond their padding.
+    Pass the function as `padding` to `MediaFile` or `MediaFile.save`.
+    """
+    ...
+
+def proportional_padding(fraction: float = ..., minimum: int = ...) -> PaddingFunction:
+    """Build a padding function that keeps the existing padding as long
+    as the tags fit into it. When they don't, it reserves `fraction` of
+    the size of the audio data, but at least `minimum` bytes.
+
+    The padding grows with the file: the larger the file (a long
+    audiobook, for example), the more expensive a rewrite and the more
+    padding is reserved to avoid the next one.
+    """
+    ...
+
 class MediaFile:
-    def __init__(self, filething: FileThing, id3v23: bool = False) -> None:
+    def __init__(
+        self,
+        filething: FileThing,
+        id3v23: bool = False,
+        load_images: bool = True,
+        use_mmap: bool = False,
+        padding: Optional[PaddingFunction] = None,
+    ) -> None:
         """Constructs a new `MediaFile` reflecting the provided file.
 
-        `filething` can be a path to a file (i.e., a string) or a
-        file-like object.
+        `filething` can be a path to a file (i.e., a string), a
+        file-like object (including an `mmap`) or a `memoryview` of the
+        file contents. Files opened from a buffer can't be saved.
 
         May throw `UnreadableFileError`.
 
         By default, MP3 files are saved with ID3v2.4 tags. You can use
         the older ID3v2.3 standard by specifying the `id3v23` option.
+
+        If `load_images` is false, embedded images are dropped right
+        after the file is parsed and only read again from the file when
+        `images` or `art` is accessed or the file is saved.
+
+        If `use_mmap` is true, a file opened by its path is memory mapped
+        while it is parsed, so Mutagen's reads are served from the page
+        cache without buffered `read()` calls.
+
+        `padding` is the padding function used by `save`, for example
+        `reserve_padding()`. It is passed a Mutagen `PaddingInfo` and
+        returns the number of bytes of padding to leave after the tags.
+        By default, Mutagen's padding strategy is used.
         """
         ...
     __name__: str
 
     mgfile: MutagenFile
 
+    filething: Any
+
+    padding: Optional[PaddingFunction]
+
+    saved_in_place: Optional[bool]
+    """Whether the last save left the audio data where it was. `None`
+    if the file hasn't been saved or the format can't tell."""
+
     @property
     def filename(self) -> str:  # type: ignore
         """The name of the file.
@@ -320,14 +384,37 @@ class MediaFile:
         """The size (in bytes) of the underlying file."""
         ...
 
-    def save(self, **kwargs: Any) -> None:
+    def save(
+        self,
+        force: bool = False,
+        padding: Optional[PaddingFunction] = None,
+        **kwargs: Any,
+    ) -> None:
         """Write the object's tags back to the file.
 
+        Nothing is written if no field has been set or deleted since
+        the file was opened or last saved (see `changed_fields`). Pass
+        `force=True` to write the tags anyway, for example after
+        modifying `mgfile` directly or to convert the tags to ID3v2.3.
+
+        `padding` overrides the padding function passed to the
+        constructor for this save. Afterwards, `saved_in_place` tells
+        whether the tags fit into the space they had (`True`) or the
+        rest of the file had to be moved (`False`). APEv2 tags don't
+        support padding; for them it is `None`.
+
         May throw `UnreadableFileError`. Accepts keyword arguments to be
         passed to Mutagen's `save` function.
         """
         ...
 
+    def changed_fields(self) -> list[str]:
+        """Get the names of the fields that have been set or deleted
+        since the file was opened or last saved, in the order of
+        `fields`.
+        """
+        ...
+
     def delete(self) -> None:
         """Remove the current metadata tag from the file. May
         throw `UnreadableFileError`.
@@ -378,6 +465,9 @@ class MediaFile:
         method retrieves the corresponding value from `dict` and updates
         the `MediaFile`. If a key has the value `None`, the
         corresponding property is deleted from the `MediaFile`.
+
+        Fields that already have the value are left untouched, so
+        updating a file with its own values doesn't mark it as changed.
         """
         ...
 
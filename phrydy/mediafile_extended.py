@@ -1,40 +1,251 @@
-from typing import Any, Dict, Generator, Optional, Set, cast
+import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, cast
 
 from phrydy.mediafile import (
     ASFStorageStyle,
+    CoverArtField,
+    DateField,
+    DateItemField,
+    Image,
+    ImageListField,
+    ListMediaField,
     MediaField,
     MediaFile,
     MP3DescStorageStyle,
     MP3StorageStyle,
     MP4StorageStyle,
+    QNumberField,
     StorageStyle,
 )
 
+AUDIO_PROPERTIES: Dict[str, type] = {
+    "length": float,
+    "samplerate": int,
+    "bitdepth": int,
+    "bitrate": int,
+    "bitrate_mode": str,
+    "channels": int,
+    "encoder_info": str,
+    "encoder_settings": str,
+    "format": str,
+}
+"""The read-only audio properties and their types."""
+
+
+class FieldKind(NamedTuple):
+    """Describes what kind of values a field holds."""
+
+    name: str
+
+    out_type: type
+    """The type of the value (or of the list items, if :attr:`is_list`),
+    for example ``str``, ``int``, ``float``, ``bool``, ``bytes``,
+    :class:`datetime.date` or :class:`phrydy.mediafile.Image`."""
+
+    is_list: bool
+    """The value is a list (for example ``genres`` or ``images``)."""
+
+    is_date: bool
+    """A :class:`phrydy.mediafile.DateField` or one of its items (for
+    example ``date`` or ``year``)."""
+
+    is_image: bool
+    """``images`` or ``art``."""
+
+    is_q_number: bool
+    """A :class:`phrydy.mediafile.QNumberField` (``r128_*_gain``)."""
+
+    writable: bool
+    """``False`` for the audio properties like ``length`` or ``format``."""
+
+
+class FieldRegistry(NamedTuple):
+    """The precomputed field names and kinds of a media file class."""
+
+    fields: Tuple[str, ...]
+    sorted_fields: Tuple[str, ...]
+    readable_fields: Tuple[str, ...]
+    kinds: Mapping[str, FieldKind]
+
+
+def _field_kind(name: str, descriptor: MediaField) -> FieldKind:
+    out_type: type
+    if isinstance(descriptor, DateField):
+        out_type = datetime.date
+    elif isinstance(descriptor, DateItemField):
+        out_type = int
+    elif isinstance(descriptor, CoverArtField):
+        out_type = bytes
+    elif isinstance(descriptor, QNumberField):
+        out_type = float
+    else:
+        out_type = descriptor.out_type
+    return FieldKind(
+        name=name,
+        out_type=out_type,
+        is_list=isinstance(descriptor, ListMediaField),
+        is_date=isinstance(descriptor, (DateField, DateItemField)),
+        is_image=isinstance(descriptor, (ImageListField, CoverArtField)),
+        is_q_number=isinstance(descriptor, QNumberField),
+        writable=True,
+    )
+
+
+_snapshot_indexes: Dict[Tuple[str, ...], Dict[str, int]] = {}
+"""The positions of the values by field name, shared by all snapshots
+with the same fields."""
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Image):
+        # A copy of the data, because a view would keep the whole tag in
+        # memory.
+        return Image(bytes(value.data), value.desc, value.type)
+    return value
+
+
+class Snapshot(Mapping[str, Any]):
+    """An immutable record of the field values of an audio file.
+
+    A snapshot holds no reference to the Mutagen file, so it is much
+    smaller than a :class:`MediaFileExtended`. The field names are shared
+    by all snapshots with the same fields, only the values are stored per
+    snapshot. Lists are stored as tuples.
+
+    The values can be accessed as items or as attributes:
+
+        >>> snapshot["title"] == snapshot.title
+        True
+
+    :param path: The path of the audio file.
+    :param fields: The names of the fields.
+    :param values: The values in the order of ``fields``.
+    """
+
+    __slots__ = ("path", "_index", "_values")
+
+    path: str
+
+    def __init__(
+        self, path: str, fields: Tuple[str, ...], values: Tuple[Any, ...]
+    ) -> None:
+        if len(fields) != len(values):
+            raise ValueError("The number of fields and values differ.")
+        index = _snapshot_indexes.get(fields)
+        if index is None:
+            index = _snapshot_indexes[fields] = {
+                field: position for position, field in enumerate(fields)
+            }
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_values", values)
+
+    def __getitem__(self, field: str) -> Any:
+        return self._values[self._index[field]]
+
+    def __getattr__(self, field: str) -> Any:
+        if field.startswith("_"):
+            raise AttributeError(field)
+        try:
+            return self[field]
+        except KeyError:
+            raise AttributeError(
+                "{!r} object has no field {!r}".format(type(self).__name__, field)
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Snapshots are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Snapshots are immutable.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return "{}({!r}, {!r})".format(type(self).__name__, self.path, dict(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self.path, tuple(self._index), self._values)
+
 
 class MediaFileExtended(MediaFile):
+    __slots__ = ()
+
+    _field_registries: Dict[type, Tuple[Tuple[int, ...], FieldRegistry]] = {}
+    """The cached registries of this class and its subclasses together
+    with the sizes of the class dictionaries they were built from."""
+
+    @classmethod
+    def field_registry(cls) -> FieldRegistry:
+        """Get the precomputed field names and kinds of this class.
+
+        The registry is built on first use and dropped by
+        :meth:`add_field`. Fields added with ``MediaFile.add_field`` are
+        picked up too, because adding an attribute changes the size of
+        the class dictionaries.
+        """
+        classes = [c for c in reversed(cls.__mro__) if issubclass(c, MediaFile)]
+        sizes = tuple(len(c.__dict__) for c in classes)
+        cached = cls._field_registries.get(cls)
+        if cached is not None and cached[0] == sizes:
+            return cached[1]
+
+        # Fields overwritten in a subclass keep the position of the
+        # field in the base class.
+        descriptors: Dict[str, Any] = {}
+        for c in classes:
+            descriptors.update(c.__dict__)
+
+        kinds: Dict[str, FieldKind] = {}
+        for field, descriptor in descriptors.items():
+            if isinstance(descriptor, MediaField):
+                kinds[field] = _field_kind(field, descriptor)
+        fields = tuple(kinds)
+        for field, out_type in AUDIO_PROPERTIES.items():
+            kinds[field] = FieldKind(
+                field, out_type, False, False, False, False, writable=False
+            )
+
+        registry = FieldRegistry(
+            fields=fields,
+            sorted_fields=tuple(
+                sorted(MediaFile.fields(), key=MediaFile._field_sort_name)  # type: ignore
+            ),
+            readable_fields=fields + tuple(AUDIO_PROPERTIES),
+            kinds=MappingProxyType(kinds),
+        )
+        cls._field_registries[cls] = (sizes, registry)
+        return registry
+
+    @classmethod
+    def add_field(cls, name: str, descriptor: MediaField) -> None:
+        """Add a field to store custom tags.
+
+        :param name: the name of the property the field is accessed
+                     through. It must not already exist on this class.
+
+        :param descriptor: an instance of :class:`MediaField`.
+        """
+        super().add_field(name, descriptor)
+        cls._field_registries.clear()
+
     @classmethod
-    def fields(cls) -> Generator[str, None, None]:
+    def fields(cls) -> Tuple[str, ...]:  # type: ignore
         """Get the names of all writable properties that reflect
         metadata tags (i.e., those that are instances of
         :class:`MediaField`).
         """
-        seen: Set[str] = set()
-
-        # Same fields are duplicate because they are overwritten in this
-        # class.
-        f: Dict[str, Any] = {}
-        for field, descriptor in MediaFile.__dict__.items():
-            f[field] = descriptor
-        for field, descriptor in cls.__dict__.items():
-            f[field] = descriptor
-
-        for field, descriptor in f.items():
-            if isinstance(descriptor, MediaField) and field not in seen:
-                seen.add(field)
-                yield field
+        return cls.field_registry().fields
 
     @classmethod
-    def sorted_fields(cls):
+    def sorted_fields(cls) -> Tuple[str, ...]:  # type: ignore
         """Get the names of all writable metadata fields, sorted in the
         order that they should be written.
 
@@ -42,28 +253,43 @@ class MediaFileExtended(MediaFile):
         :class:`DateItemField`, which are sorted in year-month-day
         order.
         """
-        for property in sorted(MediaFile.fields(), key=MediaFile._field_sort_name):  # type: ignore
-            yield property
+        return cls.field_registry().sorted_fields
 
     @classmethod
-    def readable_fields(cls) -> Generator[str, None, None]:
+    def readable_fields(cls) -> Tuple[str, ...]:  # type: ignore
         """Get all metadata fields: the writable ones from
         :meth:`fields` and also other audio properties.
         """
-        for field in cls.fields():
-            yield field
-        for field in (
-            "length",
-            "samplerate",
-            "bitdepth",
-            "bitrate",
-            "bitrate_mode",
-            "channels",
-            "encoder_info",
-            "encoder_settings",
-            "format",
-        ):
-            yield field
+        return cls.field_registry().readable_fields
+
+    @classmethod
+    def field_kinds(cls) -> Mapping[str, FieldKind]:
+        """Get the :class:`FieldKind` of all readable fields."""
+        return cls.field_registry().kinds
+
+    def snapshot(self, images: bool = False) -> Snapshot:
+        """Read all :meth:`readable_fields` into a :class:`Snapshot` and
+        release the Mutagen file.
+
+        The Mutagen file holds the whole tag tree including the raw
+        frames and pictures. After the snapshot is taken, the Mutagen
+        file and the ``filething`` are dropped, so this object can’t be
+        used anymore.
+
+        :param images: Also read ``art`` and ``images``. The image data
+          is copied out of the tags.
+        """
+        kinds = self.field_kinds()
+        fields = tuple(
+            field
+            for field in self.readable_fields()
+            if images or not kinds[field].is_image
+        )
+        values = tuple(_freeze(getattr(self, field)) for field in fields)
+        snapshot = Snapshot(self.filename, fields, values)
+        del self.mgfile
+        del self.filething
+        return snapshot
 
     # albumartist_sort = MediaField(
     #     MP3DescStorageStyle(u'ALBUMARTISTSORT'),
@@ -125,7 +351,7 @@ class MediaFileExtended(MediaFile):
         str,
         MediaField(
             MP3DescStorageStyle("MusicBrainz Work Hierarchy Ids"),
-            MP4StorageStyle("----:com.apple.iTunes:" "MusicBrainz Work Hierarchy Ids"),
+            MP4StorageStyle("----:com.apple.iTunes:MusicBrainz Work Hierarchy Ids"),
             StorageStyle("MUSICBRAINZ_WORKHIERARCHY_IDS"),
             ASFStorageStyle("MusicBrainz/Work Hierarchy Ids"),
         ),
@@ -183,7 +409,7 @@ class MediaFileExtended(MediaFile):
         str,
         MediaField(
             MP3DescStorageStyle("MusicBrainz Release Group Types"),
-            MP4StorageStyle("----:com.apple.iTunes:" "MusicBrainz Release Group Types"),
+            MP4StorageStyle("----:com.apple.iTunes:MusicBrainz Release Group Types"),
             StorageStyle("MUSICBRAINZ_RELEASEGROUPTYPES"),
             ASFStorageStyle("MusicBrainz/Release Group Types"),
         ),
@@ -208,3 +434,14 @@ class MediaFileExtended(MediaFile):
         }
 
     """
+
+
+def read_record(path: str, images: bool = False) -> Snapshot:
+    """Read the fields of an audio file into a :class:`Snapshot`.
+
+    May throw :class:`phrydy.mediafile.UnreadableFileError`.
+
+    :param images: Also read ``art`` and ``images``. Otherwise the
+      embedded images are dropped right after the file is parsed.
+    """
+    return MediaFileExtended(path, load_images=images).snapshot(images)
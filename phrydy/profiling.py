@@ -0,0 +1,323 @@
+"""Opt-in timing and call counting of the fields and storage styles.
+
+While a :func:`profile` block is active, the methods ``__get__``,
+``__set__`` and ``__delete__`` of all :class:`phrydy.mediafile.MediaField`
+classes and ``fetch`` and ``store`` of all
+:class:`phrydy.mediafile.StorageStyle` classes are replaced by timing
+wrappers. Outside of the block the original methods are in place, so
+profiling costs nothing unless it is used.
+
+Usage:
+
+    >>> import phrydy
+    >>> with phrydy.profile() as stats:
+    ...     phrydy.MediaFileExtended("Lucy.mp3").as_dict()
+    >>> stats.dump(limit=10)
+
+The times are inclusive: the time of a field contains the time of its
+storage styles and of the fields it delegates to (``year`` to ``date``
+for example).
+"""
+
+import contextlib
+import sys
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+)
+
+from phrydy.mediafile import MediaField, StorageStyle
+
+FIELD_OPERATIONS = ("__get__", "__set__", "__delete__")
+
+STYLE_OPERATIONS = ("fetch", "store")
+
+
+class ProfileEntry:
+    """The cumulative values of one field or storage style operation."""
+
+    __slots__ = ("calls", "seconds", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.hits = 0
+        """Reads that produced a value."""
+        self.misses = 0
+        """Reads that produced no value."""
+
+    def add(self, seconds: float, hit: Optional[bool] = None) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        if hit is True:
+            self.hits += 1
+        elif hit is False:
+            self.misses += 1
+
+
+FieldKey = Tuple[str, str, str]
+"""The field name, the Mutagen class name and the operation."""
+
+StyleKey = Tuple[str, str, str, str]
+"""The field name, the Mutagen class name, the storage style and the
+operation."""
+
+
+class ProfileStats:
+    """The statistics collected by :func:`profile`.
+
+    A field read counts as a hit if one of its storage styles fetched a
+    value. A storage style fetch counts as a hit if the tag exists.
+    """
+
+    def __init__(self) -> None:
+        self.fields: Dict[FieldKey, ProfileEntry] = {}
+        self.styles: Dict[StyleKey, ProfileEntry] = {}
+
+    def _field_entry(self, key: FieldKey) -> ProfileEntry:
+        try:
+            return self.fields[key]
+        except KeyError:
+            entry = self.fields[key] = ProfileEntry()
+            return entry
+
+    def _style_entry(self, key: StyleKey) -> ProfileEntry:
+        try:
+            return self.styles[key]
+        except KeyError:
+            entry = self.styles[key] = ProfileEntry()
+            return entry
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the statistics as a JSON serializable dictionary."""
+        return {
+            "fields": [
+                {
+                    "field": field,
+                    "format": format,
+                    "operation": operation.strip("_"),
+                    "calls": entry.calls,
+                    "seconds": entry.seconds,
+                    "hits": entry.hits,
+                    "misses": entry.misses,
+                }
+                for (field, format, operation), entry in self.fields.items()
+            ],
+            "styles": [
+                {
+                    "field": field,
+                    "format": format,
+                    "style": style,
+                    "operation": operation,
+                    "calls": entry.calls,
+                    "seconds": entry.seconds,
+                    "hits": entry.hits,
+                    "misses": entry.misses,
+                }
+                for (field, format, style, operation), entry in self.styles.items()
+            ],
+        }
+
+    def dump(
+        self, output: Optional[TextIO] = None, limit: Optional[int] = None
+    ) -> None:
+        """Print the field and storage style operations sorted by their
+        cumulative time.
+
+        :param output: Defaults to :data:`sys.stdout`.
+        :param limit: Print only the slowest operations.
+        """
+        if output is None:
+            output = sys.stdout
+        stats = self.as_dict()
+        for section, columns in (
+            ("fields", ("field", "format", "operation")),
+            ("styles", ("field", "format", "style", "operation")),
+        ):
+            rows = sorted(stats[section], key=lambda row: row["seconds"], reverse=True)
+            output.write(
+                "{:>10} {:>8} {:>8} {:>8}  {}\n".format(
+                    "seconds", "calls", "hits", "misses", " ".join(columns)
+                )
+            )
+            for row in rows[:limit]:
+                output.write(
+                    "{:>10.6f} {:>8} {:>8} {:>8}  {}\n".format(
+                        row["seconds"],
+                        row["calls"],
+                        row["hits"],
+                        row["misses"],
+                        " ".join(row[column] for column in columns),
+                    )
+                )
+            output.write("\n")
+
+
+def _subclasses(cls: Type[Any]) -> List[Type[Any]]:
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        for c in _subclasses(subclass):
+            if c not in classes:
+                classes.append(c)
+    return classes
+
+
+def _style_name(style: StorageStyle) -> str:
+    return "{}({!r})".format(type(style).__name__, style.key)
+
+
+class _Profiler:
+    def __init__(self, stats: ProfileStats) -> None:
+        self.stats = stats
+        self.local = threading.local()
+        self.field_names: Dict[Tuple[type, int], str] = {}
+        self.originals: List[Tuple[type, str, Callable[..., Any]]] = []
+
+    def _state(self) -> Tuple[Set[Tuple[int, str]], List[List[Any]]]:
+        """The running operations (to skip calls through ``super()``) and
+        the stack of the running field operations of this thread."""
+        try:
+            return self.local.running, self.local.fields
+        except AttributeError:
+            self.local.running = set()
+            self.local.fields = []
+            return self.local.running, self.local.fields
+
+    def _field_name(self, descriptor: MediaField, mediafile: Any) -> str:
+        cls = type(mediafile)
+        key = (cls, id(descriptor))
+        try:
+            return self.field_names[key]
+        except KeyError:
+            pass
+        name = "<{}>".format(type(descriptor).__name__)
+        for klass in cls.__mro__:
+            for attribute, value in vars(klass).items():
+                if value is descriptor:
+                    name = attribute
+                    break
+            else:
+                continue
+            break
+        self.field_names[key] = name
+        return name
+
+    def _wrap_field(self, method: Callable[..., Any], operation: str) -> Any:
+        profiler = self
+
+        def wrapper(descriptor: MediaField, mediafile: Any, *args: Any) -> Any:
+            if mediafile is None:
+                return method(descriptor, mediafile, *args)
+            running, fields = profiler._state()
+            token = (id(descriptor), operation)
+            if token in running:
+                return method(descriptor, mediafile, *args)
+            # [field name, format, any style hit]
+            frame: List[Any] = [
+                profiler._field_name(descriptor, mediafile),
+                type(mediafile.mgfile).__name__,
+                False,
+            ]
+            running.add(token)
+            fields.append(frame)
+            start = time.perf_counter()
+            try:
+                return method(descriptor, mediafile, *args)
+            finally:
+                seconds = time.perf_counter() - start
+                fields.pop()
+                running.discard(token)
+                profiler.stats._field_entry((frame[0], frame[1], operation)).add(
+                    seconds, frame[2] if operation == "__get__" else None
+                )
+                if fields and frame[2]:
+                    fields[-1][2] = True
+
+        wrapper.__wrapped__ = method  # type: ignore
+        return wrapper
+
+    def _wrap_style(self, method: Callable[..., Any], operation: str) -> Any:
+        profiler = self
+
+        def wrapper(style: StorageStyle, mutagen_file: Any, *args: Any) -> Any:
+            running, fields = profiler._state()
+            token = (id(style), operation)
+            if token in running:
+                return method(style, mutagen_file, *args)
+            running.add(token)
+            start = time.perf_counter()
+            hit = None
+            try:
+                result = method(style, mutagen_file, *args)
+                if operation == "fetch":
+                    hit = result is not None
+                return result
+            finally:
+                seconds = time.perf_counter() - start
+                running.discard(token)
+                field = fields[-1][0] if fields else "<unknown>"
+                if hit and fields:
+                    fields[-1][2] = True
+                key = (
+                    field,
+                    type(mutagen_file).__name__,
+                    _style_name(style),
+                    operation,
+                )
+                profiler.stats._style_entry(key).add(seconds, hit)
+
+        wrapper.__wrapped__ = method  # type: ignore
+        return wrapper
+
+    def install(self) -> None:
+        for base, operations, wrap in (
+            (MediaField, FIELD_OPERATIONS, self._wrap_field),
+            (StorageStyle, STYLE_OPERATIONS, self._wrap_style),
+        ):
+            for cls in _subclasses(base):
+                for operation in operations:
+                    method = cls.__dict__.get(operation)
+                    if method is not None:
+                        self.originals.append((cls, operation, method))
+                        setattr(cls, operation, wrap(method, operation))
+
+    def uninstall(self) -> None:
+        for cls, operation, method in reversed(self.originals):
+            setattr(cls, operation, method)
+        self.originals = []
+
+
+_active: Optional[_Profiler] = None
+
+
+@contextlib.contextmanager
+def profile() -> Generator[ProfileStats, None, None]:
+    """Collect timing statistics of all field and storage style
+    operations inside the ``with`` block.
+
+    The instrumentation is process wide: operations of other threads
+    are recorded as well. Profiling blocks can’t be nested.
+
+    :return: The :class:`ProfileStats`, filled when the block exits.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("phrydy.profile() is already active")
+    stats = ProfileStats()
+    _active = _Profiler(stats)
+    _active.install()
+    try:
+        yield stats
+    finally:
+        _active.uninstall()
+        _active = None
@@ -0,0 +1,166 @@
+"""Conditions on the records of a :class:`phrydy.index.LibraryIndex`.
+
+The conditions are compiled into SQL and evaluated by SQLite on the
+stored records, so no audio file is opened. Conditions on the fields in
+:data:`phrydy.index.INDEXED_FIELDS` use an index.
+
+Usage:
+
+    >>> from phrydy.index import LibraryIndex
+    >>> from phrydy.query import equal, less
+    >>> with LibraryIndex("library.sqlite") as index:
+    ...     for path, record in index.query(
+    ...         less("original_year", 1970) & equal("format", "FLAC"),
+    ...         order_by=["albumartist", "-original_year"],
+    ...         limit=100,
+    ...     ):
+    ...         print(path, record["title"])
+
+A condition on a list field (for example ``genres``) is true if one of
+the list items matches it.
+"""
+
+import datetime
+from typing import Any, Tuple
+
+from phrydy.mediafile_extended import FieldKind, MediaFileExtended
+
+
+def field_expression(field: str) -> str:
+    """Get the SQL expression of a field of the stored records.
+
+    An index on a field must be created with exactly this expression,
+    otherwise SQLite doesn’t use it.
+
+    May throw :class:`ValueError` if ``field`` is not one of the
+    :meth:`MediaFileExtended.readable_fields`.
+    """
+    _field_kind(field)
+    return "json_extract(record, '$.{}')".format(field)
+
+
+def _field_kind(field: str) -> FieldKind:
+    kind = MediaFileExtended.field_kinds().get(field)
+    if kind is None:
+        raise ValueError("Unknown field {!r}.".format(field))
+    return kind
+
+
+def _is_list(field: str) -> bool:
+    return _field_kind(field).is_list
+
+
+def _sql_value(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        # Dates are stored as ISO 8601 strings.
+        return value.isoformat()
+    return value
+
+
+class Predicate:
+    """A condition on the fields of a record: an SQL expression and its
+    parameters.
+
+    Predicates are combined with ``&`` (and), ``|`` (or) and ``~``
+    (not). A missing value matches neither a condition nor its negation
+    in SQL; here, ``~`` is true for records without the value.
+    """
+
+    __slots__ = ("sql", "parameters")
+
+    def __init__(self, sql: str, parameters: Tuple[Any, ...] = ()) -> None:
+        self.sql = sql
+        self.parameters = parameters
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        return Predicate(
+            "({}) AND ({})".format(self.sql, other.sql),
+            self.parameters + other.parameters,
+        )
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        return Predicate(
+            "({}) OR ({})".format(self.sql, other.sql),
+            self.parameters + other.parameters,
+        )
+
+    def __invert__(self) -> "Predicate":
+        return Predicate("NOT coalesce(({}), 0)".format(self.sql), self.parameters)
+
+    def __repr__(self) -> str:
+        return "Predicate({!r}, {!r})".format(self.sql, self.parameters)
+
+
+def _condition(field: str, condition: str, *values: Any) -> Predicate:
+    """Build a predicate from a condition on ``value``, for example
+    ``"value = ?"``."""
+    parameters = tuple(_sql_value(value) for value in values)
+    if _is_list(field):
+        return Predicate(
+            "EXISTS (SELECT 1 FROM json_each(record, '$.{}') WHERE {})".format(
+                field, condition
+            ),
+            parameters,
+        )
+    return Predicate(
+        condition.replace("value", field_expression(field)),
+        parameters,
+    )
+
+
+def equal(field: str, value: Any) -> Predicate:
+    """The field is equal to ``value``. ``None`` is the same as
+    :func:`is_null`."""
+    if value is None:
+        return is_null(field)
+    return _condition(field, "value = ?", value)
+
+
+def less(field: str, value: Any) -> Predicate:
+    """The field is less than ``value``."""
+    return _condition(field, "value < ?", value)
+
+
+def less_equal(field: str, value: Any) -> Predicate:
+    """The field is less than or equal to ``value``."""
+    return _condition(field, "value <= ?", value)
+
+
+def greater(field: str, value: Any) -> Predicate:
+    """The field is greater than ``value``."""
+    return _condition(field, "value > ?", value)
+
+
+def greater_equal(field: str, value: Any) -> Predicate:
+    """The field is greater than or equal to ``value``."""
+    return _condition(field, "value >= ?", value)
+
+
+def between(field: str, low: Any, high: Any) -> Predicate:
+    """The field is between ``low`` and ``high``, both inclusive."""
+    return _condition(field, "value >= ? AND value <= ?", low, high)
+
+
+def prefix(field: str, text: str) -> Predicate:
+    """The field is a string starting with ``text``. The comparison is
+    case sensitive."""
+    if not text:
+        return _condition(field, "typeof(value) = 'text'")
+    # A range instead of LIKE, so that an index can be used.
+    upper = text[:-1] + chr(ord(text[-1]) + 1)
+    return _condition(field, "value >= ? AND value < ?", text, upper)
+
+
+def is_null(field: str) -> Predicate:
+    """The field has no value. A list field has no value if it is
+    empty."""
+    if _is_list(field):
+        return Predicate(
+            "coalesce(json_array_length(record, '$.{}'), 0) = 0".format(field)
+        )
+    return Predicate("{} IS NULL".format(field_expression(field)))
+
+
+def not_null(field: str) -> Predicate:
+    """The field has a value."""
+    return ~is_null(field)
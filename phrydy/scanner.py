@@ -0,0 +1,182 @@
+"""Read the metadata of many audio files in parallel.
+
+Usage:
+
+    >>> from phrydy import scan
+    >>> for result in scan("/music", workers=4):
+    ...     if result.error:
+    ...         print(result.path, result.error)
+    ...     else:
+    ...         print(result.path, result.record["title"])
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from phrydy.mediafile_extended import MediaFileExtended
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+IMAGE_FIELDS = ("art", "images")
+"""Fields that are skipped by default, because embedded artwork would
+have to be copied between the processes."""
+
+
+def default_fields() -> Tuple[str, ...]:
+    """All :meth:`MediaFileExtended.readable_fields` except the image
+    fields ``art`` and ``images``."""
+    return tuple(
+        field
+        for field in MediaFileExtended.readable_fields()
+        if field not in IMAGE_FIELDS
+    )
+
+
+class ScanResult(NamedTuple):
+    path: str
+    """The path of the audio file."""
+
+    record: Optional[Dict[str, Any]]
+    """The field values of the file or ``None`` if the file couldn’t be
+    read."""
+
+    error: Optional[Exception]
+    """The error raised while reading the file (for example a
+    :class:`phrydy.mediafile.FileTypeError` or a :class:`ValueError` of
+    a malformed tag) or ``None``."""
+
+
+def walk(
+    paths: Union[StrPath, Iterable[StrPath]],
+    extensions: Optional[Iterable[str]] = None,
+) -> Generator[str, None, None]:
+    """Yield the paths of all files below the given paths.
+
+    Directories are walked recursively in alphabetical order, files are
+    yielded as they are.
+
+    :param paths: A single path or an iterable of paths to files or
+      directories.
+    :param extensions: Only yield files with these extensions (for example
+      ``[".mp3", ".flac"]``). The comparison is case insensitive.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    suffixes: Optional[Tuple[str, ...]] = None
+    if extensions is not None:
+        suffixes = tuple(extension.lower() for extension in extensions)
+
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if suffixes is None or filename.lower().endswith(suffixes):
+                        yield os.path.join(dirpath, filename)
+        elif suffixes is None or path.lower().endswith(suffixes):
+            yield path
+
+
+ErrorInfo = Tuple[Type[Exception], str]
+"""The class and the message of an exception raised in a worker
+process."""
+
+
+def _read(
+    path: str, fields: Tuple[str, ...]
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[ErrorInfo]]:
+    """Read one file in a worker process.
+
+    The exceptions of the ``mediafile`` module can’t be pickled (their
+    constructors expect more arguments than they pass to
+    :class:`Exception`), so only the class and the message are sent back
+    to the parent process. Any exception is reported as the error of the
+    file, so that one broken file doesn’t stop the scan.
+    """
+    try:
+        # Don’t decode artwork that isn’t requested.
+        load_images = any(field in IMAGE_FIELDS for field in fields)
+        media_file = MediaFileExtended(path, load_images=load_images)
+        return path, {field: getattr(media_file, field) for field in fields}, None
+    except Exception as error:
+        return path, None, (type(error), str(error))
+
+
+def _restore_error(error: ErrorInfo) -> Exception:
+    """Rebuild an exception sent by a worker process."""
+    error_class, message = error
+    exception = error_class.__new__(error_class)
+    Exception.__init__(exception, message)
+    return exception
+
+
+def _to_result(
+    path: str,
+    record: Optional[Dict[str, Any]],
+    error: Optional[ErrorInfo],
+) -> ScanResult:
+    if error is None:
+        return ScanResult(path, record, None)
+    return ScanResult(path, None, _restore_error(error))
+
+
+def scan(
+    paths: Union[StrPath, Iterable[StrPath]],
+    workers: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None,
+    extensions: Optional[Iterable[str]] = None,
+) -> Generator[ScanResult, None, None]:
+    """Read the metadata of all audio files below ``paths`` using a pool of
+    worker processes.
+
+    The results are yielded in the order in which the files have been
+    read, not in the order of the paths. Only a small window of files is
+    in flight at any time, so the memory usage does not grow with the size
+    of the library.
+
+    :param paths: A single path or an iterable of paths to files or
+      directories. Directories are walked recursively.
+    :param workers: The number of worker processes. Defaults to the number
+      of CPUs. With ``1`` the files are read in the current process.
+    :param fields: The fields to read. Defaults to all
+      :meth:`MediaFileExtended.readable_fields` except ``art`` and
+      ``images``.
+    :param extensions: Only read files with these extensions (for example
+      ``[".mp3", ".flac"]``).
+    """
+    field_names = default_fields() if fields is None else tuple(fields)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    files = walk(paths, extensions)
+
+    if workers < 2:
+        for path in files:
+            yield _to_result(*_read(path, field_names))
+        return
+
+    window = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Set[Future[Any]] = set()
+        for path in files:
+            pending.add(executor.submit(_read, path, field_names))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _to_result(*future.result())
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _to_result(*future.result())
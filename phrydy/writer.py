@@ -0,0 +1,193 @@
+"""Write the metadata of many audio files in parallel without ever
+leaving a half-written file behind.
+
+Every file is written through a temporary copy in the same directory.
+The copy is tagged, flushed to disk and then renamed over the original,
+so after a crash the file is either unchanged or completely updated.
+
+Usage:
+
+    >>> from phrydy import write_many
+    >>> updates = [("Lucy.mp3", {"artist": "The Beatles"})]
+    >>> for result in write_many(updates, workers=4):
+    ...     if result.error:
+    ...         print(result.path, result.error)
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import ErrorInfo, StrPath, _restore_error
+
+
+class WriteResult(NamedTuple):
+    path: str
+    """The path of the audio file as passed to :func:`write_many`."""
+
+    changed: Optional[List[str]]
+    """The names of the changed fields (empty if the file already had
+    the values and was not written) or ``None`` if the file couldn’t be
+    written."""
+
+    error: Optional[Exception]
+    """The exception raised while writing the file, for example a
+    :class:`phrydy.mediafile.UnreadableFileError`, an :class:`OSError`
+    or a :class:`ValueError` for an invalid field value, or ``None``."""
+
+
+def _fsync_directory(directory: str) -> None:
+    # Make the rename durable. Directories can’t be opened on Windows.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _copy_metadata(source: str, target: str) -> None:
+    """Copy the permission bits, the timestamps, the flags and the
+    extended attributes and, as far as permitted, the owner and the
+    group of a file."""
+    shutil.copystat(source, target)
+    if not hasattr(os, "chown"):
+        return
+    stat = os.stat(source)
+    try:
+        os.chown(target, stat.st_uid, stat.st_gid)
+    except PermissionError:
+        try:
+            # Without privileges, the group can still be one of ours.
+            os.chown(target, -1, stat.st_gid)
+        except PermissionError:
+            pass
+
+
+def write_atomic(
+    path: StrPath, updates: Dict[str, Any], id3v23: bool = False
+) -> List[str]:
+    """Update the fields of an audio file (see
+    :meth:`phrydy.mediafile.MediaFile.update`) through a temporary copy.
+
+    The copy is created in the directory of the file, saved, synced to
+    disk and renamed over the file. If anything fails, the copy is
+    removed and the file is left unchanged. Files whose values are
+    already equal to ``updates`` are not copied. Symbolic links are
+    followed, the file they point to is replaced.
+
+    The copy gets the permissions, the extended attributes and (if
+    permitted) the owner of the file. As with a save in place, the
+    modification time is the time of the write.
+
+    May throw :class:`phrydy.mediafile.UnreadableFileError`,
+    :class:`OSError` or :class:`ValueError`.
+
+    :param id3v23: Save MP3 files with ID3v2.3 tags.
+
+    :return: The names of the changed fields.
+    """
+    path = os.path.realpath(path)
+    # Only to find the changed fields: the images are loaded on demand
+    # if ``updates`` contains them.
+    media_file = MediaFileExtended(path, id3v23=id3v23, load_images=False)
+    media_file.update(updates)
+    changed = media_file.changed_fields()
+    if not changed:
+        return changed
+
+    directory = os.path.dirname(path)
+    fd, temporary = tempfile.mkstemp(
+        dir=directory, prefix=".phrydy-", suffix=os.path.splitext(path)[1]
+    )
+    try:
+        with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+            shutil.copyfileobj(source, target)
+        _copy_metadata(path, temporary)
+        copy = MediaFileExtended(temporary, id3v23=id3v23)
+        copy.update(updates)
+        copy.save()
+        with open(temporary, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+    _fsync_directory(directory)
+    return changed
+
+
+def _write(
+    path: str, updates: Dict[str, Any], id3v23: bool
+) -> Tuple[str, Optional[List[str]], Optional[ErrorInfo]]:
+    """Write one file in a worker process. Errors are sent back as
+    class and message, see :func:`phrydy.scanner._read`."""
+    try:
+        return path, write_atomic(path, updates, id3v23), None
+    except Exception as error:
+        return path, None, (type(error), str(error))
+
+
+def _to_result(
+    path: str, changed: Optional[List[str]], error: Optional[ErrorInfo]
+) -> WriteResult:
+    if error is None:
+        return WriteResult(path, changed, None)
+    return WriteResult(path, None, _restore_error(error))
+
+
+def write_many(
+    updates: Iterable[Tuple[StrPath, Dict[str, Any]]],
+    workers: Optional[int] = None,
+    id3v23: bool = False,
+) -> Generator[WriteResult, None, None]:
+    """Update the fields of many audio files using a pool of worker
+    processes. Every file is written with :func:`write_atomic`.
+
+    The results are yielded in the order in which the files have been
+    written. A file that fails doesn’t stop the others, its error is
+    reported in its result. Only a small window of files is in flight
+    at any time, so ``updates`` can be a generator over a whole library.
+
+    :param updates: Pairs of a path and a dictionary of field values.
+    :param workers: The number of worker processes. Defaults to the number
+      of CPUs. With ``1`` the files are written in the current process.
+    :param id3v23: Save MP3 files with ID3v2.3 tags.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    jobs = ((os.fspath(path), values) for path, values in updates)
+
+    if workers < 2:
+        for path, values in jobs:
+            yield _to_result(*_write(path, values, id3v23))
+        return
+
+    window = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Set[Future[Any]] = set()
+        for path, values in jobs:
+            pending.add(executor.submit(_write, path, values, id3v23))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _to_result(*future.result())
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield _to_result(*future.result())
@@ -3,11 +3,19 @@ import shutil
 import sys
 import tempfile
 
+from phrydy.mediafile import Image, ImageType
 from phrydy.mediafile_extended import MediaFileExtended
 
 # Test resources path.
 TEST_RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "files")
 
+# A 1x1 pixel grayscale PNG image.
+PNG_DATA = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x00\x00\x00\x00:~\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00\x00\x02"
+    b"\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
 # OS feature test.
 HAVE_SYMLINK = sys.platform != "win32"
 
@@ -35,3 +43,14 @@ class TempDirMixin(object):
 
 def get_mediafile_extended(relpath: str) -> MediaFileExtended:
     return MediaFileExtended(os.path.join(TEST_RESOURCES_PATH, relpath))
+
+
+def copy_with_image(name: str) -> str:
+    """Copy a test file into a temporary directory and embed
+    :data:`PNG_DATA` as front cover."""
+    path = os.path.join(tempfile.mkdtemp(), name)
+    shutil.copyfile(os.path.join(TEST_RESOURCES_PATH, name), path)
+    media_file = MediaFileExtended(path)
+    media_file.images = [Image(PNG_DATA, desc="front", type=ImageType.front)]
+    media_file.save()
+    return path
@@ -0,0 +1,127 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from phrydy import aio
+from phrydy.mediafile import FileTypeError, UnreadableFileError
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import ScanResult, walk
+from tests import helper
+from tests.test_mediafile_extended import copy_to_tmp
+
+
+async def collect(*args: Any, **kwargs: Any) -> List[ScanResult]:
+    return [result async for result in aio.read_many(*args, **kwargs)]
+
+
+def test_read() -> None:
+    path = os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3")
+    record = asyncio.run(aio.read(path))
+    assert record["title"] == "full"
+    assert "art" not in record
+    assert asyncio.run(aio.read(path, fields=["album"])) == {"album": "the album"}
+
+
+def test_read_unreadable() -> None:
+    path = os.path.join(helper.TEST_RESOURCES_PATH, "..", "test_aio.py")
+    with pytest.raises(FileTypeError):
+        asyncio.run(aio.read(path))
+
+
+def test_write() -> None:
+    path = copy_to_tmp("full.mp3")
+    assert asyncio.run(aio.write(path, {"title": "new", "album": "the album"})) == [
+        "title"
+    ]
+    assert asyncio.run(aio.read(path, fields=["title"])) == {"title": "new"}
+
+
+def test_read_many() -> None:
+    results = asyncio.run(collect(helper.TEST_RESOURCES_PATH, concurrency=3))
+    assert len(results) == len(list(walk(helper.TEST_RESOURCES_PATH)))
+    assert sorted(r.path for r in results) == sorted(
+        r.path for r in asyncio.run(collect([helper.TEST_RESOURCES_PATH]))
+    )
+    for result in results:
+        if result.path.endswith("full.mp3"):
+            assert result.record and result.record["title"] == "full"
+
+
+def test_read_many_any_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    read = aio._read
+
+    def failing_read(path: str, fields: Any) -> Any:
+        if path.endswith("full.mp3"):
+            raise ValueError("malformed tag")
+        return read(path, fields)
+
+    monkeypatch.setattr(aio, "_read", failing_read)
+    paths = [
+        os.path.join(helper.TEST_RESOURCES_PATH, name)
+        for name in ("full.mp3", "mb.flac")
+    ]
+    results = {r.path: r for r in asyncio.run(collect(paths))}
+    assert isinstance(results[paths[0]].error, ValueError)
+    assert results[paths[0]].record is None
+    assert results[paths[1]].error is None
+
+
+def test_read_images_not_loaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    load_images: List[bool] = []
+
+    def open_file(path: str, **kwargs: Any) -> MediaFileExtended:
+        load_images.append(kwargs["load_images"])
+        return MediaFileExtended(path, **kwargs)
+
+    monkeypatch.setattr(aio, "MediaFileExtended", open_file)
+    path = helper.copy_with_image("mb.mp3")
+    asyncio.run(aio.read(path))
+    record = asyncio.run(aio.read(path, fields=["art"]))
+    assert load_images == [False, True]
+    assert record["art"] == helper.PNG_DATA
+
+
+def test_read_many_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    read = aio._read
+    release = threading.Event()
+    threads = threading.active_count()
+
+    def slow_read(*args: Any) -> Any:
+        release.wait(5)
+        return read(*args)
+
+    monkeypatch.setattr(aio, "_read", slow_read)
+    path = os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3")
+    results = asyncio.run(collect([path], timeout=0.01))
+    assert isinstance(results[0].error, UnreadableFileError)
+    assert "timed out" in str(results[0].error)
+
+    # The read is finished in the background.
+    release.set()
+    deadline = time.monotonic() + 5
+    while threading.active_count() > threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_read_many_backpressure(monkeypatch: pytest.MonkeyPatch) -> None:
+    started: List[str] = []
+    read = aio._read
+
+    def counting_read(path: str, fields: Any) -> Any:
+        started.append(path)
+        return read(path, fields)
+
+    monkeypatch.setattr(aio, "_read", counting_read)
+
+    async def first() -> ScanResult:
+        results = aio.read_many(helper.TEST_RESOURCES_PATH, concurrency=2)
+        result = await results.__anext__()
+        await results.aclose()
+        return result
+
+    assert asyncio.run(first()).path
+    assert len(started) <= 3
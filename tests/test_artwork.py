@@ -0,0 +1,103 @@
+import os
+import shutil
+import stat
+import tempfile
+
+import pytest
+
+from phrydy import artwork
+from phrydy.artwork import ArtworkStore, extract_artwork, image_digest
+from phrydy.mediafile import Image, ImageType, MediaFile
+from phrydy.mediafile_extended import MediaFileExtended
+from tests import helper
+
+
+def album() -> str:
+    """A directory with three tracks sharing one cover and one track
+    without images."""
+    directory = tempfile.mkdtemp()
+    for name in ("mb.mp3", "mb.flac", "mb.wma"):
+        shutil.copy(helper.copy_with_image(name), directory)
+    shutil.copy(os.path.join(helper.TEST_RESOURCES_PATH, "mb.ogg"), directory)
+    with open(os.path.join(directory, "cover.txt"), "w") as f:
+        f.write("no audio")
+    return directory
+
+
+def test_image_digest() -> None:
+    digest = image_digest(helper.PNG_DATA)
+    assert digest == image_digest(memoryview(helper.PNG_DATA))
+    assert len(digest) == 64
+
+
+def test_extract_artwork() -> None:
+    refs = list(extract_artwork(album()))
+    assert [os.path.basename(ref.path) for ref in refs] == [
+        "mb.flac",
+        "mb.mp3",
+        "mb.wma",
+    ]
+    assert {ref.digest for ref in refs} == {image_digest(helper.PNG_DATA)}
+    assert all(ref.type == ImageType.front for ref in refs)
+    assert all(ref.mime_type == "image/png" for ref in refs)
+    assert all(ref.extension == "png" for ref in refs)
+    assert all(ref.cover for ref in refs)
+
+
+def test_store() -> None:
+    directory = tempfile.mkdtemp()
+    store = ArtworkStore(directory)
+    refs = list(extract_artwork(album(), store=store))
+    path = store.path(refs[0].digest, refs[0].extension)
+    assert path.endswith(".png")
+    with open(path, "rb") as f:
+        assert f.read() == helper.PNG_DATA
+    files = [name for _, _, names in os.walk(directory) for name in names]
+    assert files == [os.path.basename(path)]
+
+
+def test_store_file_mode() -> None:
+    store = ArtworkStore(tempfile.mkdtemp())
+    umask = os.umask(0o027)
+    try:
+        digest = store.add(Image(helper.PNG_DATA))
+    finally:
+        os.umask(umask)
+    path = store.path(digest, "png")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_store_path() -> None:
+    store = ArtworkStore(tempfile.mkdtemp())
+    assert store.path("ab12", "jpg") == os.path.join(store.directory, "ab", "ab12.jpg")
+    assert store.path("ab12") == os.path.join(store.directory, "ab", "ab12")
+
+
+def test_unreadable_files_are_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    directory = album()
+
+    def open_file(path: str) -> MediaFileExtended:
+        if path.endswith("mb.mp3"):
+            raise ValueError("malformed tag")
+        return MediaFileExtended(path)
+
+    monkeypatch.setattr(artwork, "MediaFileExtended", open_file)
+    refs = list(extract_artwork(directory))
+    assert [os.path.basename(ref.path) for ref in refs] == ["mb.flac", "mb.wma"]
+
+
+def test_cover_only() -> None:
+    path = helper.copy_with_image("mb.mp3")
+    media_file = MediaFile(path)
+    media_file.images = [
+        Image(b"back", desc="back", type=ImageType.back),
+        Image(helper.PNG_DATA, desc="front", type=ImageType.front),
+    ]
+    media_file.save()
+    refs = list(extract_artwork(path))
+    assert [(ref.type, ref.cover) for ref in refs] == [
+        (ImageType.back, False),
+        (ImageType.front, True),
+    ]
+    refs = list(extract_artwork(path, cover_only=True))
+    assert [ref.type for ref in refs] == [ImageType.front]
@@ -0,0 +1,152 @@
+import datetime
+import os
+import tempfile
+from multiprocessing import Pool
+from typing import Any, List
+
+import pytest
+
+import phrydy
+from phrydy import cache
+from phrydy.cache import CachedReader, schema_version
+from phrydy.mediafile import FileTypeError
+from phrydy.mediafile_extended import MediaFileExtended
+from tests import helper
+from tests.test_mediafile_extended import copy_to_tmp
+
+
+def get_database() -> str:
+    return os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+
+
+def read_title(args: tuple[str, str]) -> str:
+    database, path = args
+    with CachedReader(database) as reader:
+        return reader.read(path)["title"]
+
+
+class TestCachedReader:
+    def test_import(self) -> None:
+        assert phrydy.CachedReader is CachedReader
+
+    def test_hit_and_miss(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(get_database()) as reader:
+            assert reader.get(path) is None
+            assert reader.read(path)["title"] == "full"
+            assert reader.read(path)["title"] == "full"
+            assert (reader.hits, reader.misses) == (1, 1)
+            assert "art" not in reader.read(path)
+
+    def test_persistent(self) -> None:
+        database = get_database()
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(database) as reader:
+            reader.read(path)
+        with CachedReader(database) as reader:
+            assert reader.get(path)
+            assert len(reader) == 1
+
+    def test_changed_file(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(get_database()) as reader:
+            reader.read(path)
+            media_file = phrydy.MediaFileExtended(path)
+            media_file.title = "changed"
+            media_file.save()
+            assert reader.get(path) is None
+            assert reader.read(path)["title"] == "changed"
+            assert reader.misses == 2
+
+    def test_fields(self) -> None:
+        database = get_database()
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(database, fields=["title"]) as reader:
+            assert reader.read(path) == {"title": "full"}
+        with CachedReader(database, fields=["title", "album"]) as reader:
+            assert reader.get(path) is None
+        assert schema_version(["a"]) != schema_version(["b"])
+
+    def test_max_entries(self) -> None:
+        paths = [copy_to_tmp("full.mp3") for _ in range(4)]
+        with CachedReader(get_database(), max_entries=2) as reader:
+            for path in paths:
+                reader.read(path)
+            assert len(reader) == 2
+            assert reader.get(paths[0]) is None
+            assert reader.get(paths[3])
+
+    def test_max_bytes(self) -> None:
+        paths = [copy_to_tmp("full.mp3") for _ in range(4)]
+        with CachedReader(get_database(), max_bytes=1) as reader:
+            for path in paths:
+                reader.read(path)
+            assert len(reader) == 0
+
+    def test_discard(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(get_database()) as reader:
+            reader.read(path)
+            reader.discard(path)
+            assert len(reader) == 0
+
+    def test_unreadable(self) -> None:
+        path = os.path.join(tempfile.mkdtemp(), "cover.txt")
+        with open(path, "w") as f:
+            f.write("no audio")
+        with CachedReader(get_database()) as reader:
+            with pytest.raises(FileTypeError):
+                reader.read(path)
+            assert len(reader) == 0
+
+    def test_several_processes(self) -> None:
+        database = get_database()
+        paths = [copy_to_tmp("full.mp3") for _ in range(8)]
+        with Pool(4) as pool:
+            titles = pool.map(read_title, [(database, path) for path in paths])
+        assert titles == ["full"] * 8
+        with CachedReader(database) as reader:
+            assert len(reader) == 8
+
+    def test_json_records(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(get_database()) as reader:
+            reader.read(path)
+            record = reader.get(path)
+            assert record is not None
+            assert record["date"] == datetime.date(2001, 1, 1)
+            assert record["genres"] == ["the genre"]
+            (kind,) = reader.connection.execute(
+                "SELECT typeof(record) FROM records"
+            ).fetchone()
+            assert kind == "text"
+
+    def test_hit_does_not_write(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        with CachedReader(get_database()) as reader:
+            reader.read(path)
+            changes = reader.connection.total_changes
+            for _ in range(3):
+                assert reader.get(path)
+            assert reader.connection.total_changes == changes
+        with CachedReader(get_database(), access_resolution=0) as reader:
+            reader.read(path)
+            changes = reader.connection.total_changes
+            assert reader.get(path)
+            assert reader.connection.total_changes == changes + 1
+
+    def test_image_fields(self) -> None:
+        with pytest.raises(ValueError):
+            CachedReader(get_database(), fields=["title", "art"])
+
+    def test_images_are_not_loaded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        load_images: List[bool] = []
+
+        def open_file(path: str, **kwargs: Any) -> MediaFileExtended:
+            load_images.append(kwargs["load_images"])
+            return MediaFileExtended(path, **kwargs)
+
+        monkeypatch.setattr(cache, "MediaFileExtended", open_file)
+        with CachedReader(get_database()) as reader:
+            assert reader.read(helper.copy_with_image("mb.mp3"))
+        assert load_images == [False]
@@ -0,0 +1,52 @@
+import datetime
+import io
+import json
+
+from phrydy.export import to_json_value, write_csv, write_json_lines
+from phrydy.mediafile import FileTypeError, Image, ImageType
+from phrydy.scanner import ScanResult
+from tests import helper
+
+RESULTS = [
+    ScanResult(
+        "a.mp3",
+        {"title": "a", "genres": ["Rock", "Pop"], "date": datetime.date(2001, 2, 3)},
+        None,
+    ),
+    ScanResult("b.txt", None, FileTypeError("b.txt")),
+]
+
+
+def test_to_json_value() -> None:
+    assert to_json_value(datetime.date(2001, 1, 1)) == "2001-01-01"
+    assert to_json_value(b"abc") == 3
+    assert to_json_value([Image(helper.PNG_DATA, "front", ImageType.front)]) == [
+        {"mime_type": "image/png", "desc": "front", "type": "front", "size": 67}
+    ]
+    assert to_json_value(1.5) == 1.5
+
+
+def test_write_json_lines() -> None:
+    output = io.StringIO()
+    write_json_lines(RESULTS, output)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines[0] == {
+        "path": "a.mp3",
+        "title": "a",
+        "genres": ["Rock", "Pop"],
+        "date": "2001-02-03",
+    }
+    assert lines[1] == {
+        "path": "b.txt",
+        "error": "'b.txt': not in a recognized format",
+    }
+
+
+def test_write_csv() -> None:
+    output = io.StringIO()
+    write_csv(RESULTS, output, ["title", "genres"])
+    assert output.getvalue().splitlines() == [
+        "path,title,genres,error",
+        'a.mp3,a,"[""Rock"", ""Pop""]",',
+        "b.txt,,,'b.txt': not in a recognized format",
+    ]
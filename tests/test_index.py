@@ -0,0 +1,172 @@
+import datetime
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from phrydy.index import LibraryIndex
+from phrydy.mediafile_extended import MediaFileExtended
+from tests import helper
+
+NAMES = ("full.mp3", "mb.flac", "mb.m4a")
+
+
+def make_library() -> str:
+    directory = tempfile.mkdtemp()
+    os.mkdir(os.path.join(directory, "album"))
+    for name in NAMES:
+        shutil.copyfile(
+            os.path.join(helper.TEST_RESOURCES_PATH, name),
+            os.path.join(directory, "album", name),
+        )
+    return directory
+
+
+def get_database() -> str:
+    return os.path.join(tempfile.mkdtemp(), "index.sqlite")
+
+
+def touch(path: str) -> None:
+    """Make sure the modification time changes even on file systems with
+    a coarse time resolution."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLibraryIndex:
+    def test_first_refresh(self) -> None:
+        library = make_library()
+        with LibraryIndex(get_database()) as index:
+            result = index.refresh(library, workers=1)
+            assert len(result.added) == 3
+            assert result.unchanged == 0
+            assert len(index) == 3
+            path = os.path.join(library, "album", "full.mp3")
+            assert path in index
+            record = index.get(path)
+            assert record is not None
+            assert record["title"] == "full"
+            assert record["date"] == datetime.date(2001, 1, 1)
+            assert record["genres"] == ["the genre"]
+            assert "art" not in record
+            row = index.connection.execute(
+                "SELECT format, length, bitrate FROM files WHERE path = ?", (path,)
+            ).fetchone()
+            assert row == (record["format"], record["length"], record["bitrate"])
+            assert [p for p, _ in index.items()] == sorted(
+                os.path.join(library, "album", name) for name in NAMES
+            )
+
+    def test_unchanged(self) -> None:
+        library = make_library()
+        database = get_database()
+        with LibraryIndex(database) as index:
+            index.refresh(library, workers=1)
+        with LibraryIndex(database) as index:
+            result = index.refresh(library, workers=1)
+            assert (result.added, result.updated, result.deleted) == ([], [], [])
+            assert result.unchanged == 3
+
+    def test_changed(self) -> None:
+        library = make_library()
+        path = os.path.join(library, "album", "mb.flac")
+        with LibraryIndex(get_database()) as index:
+            index.refresh(library, workers=1)
+            media_file = MediaFileExtended(path)
+            media_file.title = "changed"
+            media_file.save()
+            touch(path)
+            result = index.refresh(library, workers=2)
+            assert result.updated == [path]
+            assert result.unchanged == 2
+            record = index.get(path)
+            assert record is not None
+            assert record["title"] == "changed"
+
+    def test_rename_and_delete(self) -> None:
+        library = make_library()
+        old = os.path.join(library, "album", "full.mp3")
+        new = os.path.join(library, "moved.mp3")
+        deleted = os.path.join(library, "album", "mb.m4a")
+        with LibraryIndex(get_database()) as index:
+            index.refresh(library, workers=1)
+            os.rename(old, new)
+            os.unlink(deleted)
+            result = index.refresh(library, workers=1)
+            assert result.renamed == [(old, new)]
+            assert result.deleted == [deleted]
+            assert (result.added, result.updated) == ([], [])
+            assert result.unchanged == 2
+            assert old not in index
+            assert deleted not in index
+            record = index.get(new)
+            assert record is not None
+            assert record["title"] == "full"
+
+    def test_rename_and_change(self) -> None:
+        library = make_library()
+        old = os.path.join(library, "album", "full.mp3")
+        new = os.path.join(library, "album", "renamed.mp3")
+        with LibraryIndex(get_database()) as index:
+            index.refresh(library, workers=1)
+            os.rename(old, new)
+            touch(new)
+            result = index.refresh(library, workers=1)
+            assert result.renamed == [(old, new)]
+            assert result.updated == [new]
+
+    def test_unreadable(self) -> None:
+        library = make_library()
+        path = os.path.join(library, "cover.txt")
+        with open(path, "w") as f:
+            f.write("no audio")
+        with LibraryIndex(get_database()) as index:
+            result = index.refresh(library, workers=1)
+            assert result.failed == [path]
+            assert path in index
+            assert index.get(path) is None
+            error = index.error(path)
+            assert error is not None
+            assert "not in a recognized format" in error
+            result = index.refresh(library, workers=1)
+            assert result.failed == []
+            assert result.unchanged == 4
+
+    def test_extensions(self) -> None:
+        library = make_library()
+        with LibraryIndex(get_database()) as index:
+            result = index.refresh(library, workers=1, extensions=[".flac"])
+            assert result.added == [os.path.join(library, "album", "mb.flac")]
+
+    def test_fields_changed(self) -> None:
+        library = make_library()
+        database = get_database()
+        with LibraryIndex(database) as index:
+            index.refresh(library, workers=1)
+        with LibraryIndex(database, fields=["title", "format"]) as index:
+            result = index.refresh(library, workers=1)
+            assert len(result.updated) == 3
+            assert index.get(os.path.join(library, "album", "mb.flac")) == {
+                "title": "Estampes: Pagodes",
+                "format": "FLAC",
+            }
+
+    def test_other_roots(self) -> None:
+        first = make_library()
+        second = make_library()
+        with LibraryIndex(get_database()) as index:
+            index.refresh(first, workers=1)
+            index.refresh(second, workers=1)
+            shutil.rmtree(os.path.join(first, "album"))
+            result = index.refresh(first, workers=1)
+            assert len(result.deleted) == 3
+            assert len(index) == 3
+
+    def test_missing_root(self) -> None:
+        library = make_library()
+        with LibraryIndex(get_database()) as index:
+            index.refresh(library, workers=1)
+            with pytest.raises(FileNotFoundError):
+                index.refresh(os.path.join(library, "unmounted"), workers=1)
+            assert len(index) == 3
@@ -1,6 +1,10 @@
 """Test public api / interface"""
 
 import os
+import subprocess
+import sys
+
+import pytest
 
 import phrydy
 from phrydy import MediaFileExtended
@@ -207,3 +211,31 @@ class TestInterface:
     def test_module_import_doc(self) -> None:
         fields = phrydy.doc_generator.fields
         assert fields
+
+
+class TestLazyImport:
+    def test_import_loads_nothing(self) -> None:
+        code = (
+            "import sys, phrydy; "
+            "print(' '.join(m for m in sys.modules if m.startswith("
+            "('phrydy.', 'mutagen', 'termcolor', 'importlib.metadata'))))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == ""
+
+    def test_version(self) -> None:
+        assert phrydy.__version__.count(".") == 2
+
+    def test_submodule(self) -> None:
+        assert phrydy.scanner.scan is phrydy.scan
+
+    def test_dir(self) -> None:
+        assert {"scan", "read_record", "mediafile", "__version__"} <= set(dir(phrydy))
+        for name in phrydy.__all__:
+            assert getattr(phrydy, name) is not None
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError):
+            phrydy.unknown  # type: ignore
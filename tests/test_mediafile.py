@@ -0,0 +1,672 @@
+"""Test the phrydy specific changes of the vendored module
+``phrydy.mediafile``."""
+
+import base64
+import datetime
+import mmap
+import os
+import pickle
+import time
+from random import Random
+from typing import Any, List
+
+import mutagen
+import mutagen.asf
+import mutagen.flac
+import mutagen.id3
+import pytest
+from mutagen._tags import PaddingInfo
+
+from phrydy import mediafile
+from phrydy.mediafile import (
+    DateField,
+    Image,
+    ImageDecodeError,
+    ImageType,
+    MediaField,
+    MediaFile,
+    MP3DescStorageStyle,
+    MP3StorageStyle,
+    UnreadableFileError,
+    _BufferFile,
+    _cast_to_bool,
+    _cast_to_float,
+    _cast_to_int,
+    _cast_to_str,
+    _id3_index,
+    _pack_asf_image,
+    _safe_cast,
+    _unpack_asf_image,
+    _unpack_flac_picture,
+    image_extension,
+    image_mime_type,
+    proportional_padding,
+    reserve_padding,
+)
+from phrydy.mediafile_extended import MediaFileExtended
+from tests import helper
+from tests.test_mediafile_extended import copy_to_tmp
+
+
+class TestStylePlans:
+    def test_styles_are_selected_per_format(self) -> None:
+        media_file = helper.get_mediafile_extended("full.mp3")
+        styles = MediaFile.__dict__["title"].styles(media_file.mgfile)
+        assert len(styles) == 1
+        assert isinstance(styles[0], MP3StorageStyle)
+        assert styles[0].key == "TIT2"
+
+    def test_styles_are_cached(self) -> None:
+        mp3 = helper.get_mediafile_extended("full.mp3")
+        field = MediaFile.__dict__["rg_track_gain"]
+        styles = field.styles(mp3.mgfile)
+        assert styles is field.styles(mp3.mgfile)
+        assert all(isinstance(s, MP3DescStorageStyle) for s in styles)
+
+    def test_styles_differ_between_formats(self) -> None:
+        mp3 = helper.get_mediafile_extended("mb.mp3")
+        flac = helper.get_mediafile_extended("mb.flac")
+        field = MediaFile.__dict__["album"]
+        assert field.styles(mp3.mgfile) != field.styles(flac.mgfile)
+        assert mp3.album == flac.album
+
+
+class TestID3FrameIndex:
+    def test_lookup_is_case_insensitive(self) -> None:
+        media_file = helper.get_mediafile_extended("mb.mp3")
+        tags = media_file.mgfile.tags
+        frames = _id3_index(tags).desc_frames(tags, "TXXX", "musicbrainz album id")
+        assert len(frames) == 1
+        assert frames[0].desc == "MusicBrainz Album Id"
+        assert _id3_index(tags) is _id3_index(tags)
+
+    def test_write_invalidates(self) -> None:
+        media_file = MediaFileExtended(copy_to_tmp("mb.mp3"))
+        index = _id3_index(media_file.mgfile.tags)
+        assert media_file.barcode is None
+        assert "TXXX" in index.descs
+        media_file.barcode = "0123456789012"
+        assert "TXXX" not in index.descs
+        assert media_file.barcode == "0123456789012"
+        del media_file.barcode
+        assert media_file.barcode is None
+        media_file.arranger = "Arranger"
+        assert media_file.arranger == "Arranger"
+        media_file.mb_trackid = "1234"
+        media_file.save()
+        media_file = MediaFileExtended(media_file.path)
+        assert media_file.arranger == "Arranger"
+        assert media_file.mb_trackid == "1234"
+
+    def test_direct_mutagen_changes(self) -> None:
+        media_file = MediaFileExtended(copy_to_tmp("mb.mp3"))
+        assert media_file.barcode is None
+        media_file.mgfile.tags.add(
+            mutagen.id3.TXXX(encoding=3, desc="barcode", text=["42"])
+        )
+        assert media_file.barcode == "42"
+
+    def test_lookup_does_not_compare_tags(self, monkeypatch: Any) -> None:
+        """Mutagen compares tags frame by frame. A lookup must not do
+        that, otherwise each field read grows with the number of
+        frames."""
+        media_file = MediaFileExtended(copy_to_tmp("mb.mp3"))
+        tags = media_file.mgfile.tags
+        for i in range(1200):
+            tags.add(mutagen.id3.TXXX(encoding=3, desc="x{}".format(i), text=["x"]))
+        assert media_file.mb_albumid is not None
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("The frames of the tag are compared.")
+
+        for name in ("__eq__", "__hash__", "keys", "items", "values", "__len__"):
+            monkeypatch.setattr(mutagen.id3.ID3, name, fail)
+        assert media_file.mb_albumid == "c1350da9-326c-48da-95b8-bca5dd0262d4"
+        assert media_file.barcode is None
+
+    def test_index_is_dropped_with_tags(self) -> None:
+        media_file = MediaFileExtended(copy_to_tmp("mb.mp3"))
+        key = id(media_file.mgfile.tags)
+        _id3_index(media_file.mgfile.tags)
+        assert key in mediafile._id3_indexes
+        del media_file
+        assert key not in mediafile._id3_indexes
+
+
+class TestLoadImages:
+    extensions = [
+        "aiff",
+        "alac.m4a",
+        "ape",
+        "flac",
+        "m4a",
+        "mp3",
+        "mpc",
+        "ogg",
+        "opus",
+        "wma",
+        "wv",
+    ]
+
+    def test_images_are_loaded_on_access(self) -> None:
+        for extension in self.extensions:
+            path = helper.copy_with_image("mb." + extension)
+            media_file = MediaFileExtended(path, load_images=False)
+            assert not media_file._images_loaded
+            assert media_file.title
+            assert media_file.art == helper.PNG_DATA, extension
+            assert media_file._images_loaded
+
+    def test_images_are_stripped(self) -> None:
+        path = helper.copy_with_image("mb.mp3")
+        media_file = MediaFileExtended(path, load_images=False)
+        assert media_file.mgfile.tags.getall("APIC") == []
+        path = helper.copy_with_image("mb.flac")
+        assert MediaFileExtended(path, load_images=False).mgfile.pictures == []
+
+    def test_save_keeps_images(self) -> None:
+        for extension in self.extensions:
+            path = helper.copy_with_image("mb." + extension)
+            media_file = MediaFileExtended(path, load_images=False)
+            media_file.title = "new title"
+            media_file.save()
+            media_file = MediaFileExtended(path)
+            assert media_file.title == "new title"
+            assert media_file.art == helper.PNG_DATA, extension
+
+    def test_set_images(self) -> None:
+        path = helper.copy_with_image("mb.mp3")
+        media_file = MediaFileExtended(path, load_images=False)
+        media_file.images = []
+        assert media_file._images_loaded
+        media_file.save()
+        assert MediaFileExtended(path).images is None
+
+    def test_flac_picture_comments_are_kept(self) -> None:
+        path = copy_to_tmp("mb.flac")
+        flac = mutagen.flac.FLAC(path)
+        picture = mutagen.flac.Picture()
+        picture.data = helper.PNG_DATA
+        picture.mime = "image/png"
+        picture.type = ImageType.back.value
+        comment = base64.b64encode(picture.write()).decode("ascii")
+        flac["METADATA_BLOCK_PICTURE"] = [comment]
+        flac["COVERARTIST"] = ["Artist of the cover"]
+        flac.save()
+        for action in ("set", "delete"):
+            media_file = MediaFileExtended(path, load_images=False)
+            assert "COVERARTIST" in media_file.mgfile.tags
+            if action == "set":
+                media_file.images = [Image(helper.PNG_DATA, type=ImageType.front)]
+            else:
+                del media_file.images
+            media_file.save()
+            flac = mutagen.flac.FLAC(path)
+            assert flac["METADATA_BLOCK_PICTURE"] == [comment], action
+            assert flac["COVERARTIST"] == ["Artist of the cover"], action
+
+    def test_file_like_object(self) -> None:
+        with open(helper.copy_with_image("mb.flac"), "rb") as f:
+            media_file = MediaFileExtended(f, load_images=False)
+            assert media_file.art == helper.PNG_DATA
+
+    def test_unreadable_on_access(self, monkeypatch: Any) -> None:
+        path = helper.copy_with_image("mb.flac")
+        media_file = MediaFileExtended(path, load_images=False)
+        monkeypatch.setattr(mutagen, "File", lambda *args, **kwargs: None)
+        with pytest.raises(UnreadableFileError):
+            media_file.art
+        assert not media_file._images_loaded
+
+
+class TestChangedFields:
+    def test_unchanged_save_does_not_write(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        mtime = os.stat(path).st_mtime_ns
+        media_file = MediaFile(path)
+        media_file.update(MediaFile(path).as_dict())
+        assert media_file.changed_fields() == []
+        media_file.save()
+        assert os.stat(path).st_mtime_ns == mtime
+
+    def test_update_with_own_images(self) -> None:
+        for name in ("Bach_Weihnachts.mp3", "Beethoven_Symphony-No-5.mp3"):
+            path = os.path.join(helper.TEST_RESOURCES_PATH, "real-world", name)
+            media_file = MediaFile(path)
+            assert media_file.images
+            media_file.update(MediaFile(path).as_dict())
+            assert media_file.changed_fields() == [], name
+
+    def test_image_equality(self) -> None:
+        image = Image(helper.PNG_DATA, desc="front", type=ImageType.front)
+        assert image == Image(
+            memoryview(helper.PNG_DATA), desc="front", type=ImageType.front
+        )
+        assert image != Image(helper.PNG_DATA, desc="back", type=ImageType.front)
+        assert image != Image(helper.PNG_DATA, desc="front", type=ImageType.back)
+        assert image != Image(helper.PNG_DATA[:-1], desc="front", type=ImageType.front)
+        assert image != helper.PNG_DATA
+        with pytest.raises(TypeError):
+            hash(image)
+
+    def test_set(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        media_file = MediaFile(path)
+        media_file.title = "new"
+        media_file.year = 1999
+        assert media_file.changed_fields() == ["title", "date", "year"]
+        media_file.save()
+        assert media_file.changed_fields() == []
+        assert MediaFile(path).title == "new"
+        assert MediaFile(path).year == 1999
+
+    def test_update(self) -> None:
+        media_file = MediaFile(copy_to_tmp("full.mp3"))
+        media_file.update({"title": "full", "album": "new", "barcode": None})
+        assert media_file.changed_fields() == ["album"]
+
+    def test_delete(self) -> None:
+        media_file = MediaFile(copy_to_tmp("full.mp3"))
+        media_file.update({"comments": None})
+        del media_file.art
+        assert media_file.changed_fields() == ["comments", "art", "images"]
+
+    def test_force(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        media_file = MediaFile(path)
+        media_file.mgfile["TIT2"] = mutagen.id3.TIT2(encoding=3, text=["direct"])
+        media_file.save()
+        assert MediaFile(path).title == "full"
+        media_file.save(force=True)
+        assert MediaFile(path).title == "direct"
+
+
+class TestDateTuples:
+    def count_parses(self, monkeypatch: pytest.MonkeyPatch) -> List[str]:
+        parsed: List[str] = []
+        parse = DateField._parse_date_tuple
+
+        def counting_parse(field: DateField, media_file: MediaFile) -> List[int]:
+            parsed.append(
+                "original_date"
+                if field is MediaFile.__dict__["original_date"]
+                else "date"
+            )
+            return parse(field, media_file)
+
+        monkeypatch.setattr(DateField, "_parse_date_tuple", counting_parse)
+        return parsed
+
+    def test_parsed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        parsed = self.count_parses(monkeypatch)
+        media_file = MediaFile(os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3"))
+        media_file.as_dict()
+        assert sorted(parsed) == ["date", "original_date"]
+
+    def test_set_items(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        parsed = self.count_parses(monkeypatch)
+        path = copy_to_tmp("full.mp3")
+        media_file = MediaFile(path)
+        media_file.year = 1999
+        media_file.month = 12
+        media_file.day = 31
+        assert parsed == ["date"]
+        assert media_file.date == datetime.date(1999, 12, 31)
+        media_file.save()
+        assert MediaFile(path).date == datetime.date(1999, 12, 31)
+
+    def test_invalidated(self) -> None:
+        media_file = MediaFile(copy_to_tmp("full.mp3"))
+        assert media_file.year == 2001
+        items = DateField._get_date_tuple(MediaFile.__dict__["date"], media_file)
+        items[0] = 1
+        assert media_file.year == 2001
+        del media_file.date
+        assert media_file.year is None
+
+
+class TestCasts:
+    def test_caster_per_field(self) -> None:
+        assert MediaFile.__dict__["track"]._cast is _cast_to_int
+        assert MediaFile.__dict__["title"]._cast is _cast_to_str
+        assert MediaFile.__dict__["bpm"]._cast is _cast_to_int
+        assert MediaFile.__dict__["rg_track_gain"]._cast is _cast_to_float
+
+    def test_out_type_changes_caster(self) -> None:
+        field = MediaField(out_type=int)
+        field.out_type = bool
+        assert field._cast is _cast_to_bool
+
+    def test_values(self) -> None:
+        assert _safe_cast(int, " 12/14") == 12
+        assert _safe_cast(int, b"-3") == -3
+        assert _safe_cast(int, "abc") == 0
+        assert _safe_cast(int, True) == 1
+        assert _safe_cast(float, " -1.5 dB") == -1.5
+        assert _safe_cast(float, ".5") == 0.5
+        assert _safe_cast(float, 2) == 2.0
+        assert _safe_cast(bool, "1") is True
+        assert _safe_cast(bool, "x") is False
+        assert _safe_cast(str, b"abc") == "abc"
+        assert _safe_cast(str, None) is None
+
+    def test_read(self) -> None:
+        media_file = helper.get_mediafile_extended("full.mp3")
+        assert media_file.track == 2
+        assert media_file.rg_track_gain == 0.0
+
+
+class TestBufferInput:
+    path = os.path.join(helper.TEST_RESOURCES_PATH, "mb.flac")
+
+    def test_use_mmap(self) -> None:
+        media_file = MediaFile(self.path, use_mmap=True)
+        assert media_file.as_dict() == MediaFile(self.path).as_dict()
+        assert media_file.path == self.path
+        assert media_file.filesize == os.path.getsize(self.path)
+
+    def test_use_mmap_save(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        media_file = MediaFile(path, use_mmap=True)
+        media_file.title = "mapped"
+        media_file.save()
+        assert MediaFile(path).title == "mapped"
+
+    def test_mmap(self) -> None:
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                media_file = MediaFile(mapped)
+                assert media_file.title == "Estampes: Pagodes"
+                assert media_file.filesize == len(mapped)
+
+    def test_memoryview(self) -> None:
+        with open(self.path, "rb") as f:
+            data = f.read()
+        media_file = MediaFile(memoryview(data))
+        assert media_file.as_dict() == MediaFile(self.path).as_dict()
+        assert media_file.filename == "<memoryview>"
+        assert media_file.filesize == len(data)
+
+    def test_memoryview_load_images_later(self) -> None:
+        for extension in ("flac", "mp3", "m4a"):
+            with open(helper.copy_with_image("mb." + extension), "rb") as f:
+                data = f.read()
+            media_file = MediaFile(memoryview(data), load_images=False)
+            assert media_file.art == helper.PNG_DATA, extension
+
+    def test_mmap_load_images_later(self) -> None:
+        for extension in ("flac", "mp3", "m4a"):
+            with open(helper.copy_with_image("mb." + extension), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    media_file = MediaFile(mapped, load_images=False)
+                    assert media_file.art == helper.PNG_DATA, extension
+
+    def test_buffer_file(self) -> None:
+        buffer = _BufferFile(memoryview(b"0123456789"))
+        assert buffer.read(3) == b"012"
+        assert buffer.seek(-2, os.SEEK_END) == 8
+        assert buffer.read() == b"89"
+        assert buffer.read(5) == b""
+        buffer.seek(1, os.SEEK_SET)
+        buffer.seek(2, os.SEEK_CUR)
+        assert buffer.tell() == 3
+        with pytest.raises(ValueError):
+            buffer.seek(-1)
+
+
+class TestImageViews:
+    @pytest.mark.parametrize("extension", ["wma", "ape", "ogg", "opus", "wv", "mpc"])
+    def test_views(self, extension: str) -> None:
+        media_file = MediaFile(helper.copy_with_image("mb." + extension))
+        image = media_file.images[0]
+        assert isinstance(image.data, memoryview)
+        assert image.data == helper.PNG_DATA
+        assert image.mime_type == "image/png"
+        assert image.desc == "front"
+        assert image.type == ImageType.front
+        assert media_file.art == helper.PNG_DATA
+        assert isinstance(media_file.art, bytes)
+
+    def test_copy_between_formats(self) -> None:
+        images = MediaFile(helper.copy_with_image("mb.wma")).images
+        for name in ("mb.mp3", "mb.m4a", "mb.flac", "mb.ogg", "mb.ape"):
+            path = copy_to_tmp(name)
+            media_file = MediaFile(path)
+            media_file.images = images
+            media_file.save()
+            assert MediaFile(path).art == helper.PNG_DATA, name
+
+    def test_pickle(self) -> None:
+        image = Image(memoryview(helper.PNG_DATA), "front", ImageType.front)
+        copy = pickle.loads(pickle.dumps(image))
+        assert copy.data == helper.PNG_DATA
+        assert copy.type == ImageType.front
+
+    def test_unpack_asf_image(self) -> None:
+        packed = _pack_asf_image("image/png", helper.PNG_DATA, 3, "front")
+        mime, data, type, desc = _unpack_asf_image(packed)
+        assert (mime, type, desc) == ("image/png", 3, "front")
+        assert isinstance(data, memoryview)
+        assert data.obj is packed
+
+    def test_unpack_flac_picture(self) -> None:
+        picture = mutagen.flac.Picture()
+        picture.data = helper.PNG_DATA
+        picture.type = 4
+        picture.mime = "image/png"
+        picture.desc = "bäck"
+        type, desc, data = _unpack_flac_picture(picture.write())
+        assert (type, desc, data) == (4, "bäck", helper.PNG_DATA)
+
+
+class TestASFImageCodec:
+    packed = _pack_asf_image("image/png", helper.PNG_DATA, 3, "front")
+
+    def test_aligned_terminator(self) -> None:
+        # "A" (41 00) followed by "Ā" (00 01) contains a null byte pair
+        # at an odd offset.
+        packed = _pack_asf_image("AĀ", b"data", 0, "Ā")
+        assert packed[6:8] == b"\x00\x00"
+        assert _unpack_asf_image(packed) == ("AĀ", b"data", 0, "Ā")
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"\x03\x00\x00",
+            b"\x03\xff\xff\xff\xff",
+            b"\x03\x01\x00\x00\x00i\x00m\x00",
+            b"\x03\x05\x00\x00\x00\x00\x00\x00\x00abc",
+        ],
+    )
+    def test_malformed(self, data: bytes) -> None:
+        with pytest.raises(ImageDecodeError):
+            _unpack_asf_image(data)
+
+    def test_fuzz(self) -> None:
+        random = Random(0)
+        for _ in range(2000):
+            data = bytearray(self.packed[: random.randrange(len(self.packed) + 1)])
+            for _ in range(random.randrange(4)):
+                if data:
+                    data[random.randrange(len(data))] = random.randrange(256)
+            try:
+                mime, image_data, type, desc = _unpack_asf_image(bytes(data))
+            except ImageDecodeError:
+                continue
+            assert isinstance(mime, str) and isinstance(desc, str)
+            assert len(image_data) <= len(data)
+
+    def test_linear_time(self) -> None:
+        # A megabyte without any terminator used to be scanned two bytes
+        # at a time with a new bytes object on every step.
+        data = b"\x03\x00\x00\x00\x00" + b"a\x00" * 500_000
+        start = time.perf_counter()
+        with pytest.raises(ImageDecodeError):
+            _unpack_asf_image(data)
+        assert time.perf_counter() - start < 0.5
+
+    def test_malformed_pictures_are_skipped(self) -> None:
+        path = helper.copy_with_image("mb.wma")
+        media_file = MediaFile(path)
+        media_file.mgfile.tags["WM/Picture"] = [
+            mutagen.asf.ASFByteArrayAttribute(b"\x03\xff\xff"),
+            mutagen.asf.ASFByteArrayAttribute(self.packed),
+        ]
+        assert [image.data for image in media_file.images] == [helper.PNG_DATA]
+
+
+class TestImageSniffing:
+    def count_sniffs(self, monkeypatch: pytest.MonkeyPatch) -> List[int]:
+        sniffed: List[int] = []
+        image_kind = mediafile._image_kind
+
+        def counting_image_kind(data: Any) -> Any:
+            sniffed.append(len(data))
+            return image_kind(data)
+
+        monkeypatch.setattr(mediafile, "_image_kind", counting_image_kind)
+        return sniffed
+
+    def test_memoized(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sniffed = self.count_sniffs(monkeypatch)
+        image = Image(helper.PNG_DATA)
+        assert image.mime_type == "image/png"
+        assert image.mime_type == "image/png"
+        assert image.extension == "png"
+        assert len(sniffed) == 1
+
+    def test_invalidated(self) -> None:
+        image = Image(helper.PNG_DATA)
+        assert image.mime_type == "image/png"
+        image.data = b"\xff\xd8\xff\xe0" + b"\x00" * 20
+        assert image.mime_type == "image/jpeg"
+        assert image.extension == "jpg"
+        image.data = b""
+        assert image.mime_type is None
+        assert image.extension is None
+
+    def test_prefix_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        guessed: List[int] = []
+        guess = mediafile.filetype.guess
+
+        def recording_guess(data: bytes) -> Any:
+            guessed.append(len(data))
+            return guess(data)
+
+        monkeypatch.setattr(mediafile.filetype, "guess", recording_guess)
+        data = memoryview(helper.PNG_DATA + b"\x00" * 100_000)
+        assert image_mime_type(data) == "image/png"
+        assert image_extension(data) == "png"
+        assert guessed == [8192, 8192]
+
+    def test_write_sniffs_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        image = Image(helper.PNG_DATA, desc="front", type=ImageType.front)
+        sniffed = self.count_sniffs(monkeypatch)
+        for name in ("mb.m4a", "mb.flac", "mb.ogg"):
+            media_file = MediaFile(copy_to_tmp(name))
+            media_file.images = [image]
+            media_file.save()
+        assert len(sniffed) == 1
+
+
+class TestSlots:
+    def test_no_instance_dict(self) -> None:
+        style = MP3DescStorageStyle("MusicBrainz Album Id")
+        instances = [
+            Image(helper.PNG_DATA),
+            style,
+            MediaField(style),
+            DateField(style),
+            helper.get_mediafile_extended("full.mp3"),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__"), type(instance)
+
+    def test_subclass(self) -> None:
+        class Track(MediaFileExtended):
+            pass
+
+        track = Track(os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3"))
+        track.note = "subclasses without slots keep a dictionary"
+        assert track.note == "subclasses without slots keep a dictionary"
+        assert track.title == "full"
+
+    def test_add_field(self) -> None:
+        class Track(MediaFileExtended):
+            pass
+
+        Track.add_field("customtag", MediaField(MP3DescStorageStyle("customtag")))
+        path = copy_to_tmp("full.mp3")
+        track = Track(path)
+        track.customtag = "value"
+        track.save()
+        assert Track(path).customtag == "value"
+
+    def test_pickle_image(self) -> None:
+        image = Image(helper.PNG_DATA, desc="front", type=ImageType.front)
+        assert image.mime_type == "image/png"
+        copy = pickle.loads(pickle.dumps(image))
+        assert (copy.data, copy.desc, copy.type) == (
+            helper.PNG_DATA,
+            "front",
+            ImageType.front,
+        )
+        assert copy.mime_type == "image/png"
+
+
+class TestPadding:
+    def test_default(self) -> None:
+        path = copy_to_tmp("mb.mp3")
+        media_file = MediaFile(path)
+        assert media_file.saved_in_place is None
+        media_file.title = "x"
+        media_file.save()
+        assert media_file.saved_in_place is True
+
+    def test_reserve(self) -> None:
+        path = copy_to_tmp("mb.mp3")
+        media_file = MediaFile(path, padding=reserve_padding(64 * 1024))
+        media_file.comments = "x" * 10_000
+        media_file.save()
+        assert media_file.saved_in_place is False
+        size = os.path.getsize(path)
+
+        media_file = MediaFile(path, padding=reserve_padding(64 * 1024))
+        media_file.lyrics = "y" * 20_000
+        media_file.save()
+        assert media_file.saved_in_place is True
+        assert os.path.getsize(path) == size
+        assert MediaFile(path).lyrics == "y" * 20_000
+
+    def test_never_shrink(self) -> None:
+        path = copy_to_tmp("mb.flac")
+        media_file = MediaFile(path, padding=reserve_padding(256 * 1024))
+        media_file.comments = "x" * 10_000
+        media_file.save()
+        assert media_file.saved_in_place is False
+        size = os.path.getsize(path)
+
+        # Mutagen's default would shrink the large padding.
+        media_file = MediaFile(path)
+        del media_file.comments
+        media_file.save(padding=reserve_padding())
+        assert media_file.saved_in_place is True
+        assert os.path.getsize(path) == size
+
+        media_file.title = "shrunk"
+        media_file.save()
+        assert media_file.saved_in_place is False
+        assert os.path.getsize(path) < size
+
+    def test_proportional(self) -> None:
+        padding = proportional_padding(fraction=0.01, minimum=100)
+        assert padding(PaddingInfo(50, 1_000_000)) == 50
+        assert padding(PaddingInfo(-10, 1_000_000)) == 10_000
+        assert padding(PaddingInfo(-10, 1_000)) == 100
+
+    def test_unpadded_format(self) -> None:
+        media_file = MediaFile(copy_to_tmp("mb.ape"), padding=reserve_padding())
+        media_file.title = "x"
+        media_file.save()
+        assert media_file.saved_in_place is None
@@ -1,11 +1,14 @@
 import datetime
 import os
+import pickle
 import shutil
 import tempfile
 from pathlib import Path
 
+import pytest
+
 import phrydy
-from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.mediafile_extended import MediaFileExtended, Snapshot, read_record
 from tests import helper
 
 
@@ -435,3 +438,97 @@ class TestMediafileExtended:
             "work_hierarchy": None,
             "year": 2001,
         }
+
+
+class TestFieldRegistry:
+    def test_cached(self) -> None:
+        registry = MediaFileExtended.field_registry()
+        assert registry is MediaFileExtended.field_registry()
+        assert MediaFileExtended.fields() is registry.fields
+        assert len(registry.readable_fields) == len(registry.fields) + 9
+
+    def test_kinds(self) -> None:
+        kinds = MediaFileExtended.field_kinds()
+        assert kinds["title"].out_type is str
+        assert not kinds["title"].is_list
+        assert kinds["genres"].is_list
+        assert kinds["track"].out_type is int
+        assert kinds["date"].out_type is datetime.date
+        assert kinds["year"].is_date
+        assert kinds["year"].out_type is int
+        assert kinds["images"].is_image and kinds["images"].is_list
+        assert kinds["art"].out_type is bytes
+        assert kinds["r128_track_gain"].is_q_number
+        assert kinds["r128_track_gain"].out_type is float
+        assert kinds["work"].writable
+        assert not kinds["length"].writable
+        assert list(kinds) == list(MediaFileExtended.readable_fields())
+
+    def test_add_field(self) -> None:
+        class Subclass(MediaFileExtended):
+            pass
+
+        registry = Subclass.field_registry()
+        assert "work" in registry.fields
+        Subclass.add_field(
+            "custom_field",
+            phrydy.mediafile.MediaField(phrydy.mediafile.StorageStyle("X")),
+        )
+        assert Subclass.field_registry() is not registry
+        assert Subclass.fields()[-1] == "custom_field"
+        assert "custom_field" not in MediaFileExtended.fields()
+        assert Subclass.field_kinds()["custom_field"].out_type is str
+
+
+class TestSnapshot:
+    def test_fields(self) -> None:
+        snapshot = read_record(get_file("full.mp3"))
+        assert snapshot.path == get_file("full.mp3")
+        assert snapshot["title"] == snapshot.title == "full"
+        assert snapshot.year == 2001
+        assert snapshot.format == "MP3"
+        assert snapshot.length > 0
+        assert snapshot.bitrate > 0
+        assert snapshot.genres == ("the genre",)
+        assert "images" not in snapshot
+        assert "art" not in snapshot
+        assert len(snapshot) == len(MediaFileExtended.readable_fields()) - 2
+
+    def test_images(self) -> None:
+        snapshot = read_record(helper.copy_with_image("full.mp3"), images=True)
+        assert snapshot.art == helper.PNG_DATA
+        image = snapshot.images[0]
+        assert isinstance(image.data, bytes)
+        assert image.data == helper.PNG_DATA
+
+    def test_releases_mutagen_file(self) -> None:
+        media_file = MediaFileExtended(get_file("full.mp3"))
+        snapshot = media_file.snapshot()
+        assert snapshot.title == "full"
+        assert not hasattr(media_file, "mgfile")
+        assert not hasattr(media_file, "filething")
+
+    def test_immutable(self) -> None:
+        snapshot = read_record(get_file("full.mp3"))
+        with pytest.raises(AttributeError):
+            snapshot.title = "other"  # type: ignore
+        with pytest.raises(AttributeError):
+            del snapshot.title
+        with pytest.raises(TypeError):
+            snapshot["title"] = "other"  # type: ignore
+        with pytest.raises(AttributeError):
+            snapshot.unknown
+
+    def test_shared_index(self) -> None:
+        first = read_record(get_file("full.mp3"))
+        second = read_record(get_file("mb.flac"))
+        assert first._index is second._index
+        assert not hasattr(first, "__dict__")
+
+    def test_pickle(self) -> None:
+        snapshot = read_record(get_file("full.mp3"))
+        copy = pickle.loads(pickle.dumps(snapshot))
+        assert isinstance(copy, Snapshot)
+        assert copy == snapshot
+        assert copy.path == snapshot.path
+        assert copy._index is snapshot._index
@@ -1,8 +1,13 @@
 """Test the command line interface using subprocess."""
 
+import csv
+import io
+import json
 import os
 import subprocess
 
+from phrydy.scanner import walk
+
 
 def test_cli() -> None:
     output: str = subprocess.check_output(("phrydy-debug", "--help"), encoding="utf-8")
@@ -16,3 +21,45 @@ def test_cli() -> None:
     assert "TCMP                             : 1" in output
     assert "Values provided by the class: MediaFile" in output
     assert "title            : full" in output
+
+
+def test_cli_usage_errors() -> None:
+    process = subprocess.run(("phrydy-debug",), capture_output=True, encoding="utf-8")
+    assert process.returncode == 2
+    assert "usage: phrydy-debug" in process.stderr
+
+    process = subprocess.run(
+        ("phrydy-debug", os.path.join("tests", "files")),
+        capture_output=True,
+        encoding="utf-8",
+    )
+    assert process.returncode == 2
+    assert "is a directory" in process.stderr
+
+
+def test_cli_json() -> None:
+    output = subprocess.check_output(
+        ("phrydy-debug", "--format", "json", os.path.join("tests", "files")),
+        encoding="utf-8",
+    )
+    records = [json.loads(line) for line in output.splitlines()]
+    assert len(records) == len(list(walk(os.path.join("tests", "files"))))
+    full = next(r for r in records if r["path"].endswith("full.mp3"))
+    assert full["title"] == "full"
+    assert full["date"] == "2001-01-01"
+
+
+def test_cli_csv_stdin() -> None:
+    paths = [
+        os.path.join("tests", "files", "full.mp3"),
+        os.path.join("tests", "files", "mb.flac"),
+    ]
+    output = subprocess.check_output(
+        ("phrydy-debug", "-f", "csv", "-w", "1", "-"),
+        input="\n".join(paths) + "\n",
+        encoding="utf-8",
+    )
+    rows = list(csv.DictReader(io.StringIO(output)))
+    assert [row["path"] for row in rows] == paths
+    assert rows[0]["title"] == "full"
+    assert rows[1]["format"] == "FLAC"
@@ -0,0 +1,75 @@
+import io
+import json
+
+import pytest
+
+import phrydy
+from phrydy.mediafile import MediaField, MP3StorageStyle
+from phrydy.profiling import ProfileStats, profile
+from tests import helper
+from tests.test_mediafile_extended import copy_to_tmp
+
+
+class TestProfile:
+    def test_import(self) -> None:
+        assert phrydy.profile is profile
+
+    def test_get(self) -> None:
+        with profile() as stats:
+            media_file = helper.get_mediafile_extended("full.mp3")
+            assert media_file.title == "full"
+            assert media_file.barcode is None
+        title = stats.fields[("title", "MP3", "__get__")]
+        assert (title.calls, title.hits, title.misses) == (1, 1, 0)
+        assert title.seconds > 0
+        barcode = stats.fields[("barcode", "MP3", "__get__")]
+        assert (barcode.calls, barcode.hits, barcode.misses) == (1, 0, 1)
+        style = stats.styles[("title", "MP3", "MP3StorageStyle('TIT2')", "fetch")]
+        assert (style.calls, style.hits) == (1, 1)
+
+    def test_super_calls_counted_once(self) -> None:
+        with profile() as stats:
+            helper.get_mediafile_extended("full.mp3").year
+        assert stats.fields[("year", "MP3", "__get__")].calls == 1
+        assert stats.fields[("date", "MP3", "__get__")].calls == 1
+
+    def test_set_and_delete(self) -> None:
+        media_file = phrydy.MediaFileExtended(copy_to_tmp("full.mp3"))
+        with profile() as stats:
+            media_file.title = "new"
+            del media_file.album
+        assert stats.fields[("title", "MP3", "__set__")].calls == 1
+        assert stats.fields[("album", "MP3", "__delete__")].calls == 1
+        assert stats.styles[("title", "MP3", "MP3StorageStyle('TIT2')", "store")]
+
+    def test_uninstalled(self) -> None:
+        get = MediaField.__dict__["__get__"]
+        fetch = MP3StorageStyle.__dict__["fetch"]
+        with profile():
+            assert MediaField.__dict__["__get__"] is not get
+            with pytest.raises(RuntimeError):
+                with profile():
+                    pass
+        assert MediaField.__dict__["__get__"] is get
+        assert MP3StorageStyle.__dict__["fetch"] is fetch
+
+    def test_dump(self) -> None:
+        with profile() as stats:
+            helper.get_mediafile_extended("mb.flac").as_dict()
+        output = io.StringIO()
+        stats.dump(output, limit=3)
+        lines = output.getvalue().splitlines()
+        assert lines[0].split() == [
+            "seconds",
+            "calls",
+            "hits",
+            "misses",
+            "field",
+            "format",
+            "operation",
+        ]
+        assert len(lines) == 10
+        assert json.dumps(stats.as_dict())
+
+    def test_empty(self) -> None:
+        assert ProfileStats().as_dict() == {"fields": [], "styles": []}
@@ -0,0 +1,124 @@
+import datetime
+import os
+import shutil
+import tempfile
+from typing import List
+
+import pytest
+
+from phrydy.index import LibraryIndex
+from phrydy.query import (
+    Predicate,
+    between,
+    equal,
+    field_expression,
+    greater,
+    is_null,
+    less,
+    less_equal,
+    not_null,
+    prefix,
+)
+from tests import helper
+
+MB_ALBUMID = "c1350da9-326c-48da-95b8-bca5dd0262d4"
+
+
+def make_index() -> LibraryIndex:
+    """Index the twelve audio files at the top of the test files."""
+    directory = tempfile.mkdtemp()
+    for name in os.listdir(helper.TEST_RESOURCES_PATH):
+        path = os.path.join(helper.TEST_RESOURCES_PATH, name)
+        if os.path.isfile(path):
+            shutil.copyfile(path, os.path.join(directory, name))
+    index = LibraryIndex(os.path.join(tempfile.mkdtemp(), "index.sqlite"))
+    index.refresh(directory, workers=1)
+    return index
+
+
+def names(index: LibraryIndex, predicate: Predicate, **kwargs: object) -> List[str]:
+    return [
+        os.path.basename(path)
+        for path, _ in index.query(predicate, **kwargs)  # type: ignore
+    ]
+
+
+class TestQuery:
+    def test_equal(self) -> None:
+        with make_index() as index:
+            assert len(names(index, equal("mb_albumid", MB_ALBUMID))) == 10
+            assert names(index, equal("format", "FLAC")) == ["mb.flac"]
+            assert names(index, equal("comp", True)) == ["full.mp3"]
+            assert names(index, equal("date", datetime.date(2001, 1, 1))) == [
+                "full.mp3"
+            ]
+
+    def test_range(self) -> None:
+        with make_index() as index:
+            assert names(index, less("year", 2000)) == names(index, equal("year", 1996))
+            assert names(index, greater("year", 2000)) == ["full.mp3"]
+            assert names(index, between("year", 2001, 2001)) == ["full.mp3"]
+            assert names(index, less_equal("original_year", 1996)) == [
+                "mb.mp3",
+                "mb.wma",
+            ]
+
+    def test_combined(self) -> None:
+        with make_index() as index:
+            predicate = less("original_year", 1970) | equal("format", "FLAC")
+            assert names(index, predicate) == ["mb.flac"]
+            predicate = equal("original_year", 1996) & equal("format", "MP3")
+            assert names(index, predicate) == ["mb.mp3"]
+            assert index.count(~equal("format", "MP3")) == 10
+
+    def test_prefix(self) -> None:
+        with make_index() as index:
+            assert index.count(prefix("title", "Estampes")) == 11
+            assert index.count(prefix("title", "estampes")) == 0
+            assert names(index, prefix("format", "Windows")) == ["mb.wma"]
+            assert index.count(prefix("title", "")) == 12
+
+    def test_null(self) -> None:
+        with make_index() as index:
+            assert names(index, is_null("mb_albumid")) == ["mb.aiff"]
+            assert index.count(not_null("mb_albumid")) == 11
+            assert index.count(is_null("original_year")) == 10
+            # A missing value matches the negation of a condition.
+            assert index.count(~equal("original_year", 1996)) == 10
+
+    def test_list_field(self) -> None:
+        with make_index() as index:
+            assert names(index, equal("genres", "the genre")) == ["full.mp3"]
+            assert index.count(prefix("genres", "Class")) == 10
+            assert names(index, is_null("genres")) == ["mb.wma"]
+
+    def test_order_and_paging(self) -> None:
+        with make_index() as index:
+            ordered = names(index, not_null("title"), order_by=["-year", "format"])
+            assert ordered[0] == "full.mp3"
+            assert ordered[1:4] == ["mb.m4a", "mb.aiff", "mb.alac.m4a"]
+            pages = [
+                names(index, not_null("title"), order_by="-year", limit=5, offset=o)
+                for o in (0, 5, 10)
+            ]
+            assert [len(page) for page in pages] == [5, 5, 2]
+            assert sum(pages, []) == names(index, not_null("title"), order_by="-year")
+            assert len(list(index.query(offset=10))) == 2
+
+    def test_unknown_field(self) -> None:
+        with pytest.raises(ValueError):
+            equal("unknown", 1)
+        with make_index() as index:
+            with pytest.raises(ValueError):
+                list(index.query(order_by="unknown"))
+
+    def test_secondary_index(self) -> None:
+        with make_index() as index:
+            for field in ("mb_albumid", "albumartist", "mb_workid"):
+                predicate = equal(field, "x")
+                plan = index.connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT path FROM files WHERE " + predicate.sql,
+                    predicate.parameters,
+                ).fetchall()
+                assert "files_" + field in str(plan)
+            assert field_expression("title") == "json_extract(record, '$.title')"
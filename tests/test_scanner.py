@@ -0,0 +1,86 @@
+import os
+import tempfile
+from typing import Any, List
+
+import pytest
+
+import phrydy
+from phrydy import scanner
+from phrydy.mediafile import FileTypeError
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.scanner import ScanResult, scan, walk
+from tests import helper
+
+
+def test_walk() -> None:
+    paths = list(walk(helper.TEST_RESOURCES_PATH, extensions=[".MP3"]))
+    assert len(paths) == 6
+    assert paths[0].endswith("full.mp3")
+    assert paths[-1].endswith(os.path.join("real-world", "no_meta.mp3"))
+
+
+def test_walk_file() -> None:
+    path = os.path.join(helper.TEST_RESOURCES_PATH, "mb.flac")
+    assert list(walk(path)) == [path]
+    assert list(walk([path], extensions=[".mp3"])) == []
+
+
+class TestScan:
+    def test_import(self) -> None:
+        assert phrydy.scan is scan
+
+    def test_parallel(self) -> None:
+        results = list(scan(helper.TEST_RESOURCES_PATH, workers=2))
+        assert len(results) == len(list(walk(helper.TEST_RESOURCES_PATH)))
+        for result in results:
+            assert isinstance(result, ScanResult)
+            assert result.error is None
+            assert result.record
+        records = {os.path.basename(r.path): r.record for r in results}
+        assert records["full.mp3"]["title"] == "full"
+        assert records["mb.flac"]["format"] == "FLAC"
+        assert "art" not in records["full.mp3"]
+
+    def test_serial(self) -> None:
+        path = os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3")
+        (result,) = scan(path, workers=1, fields=["title", "art"])
+        assert result.record == {"title": "full", "art": None}
+
+    def test_errors(self) -> None:
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, "cover.txt"), "w") as f:
+            f.write("no audio")
+        for workers in (1, 2):
+            (result,) = scan(directory, workers=workers)
+            assert result.record is None
+            assert isinstance(result.error, FileTypeError)
+            assert "not in a recognized format" in str(result.error)
+
+    def test_any_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(self: MediaFileExtended) -> None:
+            raise ValueError("malformed tag")
+
+        monkeypatch.setattr(MediaFileExtended, "title", property(fail), raising=False)
+        paths = [
+            os.path.join(helper.TEST_RESOURCES_PATH, name)
+            for name in ("full.mp3", "mb.flac")
+        ]
+        results = list(scan(paths, workers=1, fields=["title"]))
+        assert len(results) == 2
+        for result in results:
+            assert result.record is None
+            assert isinstance(result.error, ValueError)
+            assert str(result.error) == "malformed tag"
+
+    def test_images_are_not_loaded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        load_images: List[bool] = []
+
+        def open_file(path: str, **kwargs: Any) -> MediaFileExtended:
+            load_images.append(kwargs["load_images"])
+            return MediaFileExtended(path, **kwargs)
+
+        monkeypatch.setattr(scanner, "MediaFileExtended", open_file)
+        path = os.path.join(helper.TEST_RESOURCES_PATH, "full.mp3")
+        list(scan(path, workers=1, fields=["title"]))
+        list(scan(path, workers=1, fields=["title", "art"]))
+        assert load_images == [False, True]
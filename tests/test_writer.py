@@ -0,0 +1,147 @@
+import os
+import stat
+from typing import Any, List
+
+import pytest
+
+import phrydy
+from phrydy import writer
+from phrydy.mediafile import FileTypeError, Image, ImageType
+from phrydy.mediafile_extended import MediaFileExtended
+from phrydy.writer import WriteResult, write_atomic, write_many
+from tests import helper
+from tests.test_mediafile_extended import copy_to_tmp
+
+
+def test_import() -> None:
+    assert phrydy.write_many is write_many
+
+
+class TestWriteAtomic:
+    def test_write(self) -> None:
+        path = copy_to_tmp("mb.flac")
+        os.chmod(path, 0o640)
+        inode = os.stat(path).st_ino
+        changed = write_atomic(path, {"title": "new", "track": 7})
+        assert changed == ["title", "track"]
+        media_file = MediaFileExtended(path)
+        assert media_file.title == "new"
+        assert media_file.track == 7
+        # The file has been replaced, not written in place.
+        assert os.stat(path).st_ino != inode
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        assert os.listdir(os.path.dirname(path)) == ["mb.flac"]
+
+    def test_unchanged(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        inode = os.stat(path).st_ino
+        assert write_atomic(path, {"title": "full"}) == []
+        assert os.stat(path).st_ino == inode
+
+    def test_symlink(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        link = path + ".link.mp3"
+        os.symlink(path, link)
+        write_atomic(link, {"title": "linked"})
+        assert os.path.islink(link)
+        assert MediaFileExtended(path).title == "linked"
+
+    def test_failure_keeps_original(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = copy_to_tmp("mb.flac")
+        with open(path, "rb") as f:
+            original = f.read()
+
+        def fail(*args: Any) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            write_atomic(path, {"title": "new"})
+        with open(path, "rb") as f:
+            assert f.read() == original
+        assert os.listdir(os.path.dirname(path)) == ["mb.flac"]
+
+    def test_images(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        load_images: List[bool] = []
+
+        def open_file(path: str, **kwargs: Any) -> MediaFileExtended:
+            load_images.append(kwargs.get("load_images", True))
+            return MediaFileExtended(path, **kwargs)
+
+        monkeypatch.setattr(writer, "MediaFileExtended", open_file)
+        path = helper.copy_with_image("mb.flac")
+        assert write_atomic(path, {"title": "new"}) == ["title"]
+        assert load_images == [False, True]
+        assert MediaFileExtended(path).art == helper.PNG_DATA
+        image = Image(helper.PNG_DATA, desc="back", type=ImageType.back)
+        assert write_atomic(path, {"images": [image]}) == ["images"]
+        assert write_atomic(path, {"images": [image]}) == []
+        assert MediaFileExtended(path).images == [image]
+
+    def test_metadata_is_kept(self) -> None:
+        path = copy_to_tmp("mb.flac")
+        try:
+            os.setxattr(path, "user.phrydy", b"kept")
+        except (AttributeError, OSError):
+            pytest.skip("No extended attributes on this file system.")
+        if os.geteuid() == 0:
+            os.chown(path, 1234, 5678)
+        before = os.stat(path)
+        write_atomic(path, {"title": "new"})
+        after = os.stat(path)
+        assert os.getxattr(path, "user.phrydy") == b"kept"
+        assert (after.st_uid, after.st_gid) == (before.st_uid, before.st_gid)
+
+
+class TestWriteMany:
+    def test_parallel(self) -> None:
+        paths = [copy_to_tmp(name) for name in ("mb.flac", "mb.mp3", "mb.m4a")]
+        results = list(
+            write_many(((path, {"album": "batch"}) for path in paths), workers=2)
+        )
+        assert sorted(result.path for result in results) == sorted(paths)
+        for result in results:
+            assert isinstance(result, WriteResult)
+            assert result.error is None
+            assert result.changed == ["album"]
+            assert MediaFileExtended(result.path).album == "batch"
+
+    def test_errors(self) -> None:
+        path = copy_to_tmp("full.mp3")
+        not_audio = os.path.join(os.path.dirname(path), "cover.txt")
+        with open(not_audio, "w") as f:
+            f.write("no audio")
+        missing = os.path.join(os.path.dirname(path), "missing.mp3")
+        for workers in (1, 2):
+            results = {
+                result.path: result
+                for result in write_many(
+                    [
+                        (not_audio, {"title": "x"}),
+                        (missing, {"title": "x"}),
+                        (path, {"title": "written"}),
+                    ],
+                    workers=workers,
+                )
+            }
+            assert isinstance(results[not_audio].error, FileTypeError)
+            assert results[not_audio].changed is None
+            assert results[missing].error is not None
+            assert results[path].error is None
+        assert MediaFileExtended(path).title == "written"
+
+    def test_invalid_value(self) -> None:
+        invalid = copy_to_tmp("mb.flac")
+        path = copy_to_tmp("full.mp3")
+        for workers in (1, 2):
+            results = {
+                result.path: result
+                for result in write_many(
+                    [(invalid, {"year": "nineteen"}), (path, {"title": "written"})],
+                    workers=workers,
+                )
+            }
+            assert isinstance(results[invalid].error, ValueError)
+            assert results[invalid].changed is None
+            assert results[path].error is None
+        assert MediaFileExtended(invalid).year == 1996